@@ -6,7 +6,7 @@ import sys
 from logging.config import fileConfig
 from pathlib import Path
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import create_engine, pool
 
 # Import teaching models so Alembic detects them for autogenerate
 import app.features.teaching.models  # noqa: F401
@@ -48,10 +48,13 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
+    """Run migrations in 'online' mode.
+
+    Migrations are a one-off process, so NullPool is used here; the
+    application runtime engine in app.db keeps its own connection pool.
+    """
+    connectable = create_engine(
+        db_url or config.get_main_option("sqlalchemy.url", ""),
         poolclass=pool.NullPool,
         future=True,  # SQLAlchemy 2.0 style
     )
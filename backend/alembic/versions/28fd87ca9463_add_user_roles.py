@@ -12,7 +12,6 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy import text
 
-
 # revision identifiers, used by Alembic.
 revision: str = "28fd87ca9463"
 down_revision: Union[str, None] = "8a6bfd7b4ce9"
@@ -46,18 +45,15 @@ def upgrade() -> None:
         ),
     ]
 
-    # Insert roles if they don't already exist
-    for role_name, description in roles:
-        # Check if role exists
-        result = conn.execute(
-            text("SELECT id FROM roles WHERE name = :name"),
-            {"name": role_name},
-        )
-        if not result.fetchone():
-            conn.execute(
-                text("INSERT INTO roles (name) VALUES (:name)"),
-                {"name": role_name},
-            )
+    # Insert roles if they don't already exist (single round-trip)
+    values = ", ".join(f"(:name{i})" for i in range(len(roles)))
+    conn.execute(
+        text(
+            f"INSERT INTO roles (name) VALUES {values} "
+            "ON CONFLICT (name) DO NOTHING"
+        ),
+        {f"name{i}": role_name for i, (role_name, _) in enumerate(roles)},
+    )
 
 
 def downgrade() -> None:
@@ -73,7 +69,6 @@ def downgrade() -> None:
         "Patient Advocate",
     ]
 
-    for role_name in roles:
-        conn.execute(
-            text("DELETE FROM roles WHERE name = :name"), {"name": role_name}
-        )
+    conn.execute(
+        text("DELETE FROM roles WHERE name = ANY(:names)"), {"names": roles}
+    )
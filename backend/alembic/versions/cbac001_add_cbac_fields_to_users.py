@@ -10,7 +10,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = "cbac001"
@@ -20,54 +19,31 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    """Add CBAC (Competency-Based Access Control) fields to users table."""
-    # Add base_profession column with default value "patient"
-    op.add_column(
-        "users",
-        sa.Column(
-            "base_profession",
-            sa.String(length=100),
-            nullable=False,
-            server_default="patient",
-        ),
-    )
-
-    # Add additional_competencies as JSON array
-    op.add_column(
-        "users",
-        sa.Column(
-            "additional_competencies",
-            postgresql.JSON(astext_type=sa.Text()),
-            nullable=False,
-            server_default="[]",
-        ),
-    )
-
-    # Add removed_competencies as JSON array
-    op.add_column(
-        "users",
-        sa.Column(
-            "removed_competencies",
-            postgresql.JSON(astext_type=sa.Text()),
-            nullable=False,
-            server_default="[]",
-        ),
-    )
-
-    # Add professional_registrations as JSON (nullable)
-    op.add_column(
-        "users",
-        sa.Column(
-            "professional_registrations",
-            postgresql.JSON(astext_type=sa.Text()),
-            nullable=True,
-        ),
+    """Add CBAC (Competency-Based Access Control) fields to users table.
+
+    All four columns are added in a single ALTER TABLE so the table lock
+    is taken once rather than per column.
+    """
+    op.execute(
+        sa.text(
+            "ALTER TABLE users"
+            " ADD COLUMN base_profession VARCHAR(100) NOT NULL"
+            " DEFAULT 'patient',"
+            " ADD COLUMN additional_competencies JSON NOT NULL DEFAULT '[]',"
+            " ADD COLUMN removed_competencies JSON NOT NULL DEFAULT '[]',"
+            " ADD COLUMN professional_registrations JSON"
+        )
     )
 
 
 def downgrade() -> None:
     """Remove CBAC fields from users table."""
-    op.drop_column("users", "professional_registrations")
-    op.drop_column("users", "removed_competencies")
-    op.drop_column("users", "additional_competencies")
-    op.drop_column("users", "base_profession")
+    op.execute(
+        sa.text(
+            "ALTER TABLE users"
+            " DROP COLUMN professional_registrations,"
+            " DROP COLUMN removed_competencies,"
+            " DROP COLUMN additional_competencies,"
+            " DROP COLUMN base_profession"
+        )
+    )
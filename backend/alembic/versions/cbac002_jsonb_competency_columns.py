@@ -0,0 +1,70 @@
+"""switch CBAC JSON columns to JSONB with GIN indexes
+
+Revision ID: cbac002
+Revises: 2e24f1879e51
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "cbac002"
+down_revision: Union[str, None] = "2e24f1879e51"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store CBAC columns as JSONB and index the competency arrays."""
+    op.execute(
+        sa.text(
+            "ALTER TABLE users"
+            " ALTER COLUMN additional_competencies DROP DEFAULT,"
+            " ALTER COLUMN additional_competencies TYPE JSONB"
+            " USING additional_competencies::jsonb,"
+            " ALTER COLUMN additional_competencies SET DEFAULT '[]',"
+            " ALTER COLUMN removed_competencies DROP DEFAULT,"
+            " ALTER COLUMN removed_competencies TYPE JSONB"
+            " USING removed_competencies::jsonb,"
+            " ALTER COLUMN removed_competencies SET DEFAULT '[]',"
+            " ALTER COLUMN professional_registrations TYPE JSONB"
+            " USING professional_registrations::jsonb"
+        )
+    )
+    op.create_index(
+        "ix_users_additional_competencies",
+        "users",
+        ["additional_competencies"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_users_removed_competencies",
+        "users",
+        ["removed_competencies"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Revert CBAC columns to JSON and drop the GIN indexes."""
+    op.drop_index("ix_users_removed_competencies", table_name="users")
+    op.drop_index("ix_users_additional_competencies", table_name="users")
+    op.execute(
+        sa.text(
+            "ALTER TABLE users"
+            " ALTER COLUMN additional_competencies DROP DEFAULT,"
+            " ALTER COLUMN additional_competencies TYPE JSON"
+            " USING additional_competencies::json,"
+            " ALTER COLUMN additional_competencies SET DEFAULT '[]',"
+            " ALTER COLUMN removed_competencies DROP DEFAULT,"
+            " ALTER COLUMN removed_competencies TYPE JSON"
+            " USING removed_competencies::json,"
+            " ALTER COLUMN removed_competencies SET DEFAULT '[]',"
+            " ALTER COLUMN professional_registrations TYPE JSON"
+            " USING professional_registrations::json"
+        )
+    )
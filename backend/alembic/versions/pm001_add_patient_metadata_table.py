@@ -36,8 +36,9 @@ def upgrade() -> None:
         sa.Column("patient_id", sa.String(length=255), nullable=False),
         sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
         sa.PrimaryKeyConstraint("id"),
-        sa.UniqueConstraint("patient_id"),
     )
+    # The unique index enforces uniqueness; a separate UNIQUE constraint
+    # would build a second, redundant index on the same column.
     op.create_index(
         op.f("ix_patient_metadata_patient_id"),
         "patient_metadata",
@@ -0,0 +1,36 @@
+"""drop redundant unique constraint on patient_metadata.patient_id
+
+Revision ID: pm002
+Revises: cbac002
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "pm002"
+down_revision: Union[str, None] = "cbac002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop the UNIQUE constraint duplicated by ix_patient_metadata_patient_id.
+
+    Databases created before pm001 was corrected carry both the constraint
+    and the unique index, so every insert maintains two identical indexes.
+    """
+    op.execute(
+        sa.text(
+            "ALTER TABLE patient_metadata"
+            " DROP CONSTRAINT IF EXISTS patient_metadata_patient_id_key"
+        )
+    )
+
+
+def downgrade() -> None:
+    """No-op: uniqueness is still enforced by the unique index."""
@@ -13,8 +13,8 @@ from app.cbac.base_professions import (
     resolve_user_competencies,
 )
 from app.cbac.competencies import (
+    COMPETENCY_ID_SET,
     COMPETENCY_IDS,
-    ClinicalCompetency,
     CompetencyId,
     get_competency_details,
     get_competency_risk_level,
@@ -23,11 +23,11 @@ from app.cbac.competencies import (
 
 __all__ = [
     "CompetencyId",
-    "ClinicalCompetency",
     "get_competency_details",
     "is_valid_competency",
     "get_competency_risk_level",
     "COMPETENCY_IDS",
+    "COMPETENCY_ID_SET",
     "BaseProfessionId",
     "get_profession_details",
     "get_profession_base_competencies",
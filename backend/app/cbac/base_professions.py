@@ -6,10 +6,12 @@ competency sets, which can be customised per-user.
 """
 
 from pathlib import Path
-from typing import Literal
+from typing import Any, NewType
 
 import yaml
 
+from app.cbac.competencies import COMPETENCY_ID_SET
+
 # Load base professions from YAML
 BASE_PROFESSIONS_YAML_PATH = (
     Path(__file__).parent.parent.parent.parent
@@ -17,24 +19,70 @@ BASE_PROFESSIONS_YAML_PATH = (
     / "base-professions.yaml"
 )
 
+# Prefer the libyaml C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 with open(BASE_PROFESSIONS_YAML_PATH) as f:
-    BASE_PROFESSIONS_DATA = yaml.safe_load(f)
+    BASE_PROFESSIONS_DATA = yaml.load(f, Loader=_YamlLoader)  # nosec B506
+
+
+def _build_base_competencies(data: Any) -> dict[str, frozenset[str]]:
+    """Validate the base professions YAML shape and build competency sets.
+
+    Runs once at import so a malformed file fails at startup rather than
+    on the first protected request. The resulting frozen sets make
+    competency resolution pure set algebra.
+
+    Raises:
+        ValueError: If the top-level list is missing, an entry has no ID,
+            an ID is duplicated, or a base competency is unknown.
+    """
+    entries = data.get("base_professions") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError(
+            f"{BASE_PROFESSIONS_YAML_PATH}: expected a 'base_professions' list"
+        )
+    result: dict[str, frozenset[str]] = {}
+    for entry in entries:
+        profession_id = entry.get("id") if isinstance(entry, dict) else None
+        if not isinstance(profession_id, str) or not profession_id:
+            raise ValueError(
+                f"{BASE_PROFESSIONS_YAML_PATH}: profession without an 'id'"
+            )
+        if profession_id in result:
+            raise ValueError(
+                f"{BASE_PROFESSIONS_YAML_PATH}: duplicate profession "
+                f"'{profession_id}'"
+            )
+        base = frozenset(entry.get("base_competencies") or ())
+        unknown = base - COMPETENCY_ID_SET
+        if unknown:
+            raise ValueError(
+                f"{BASE_PROFESSIONS_YAML_PATH}: profession '{profession_id}' "
+                f"has unknown competencies {sorted(unknown)}"
+            )
+        result[profession_id] = base
+    return result
+
+
+# Pre-built base competency sets so resolution is pure set algebra
+_BASE_COMPETENCIES_BY_ID = _build_base_competencies(BASE_PROFESSIONS_DATA)
 
 # Extract profession IDs
-PROFESSION_IDS = tuple(
-    p["id"] for p in BASE_PROFESSIONS_DATA["base_professions"]
-)
+PROFESSION_IDS = tuple(_BASE_COMPETENCIES_BY_ID)
 
-# Create Literal type
-BaseProfessionId = Literal[PROFESSION_IDS]  # type: ignore[valid-type]
+# Index professions by ID for O(1) lookups on the authorisation hot path
+_PROFESSION_BY_ID: dict[str, dict[str, Any]] = {
+    p["id"]: p for p in BASE_PROFESSIONS_DATA["base_professions"]
+}
+
+# Nominal type for type hints; membership is checked against PROFESSION_IDS
+BaseProfessionId = NewType("BaseProfessionId", str)
 
 
 def get_profession_details(profession_id: str) -> dict | None:
     """Get full details of a base profession by ID."""
-    for profession in BASE_PROFESSIONS_DATA["base_professions"]:
-        if profession["id"] == profession_id:
-            return profession
-    return None
+    return _PROFESSION_BY_ID.get(profession_id)
 
 
 def get_profession_base_competencies(profession_id: str) -> list[str]:
@@ -47,7 +95,7 @@ def resolve_user_competencies(
     base_profession: str,
     additional_competencies: list[str] | None = None,
     removed_competencies: list[str] | None = None,
-) -> list[str]:
+) -> frozenset[str]:
     """Resolve final competencies for a user.
 
     Args:
@@ -56,11 +104,9 @@ def resolve_user_competencies(
         removed_competencies: Competencies removed from this user
 
     Returns:
-        List of final competency IDs for this user
+        Frozen set of final competency IDs for this user
     """
-    base = set(get_profession_base_competencies(base_profession))
-    additional = set(additional_competencies or [])
-    removed = set(removed_competencies or [])
-
-    final = (base | additional) - removed
-    return list(final)
+    base = _BASE_COMPETENCIES_BY_ID.get(base_profession, frozenset())
+    return (base | frozenset(additional_competencies or ())) - frozenset(
+        removed_competencies or ()
+    )
@@ -5,9 +5,9 @@ This module loads and validates competency definitions from the shared/competenc
 file, providing type-safe access to competency IDs and metadata.
 """
 
-from enum import Enum
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Any, NewType
 
 import yaml
 
@@ -16,36 +16,90 @@ COMPETENCIES_YAML_PATH = (
     Path(__file__).parent.parent.parent.parent / "shared" / "competencies.yaml"
 )
 
+# Prefer the libyaml C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 with open(COMPETENCIES_YAML_PATH) as f:
-    COMPETENCIES_DATA = yaml.safe_load(f)
+    COMPETENCIES_DATA = yaml.load(f, Loader=_YamlLoader)  # nosec B506
+
+RISK_LEVELS = ("low", "medium", "high")
+
+
+@dataclass(frozen=True, slots=True)
+class CompetencyRecord:
+    """Validated fields of a competency read on the authorisation path."""
+
+    id: str
+    risk_level: str
+
+
+def _build_competency_records(data: Any) -> dict[str, CompetencyRecord]:
+    """Validate the competencies YAML shape and build typed records.
+
+    Runs once at import so a malformed file fails at startup rather than
+    on the first protected request.
+
+    Raises:
+        ValueError: If the top-level list is missing, an entry has no ID,
+            an ID is duplicated, or a risk level is unknown.
+    """
+    entries = data.get("competencies") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError(
+            f"{COMPETENCIES_YAML_PATH}: expected a 'competencies' list"
+        )
+    records: dict[str, CompetencyRecord] = {}
+    for entry in entries:
+        competency_id = entry.get("id") if isinstance(entry, dict) else None
+        if not isinstance(competency_id, str) or not competency_id:
+            raise ValueError(
+                f"{COMPETENCIES_YAML_PATH}: competency without an 'id'"
+            )
+        if competency_id in records:
+            raise ValueError(
+                f"{COMPETENCIES_YAML_PATH}: duplicate competency "
+                f"'{competency_id}'"
+            )
+        risk_level = entry.get("risk_level", "low")
+        if risk_level not in RISK_LEVELS:
+            raise ValueError(
+                f"{COMPETENCIES_YAML_PATH}: competency '{competency_id}' "
+                f"has unknown risk_level '{risk_level}'"
+            )
+        records[competency_id] = CompetencyRecord(
+            id=competency_id, risk_level=risk_level
+        )
+    return records
+
+
+_COMPETENCY_RECORDS = _build_competency_records(COMPETENCIES_DATA)
 
 # Extract competency IDs
 COMPETENCY_IDS = tuple(c["id"] for c in COMPETENCIES_DATA["competencies"])
 
-# Create Literal type for type hints
-CompetencyId = Literal[COMPETENCY_IDS]  # type: ignore[valid-type]
+# Nominal type for type hints; membership is enforced by is_valid_competency
+CompetencyId = NewType("CompetencyId", str)
 
-# Create Enum for runtime validation (dynamically loaded from YAML)
-ClinicalCompetency = Enum(  # type: ignore[misc]
-    "ClinicalCompetency",
-    {c["id"].upper(): c["id"] for c in COMPETENCIES_DATA["competencies"]},
-)
+# Index competencies by ID for O(1) lookups on the authorisation hot path
+_COMPETENCY_BY_ID: dict[str, dict[str, Any]] = {
+    c["id"]: c for c in COMPETENCIES_DATA["competencies"]
+}
+
+# Frozen set of IDs for runtime validation
+COMPETENCY_ID_SET: frozenset[str] = frozenset(COMPETENCY_IDS)
 
 
 def get_competency_details(competency_id: str) -> dict | None:
     """Get full details of a competency by ID."""
-    for competency in COMPETENCIES_DATA["competencies"]:
-        if competency["id"] == competency_id:
-            return competency
-    return None
+    return _COMPETENCY_BY_ID.get(competency_id)
 
 
 def is_valid_competency(competency_id: str) -> bool:
     """Check if a competency ID is valid."""
-    return competency_id in COMPETENCY_IDS
+    return competency_id in COMPETENCY_ID_SET
 
 
 def get_competency_risk_level(competency_id: str) -> str:
     """Get risk level of a competency (low, medium, high)."""
-    details = get_competency_details(competency_id)
-    return details.get("risk_level", "low") if details else "low"
+    record = _COMPETENCY_RECORDS.get(competency_id)
+    return record.risk_level if record else "low"
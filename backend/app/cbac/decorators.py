@@ -9,13 +9,14 @@ from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
-from fastapi import HTTPException, Request
+from fastapi import HTTPException
 
 from app.cbac.competencies import get_competency_risk_level
+from app.deps import DEP_CURRENT_USER
 from app.models import User
 
 
-def has_competency(competency: str) -> Callable[[Request, User], User]:
+def has_competency(competency: str) -> Callable[[User], User]:
     """FastAPI dependency to check if current user has a competency.
 
     Creates a FastAPI dependency that verifies the authenticated user
@@ -26,7 +27,7 @@ def has_competency(competency: str) -> Callable[[Request, User], User]:
 
     Usage Example:
         from app.cbac.decorators import has_competency
-        from app.main import DEP_CURRENT_USER
+        from app.deps import DEP_CURRENT_USER
 
         @router.post("/prescriptions/controlled")
         async def prescribe(
@@ -44,17 +45,13 @@ def has_competency(competency: str) -> Callable[[Request, User], User]:
     Raises:
         HTTPException: 403 Forbidden if user lacks the competency
     """
-    from app.main import DEP_CURRENT_USER
+    # Resolve risk level once when the dependency is built, not per request
+    risk_level = get_competency_risk_level(competency)
 
-    def check_competency(
-        request: Request, user: User = DEP_CURRENT_USER
-    ) -> User:
+    def check_competency(user: User = DEP_CURRENT_USER) -> User:
         """Check if user has the required competency."""
-        final_competencies = user.get_final_competencies()
-
-        if competency not in final_competencies:
+        if competency not in user.get_final_competencies():
             # Log failed competency check (high-risk operations)
-            risk_level = get_competency_risk_level(competency)
             # TODO: Add audit logging here when audit system is implemented
             # audit_log(
             #     user_id=user.id,
@@ -68,7 +65,6 @@ def has_competency(competency: str) -> Callable[[Request, User], User]:
             )
 
         # Log successful competency check for high-risk operations
-        risk_level = get_competency_risk_level(competency)
         if risk_level == "high":
             # TODO: Add audit logging here when audit system is implemented
             # audit_log(
@@ -140,7 +136,7 @@ def requires_competency_decorator(competency: str) -> Callable:
 
 def requires_any_competency(
     *competencies: str,
-) -> Callable[[Request, User], User]:
+) -> Callable[[User], User]:
     """Require at least one of the specified competencies.
 
     Creates a FastAPI dependency that verifies the authenticated user
@@ -167,15 +163,11 @@ def requires_any_competency(
     Raises:
         HTTPException: 403 Forbidden if user lacks all specified competencies
     """
-    from app.main import DEP_CURRENT_USER
+    required = frozenset(competencies)
 
-    def check_any_competency(
-        request: Request, user: User = DEP_CURRENT_USER
-    ) -> User:
+    def check_any_competency(user: User = DEP_CURRENT_USER) -> User:
         """Check if user has any of the required competencies."""
-        final_competencies = user.get_final_competencies()
-
-        if not any(comp in final_competencies for comp in competencies):
+        if user.get_final_competencies().isdisjoint(required):
             # TODO: Audit logging
             raise HTTPException(
                 status_code=403,
@@ -12,6 +12,8 @@ The configuration is organized into sections:
 - VAPID keys for push notifications
 """
 
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING
 from urllib.parse import quote_plus
 
 from pydantic import (
@@ -117,6 +119,24 @@ class Settings(BaseSettings):
             "Use 'require' or 'verify-full' in production."
         ),
     )
+    CORE_DB_POOL_SIZE: int = Field(
+        10,
+        ge=1,
+        description="Persistent connections kept per core database engine",
+    )
+    CORE_DB_MAX_OVERFLOW: int = Field(
+        20,
+        ge=0,
+        description="Extra connections allowed above the pool size",
+    )
+    CORE_DB_POOL_RECYCLE: int = Field(
+        1800,
+        description=(
+            "Seconds before a pooled connection is replaced, so idle "
+            "sockets are not reused after server-side timeouts "
+            "(-1 disables)"
+        ),
+    )
 
     # --- FHIR Database ---
     FHIR_DB_NAME: str = Field("hapi", description="FHIR database name")
@@ -223,9 +243,9 @@ class Settings(BaseSettings):
             )
         return self
 
-    # --- Computed Database URLs ---
+    # --- Computed Database URLs (built once per Settings instance) ---
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def CORE_DATABASE_URL(self) -> str:
         """Core Database Connection URL.
 
@@ -246,7 +266,7 @@ class Settings(BaseSettings):
         )
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def FHIR_DATABASE_URL(self) -> str | None:
         """FHIR Database Connection URL.
 
@@ -266,7 +286,7 @@ class Settings(BaseSettings):
         )
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def EHRBASE_DATABASE_URL(self) -> str | None:
         """EHRbase Database Connection URL.
 
@@ -286,4 +306,25 @@ class Settings(BaseSettings):
         )
 
 
-settings = Settings(_env_file=".env")  # type: ignore[call-arg]
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, built on first use.
+
+    Importing this module no longer parses the environment; tools that
+    only need the ``Settings`` class (or never touch config) skip it.
+
+    Returns:
+        Settings: The cached settings instance.
+    """
+    return Settings(_env_file=".env")  # type: ignore[call-arg]
+
+
+if TYPE_CHECKING:
+    settings: Settings
+
+
+def __getattr__(name: str) -> Settings:
+    """Build ``settings`` lazily on first access (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,20 +7,36 @@ architecture:
 - ehrbase_client: EHRbase server API client (OpenEHR)
 """
 
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Engine
+
 from app.db.auth_db import (
     AuthBase,
     AuthSessionLocal,
-    auth_engine,
     get_auth_db,
+    get_auth_engine,
 )
 
 # Legacy aliases for existing code
-engine = auth_engine
 SessionLocal = AuthSessionLocal
 get_session = get_auth_db
 
+if TYPE_CHECKING:
+    auth_engine: Engine
+    engine: Engine
+
+
+def __getattr__(name: str) -> Engine:
+    """Resolve the engine attributes lazily (PEP 562)."""
+    if name in ("auth_engine", "engine"):
+        return get_auth_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "auth_engine",
+    "get_auth_engine",
     "AuthSessionLocal",
     "AuthBase",
     "get_auth_db",
@@ -5,30 +5,72 @@ core database (user accounts, roles, sessions).
 """
 
 from collections.abc import Generator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
-from app.config import settings
+from app.config import get_settings
+
+# psycopg connection options. JIT is off to avoid planning spikes on the
+# short OLTP queries this app issues, and each statement is prepared
+# server-side from its second execution on a connection so the
+# per-request auth lookups skip re-parsing.
+_CONNECT_ARGS: dict[str, Any] = {
+    "options": "-c jit=off",
+    "prepare_threshold": 1,
+}
+
+# SQLAlchemy's compiled-statement cache; sized above the default (500)
+# so every distinct query the app issues stays compiled.
+_QUERY_CACHE_SIZE = 1200
+
+
+# The engine is built on first use rather than at import, so processes that
+# never touch the database (CLI tools, Alembic subcommands, test
+# collection) skip Settings parsing and pool setup.
+@lru_cache(maxsize=1)
+def get_auth_engine() -> Engine:
+    """Return the core database engine, creating it on first use."""
+    s = get_settings()
+    return create_engine(
+        s.CORE_DATABASE_URL,
+        future=True,
+        pool_pre_ping=True,  # Verify connections before use
+        pool_size=s.CORE_DB_POOL_SIZE,
+        max_overflow=s.CORE_DB_MAX_OVERFLOW,
+        pool_recycle=s.CORE_DB_POOL_RECYCLE,
+        pool_use_lifo=True,  # Keep a warm set; let idle extras time out
+        query_cache_size=_QUERY_CACHE_SIZE,
+        connect_args=_CONNECT_ARGS,
+    )
 
-# Create core database engine
-auth_engine = create_engine(
-    settings.CORE_DATABASE_URL,
-    future=True,
-    pool_pre_ping=True,  # Verify connections before use
-    pool_size=5,
-    max_overflow=10,
-)
 
-# Create session factory
-AuthSessionLocal = sessionmaker(
-    bind=auth_engine,
+# The session factory is unbound; the engine is supplied per session.
+_auth_session_factory = sessionmaker(
     autoflush=False,
     autocommit=False,
     future=True,
 )
 
 
+def AuthSessionLocal() -> Session:
+    """Open a core database session bound to the lazily built engine."""
+    return _auth_session_factory(bind=get_auth_engine())
+
+
+if TYPE_CHECKING:
+    auth_engine: Engine
+
+
+def __getattr__(name: str) -> Engine:
+    """Expose the engine as a module attribute lazily (PEP 562)."""
+    if name == "auth_engine":
+        return get_auth_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class AuthBase(DeclarativeBase):
     """Base class for auth database models."""
 
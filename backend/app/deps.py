@@ -4,39 +4,112 @@ Extracted from main.py to allow reuse in sub-routers (push, push_send)
 without circular imports.
 """
 
+import hashlib
+import threading
+import time
+from typing import Any
+
 from fastapi import Depends, HTTPException, Request
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
-from app.db import get_session
+from app.db import SessionLocal, get_session
 from app.log_context import user_id_var
 from app.models import User
 from app.security import decode_token
 
 DEP_GET_SESSION = Depends(get_session)
 
+# The user-by-username lookup runs on every authenticated request. Built
+# once, it skips rebuilding the Select and recomputing its cache key (which
+# SQLAlchemy memoises on the statement object) each time it executes.
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
+# Verified access-token payloads, keyed on a digest of the token. Entries
+# are dropped once the token's own exp has passed, so caching never extends
+# a token's life. The user row is still loaded per request: handlers write
+# through it, and is_active / token_version must take effect at once.
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: dict[bytes, dict[str, Any]] = {}
+# current_user runs on threadpool workers; writers take the lock so
+# eviction never iterates the dict while another thread resizes it.
+_token_cache_lock = threading.Lock()
+
+
+def _verified_payload(tok: str) -> dict[str, Any]:
+    """Decode a token, reusing an earlier verification while unexpired."""
+    key = hashlib.blake2b(tok.encode(), digest_size=16).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        _token_cache.pop(key, None)
+    payload = decode_token(tok)
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.pop(next(iter(_token_cache)), None)
+        _token_cache[key] = payload
+    return payload
+
+
+def warm_user_lookup(connections: int) -> None:
+    """Fill the connection pool and compile the per-request user lookup.
+
+    Called once at startup, so the first authenticated requests neither
+    open database connections nor miss SQLAlchemy's compiled-statement
+    cache for the query current_user runs on every request.
+
+    Args:
+        connections: Number of pooled connections to open.
+    """
+    sessions = [SessionLocal() for _ in range(connections)]
+    try:
+        for db in sessions:
+            db.scalar(USER_BY_USERNAME, {"username": ""})
+    finally:
+        for db in sessions:
+            db.close()
+
 
 def current_user(request: Request, db: Session = DEP_GET_SESSION) -> User:
-    """Extract and validate the authenticated user from JWT cookie.
+    """Get Currently Authenticated User.
+
+    FastAPI dependency that extracts and validates the JWT access token from
+    cookies, then loads the corresponding user from the database. The user's
+    role names are stored in request.state as a frozenset for authorization
+    checks.
+
+    Token Validation:
+    - Checks for access_token cookie presence
+    - Verifies JWT signature and expiration
+    - Loads user from database by username
+    - Verifies user account is active
+
+    Args:
+        request: Incoming FastAPI request with cookies.
+        db: Active SQLAlchemy database session.
+
+    Returns:
+        User: The authenticated and active user with roles loaded.
 
     Raises:
-        HTTPException: 401 if not authenticated, token invalid, or user
-            inactive.
+        HTTPException: 401 if token missing, invalid, expired, or user inactive.
     """
     tok = request.cookies.get("access_token")
     if not tok:
         raise HTTPException(401, "Not authenticated")
     try:
-        payload = decode_token(tok)
+        payload = _verified_payload(tok)
     except Exception as e:
         raise HTTPException(401, "Invalid token") from e
     sub = payload.get("sub")
-    user = db.scalar(select(User).where(User.username == sub))
+    user = db.scalar(USER_BY_USERNAME, {"username": sub})
     if not user or not user.is_active:
         raise HTTPException(401, "Inactive user")
+    # Reject tokens minted before a password change
     if payload.get("tv", 0) != user.token_version:
         raise HTTPException(401, "Session invalidated")
-    request.state.roles = [r.name for r in user.roles]
+    request.state.roles = frozenset(r.name for r in user.roles)
     user_id_var.set(str(user.id))
     return user
 
@@ -3,16 +3,29 @@
 # cspell:words formedness
 import base64
 import logging
+import threading
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 from xml.etree.ElementTree import ParseError
 from xml.etree.ElementTree import fromstring as xml_fromstring
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
-from app.config import settings
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Shared session so EHRbase calls reuse pooled keep-alive connections
+# instead of paying a TCP handshake and DNS lookup per request.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 class EhrAlreadyExistsError(Exception):
     """Raised when attempting to create an EHR that already exists."""
@@ -28,48 +41,84 @@ class EhrbaseClientError(Exception):
     """
 
 
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body with orjson.
+
+    Decode failures are re-raised as ``requests.JSONDecodeError`` so they
+    are handled like ``response.json()`` errors by the callers.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:
+        raise requests.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
+
+# REST paths relative to the EHRbase openEHR API root.
+_EHR_PATH = "/ehr"
+_COMPOSITIONS_PATH = "/ehr/{ehr_id}/composition"
+_COMPOSITION_PATH = "/ehr/{ehr_id}/composition/{composition_uid}"
+_AQL_PATH = "/query/aql"
+_TEMPLATE_PATH = "/definition/template/adl1.4"
+
+
+@lru_cache(maxsize=1)
+def _api_base() -> str:
+    """Return the openEHR REST API root, joined once per process."""
+    return get_settings().EHRBASE_URL.rstrip("/") + "/rest/openehr/v1"
+
+
 def _require_clinical_services() -> None:
     """Raise RuntimeError if clinical services are disabled."""
-    if not settings.CLINICAL_SERVICES_ENABLED:
+    if not get_settings().CLINICAL_SERVICES_ENABLED:
         raise RuntimeError("Clinical services are disabled in this deployment")
 
 
+@lru_cache(maxsize=1)
+def _auth_header_value() -> str:
+    """Build the Basic Auth value once; credentials are fixed per process."""
+    s = get_settings()
+    password = s.EHRBASE_API_PASSWORD.get_secret_value()
+    credentials = f"{s.EHRBASE_API_USER}:{password}"
+    return "Basic " + base64.b64encode(credentials.encode()).decode()
+
+
 def get_auth_header() -> dict[str, str]:
     """Get Basic Auth header for EHRbase."""
     _require_clinical_services()
-    credentials = f"{settings.EHRBASE_API_USER}:{settings.EHRBASE_API_PASSWORD.get_secret_value()}"
-    encoded = base64.b64encode(credentials.encode()).decode()
-    return {"Authorization": f"Basic {encoded}"}
+    return {"Authorization": _auth_header_value()}
 
 
-def create_ehr(
-    subject_id: str, subject_namespace: str = "fhir"
-) -> dict[str, Any]:
-    """
-    Create a new EHR in EHRbase.
+_JSON = "application/json"
+_XML = "application/xml"
 
-    Args:
-        subject_id: The FHIR Patient ID
-        subject_namespace: The namespace (default: 'fhir')
 
-    Returns:
-        EHR response containing ehr_id
+@lru_cache(maxsize=8)
+def _cached_headers(
+    content_type: str | None = None, prefer: str | None = None
+) -> dict[str, str]:
+    """Build the header dict for one request shape, once per process.
 
-    Raises:
-        ValueError: If subject_id is empty or invalid
+    The returned dict is shared between calls and must not be mutated.
     """
-    # Defensive programming: validate inputs
-    if not subject_id or not subject_id.strip():
-        raise ValueError("subject_id cannot be empty")
-    if not subject_namespace or not subject_namespace.strip():
-        raise ValueError("subject_namespace cannot be empty")
-    url = f"{settings.EHRBASE_URL}/rest/openehr/v1/ehr"
-    headers = {
-        **get_auth_header(),
-        "Content-Type": "application/json",
-    }
+    headers = {"Authorization": _auth_header_value()}
+    if content_type:
+        headers["Content-Type"] = content_type
+    if prefer:
+        headers["Prefer"] = prefer
+    return headers
+
+
+def _headers(
+    content_type: str | None = None, prefer: str | None = None
+) -> dict[str, str]:
+    """Get request headers for EHRbase, including Basic Auth."""
+    _require_clinical_services()
+    return _cached_headers(content_type, prefer)
+
 
-    payload = {
+def _ehr_status(subject_id: str, subject_namespace: str) -> dict[str, Any]:
+    """Build the EHR_STATUS body for a new EHR owned by a subject."""
+    return {
         "_type": "EHR_STATUS",
         "subject": {
             "external_ref": {
@@ -86,19 +135,50 @@ def create_ehr(
         "is_queryable": True,
     }
 
-    response = requests.post(url, json=payload, headers=headers)
-    if response.status_code == 409:
-        raise EhrAlreadyExistsError(
-            f"EHR already exists for subject {subject_id}"
-        )
+
+def create_ehr(
+    subject_id: str, subject_namespace: str = "fhir"
+) -> dict[str, Any]:
+    """
+    Create a new EHR in EHRbase.
+
+    Args:
+        subject_id: The FHIR Patient ID
+        subject_namespace: The namespace (default: 'fhir')
+
+    Returns:
+        EHR response containing ehr_id
+
+    Raises:
+        ValueError: If subject_id is empty or invalid
+        EhrAlreadyExistsError: If the subject already has an EHR
+        EhrbaseClientError: If the request fails
+    """
+    # Defensive programming: validate inputs
+    if not subject_id or subject_id.isspace():
+        raise ValueError("subject_id cannot be empty")
+    if not subject_namespace or subject_namespace.isspace():
+        raise ValueError("subject_namespace cannot be empty")
+    url = _api_base() + _EHR_PATH
+    headers = _headers(_JSON)
+
+    payload = _ehr_status(subject_id, subject_namespace)
+
     try:
+        response = _session.post(
+            url, data=orjson.dumps(payload), headers=headers
+        )
+        if response.status_code == 409:
+            raise EhrAlreadyExistsError(
+                f"EHR already exists for subject {subject_id}"
+            )
         response.raise_for_status()
-    except requests.HTTPError as exc:
+    except requests.RequestException as exc:
         logger.error(
             "Failed to create EHR for subject %s: %s", subject_id, exc
         )
         raise EhrbaseClientError("Failed to create clinical record") from exc
-    return response.json()  # type: ignore[no-any-return]
+    return _json(response)  # type: ignore[no-any-return]
 
 
 def get_ehr_by_subject(
@@ -118,18 +198,18 @@ def get_ehr_by_subject(
         ValueError: If subject_id is empty
     """
     # Defensive programming: validate inputs
-    if not subject_id or not subject_id.strip():
+    if not subject_id or subject_id.isspace():
         raise ValueError("subject_id cannot be empty")
-    url = f"{settings.EHRBASE_URL}/rest/openehr/v1/ehr"
-    headers = get_auth_header()
+    url = _api_base() + _EHR_PATH
+    headers = _headers()
     params = {"subject_id": subject_id, "subject_namespace": subject_namespace}
 
     try:
-        response = requests.get(url, params=params, headers=headers)
+        response = _session.get(url, params=params, headers=headers)
         if response.status_code == 404:
             return None
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return _json(response)  # type: ignore[no-any-return]
     except requests.RequestException as exc:
         if isinstance(exc, requests.HTTPError) and exc.response is not None:
             if exc.response.status_code == 404:
@@ -138,14 +218,57 @@ def get_ehr_by_subject(
         raise EhrbaseClientError("Failed to retrieve clinical record") from exc
 
 
+# subject -> ehr_id is fixed once an EHR exists, so successful lookups are
+# kept in-process. Misses are never cached: a patient may get an EHR later.
+_EHR_ID_CACHE_MAX = 4096
+_ehr_id_cache: dict[tuple[str, str], str] = {}
+# Sync lookups run on threadpool workers; writers take the lock so
+# eviction never iterates the dict while another thread resizes it.
+_ehr_id_cache_lock = threading.Lock()
+
+
+def _remember_ehr_id(
+    subject_id: str, subject_namespace: str, ehr_id: str
+) -> str:
+    """Store a subject's ehr_id, evicting the oldest entry when full."""
+    with _ehr_id_cache_lock:
+        if len(_ehr_id_cache) >= _EHR_ID_CACHE_MAX:
+            _ehr_id_cache.pop(next(iter(_ehr_id_cache)), None)
+        _ehr_id_cache[(subject_id, subject_namespace)] = ehr_id
+    return ehr_id
+
+
+def get_ehr_id(subject_id: str, subject_namespace: str = "fhir") -> str | None:
+    """
+    Get the ehr_id for a subject, using the in-process cache when possible.
+
+    Args:
+        subject_id: The FHIR Patient ID
+        subject_namespace: The namespace (default: 'fhir')
+
+    Returns:
+        ehr_id (UUID string) or None if the subject has no EHR
+    """
+    cached = _ehr_id_cache.get((subject_id, subject_namespace))
+    if cached is not None:
+        return cached
+    ehr = get_ehr_by_subject(subject_id, subject_namespace)
+    if not ehr:
+        return None
+    return _remember_ehr_id(
+        subject_id, subject_namespace, ehr["ehr_id"]["value"]
+    )
+
+
 def get_or_create_ehr(subject_id: str, subject_namespace: str = "fhir") -> str:
     """
     Get existing EHR or create new one for a subject.
 
-    Handles the race condition where two concurrent requests may both
-    attempt to create an EHR for the same patient. If creation fails
-    because another request created it first (409 Conflict), we fetch
-    the existing EHR instead.
+    Creation is attempted first: EHRbase rejects a duplicate subject with
+    409 Conflict, in which case the existing EHR is fetched instead. A new
+    patient therefore costs one round-trip rather than a lookup followed
+    by a create, and concurrent creates for the same patient resolve to
+    the same EHR.
 
     Args:
         subject_id: The FHIR Patient ID
@@ -154,22 +277,19 @@ def get_or_create_ehr(subject_id: str, subject_namespace: str = "fhir") -> str:
     Returns:
         ehr_id (UUID string)
     """
-    ehr = get_ehr_by_subject(subject_id, subject_namespace)
-    if ehr:
-        return ehr["ehr_id"]["value"]  # type: ignore[no-any-return]
+    cached = _ehr_id_cache.get((subject_id, subject_namespace))
+    if cached is not None:
+        return cached
 
     try:
         new_ehr = create_ehr(subject_id, subject_namespace)
-        return new_ehr["ehr_id"]["value"]  # type: ignore[no-any-return]
-    except EhrAlreadyExistsError:
-        # Another request created the EHR between our check and create
-        logger.info(
-            "EHR creation race condition resolved for subject %s",
-            subject_id,
+        return _remember_ehr_id(
+            subject_id, subject_namespace, new_ehr["ehr_id"]["value"]
         )
-        ehr = get_ehr_by_subject(subject_id, subject_namespace)
-        if ehr:
-            return ehr["ehr_id"]["value"]  # type: ignore[no-any-return]
+    except EhrAlreadyExistsError:
+        ehr_id = get_ehr_id(subject_id, subject_namespace)
+        if ehr_id:
+            return ehr_id
         raise
 
 
@@ -196,16 +316,13 @@ def upload_template(template_xml: str) -> dict[str, Any]:
     except ParseError as exc:
         raise ValueError(f"Invalid template XML: {exc}") from exc
 
-    url = f"{settings.EHRBASE_URL}/rest/openehr/v1/definition/template/adl1.4"
-    headers = {
-        **get_auth_header(),
-        "Content-Type": "application/xml",
-    }
+    url = _api_base() + _TEMPLATE_PATH
+    headers = _headers(_XML)
 
     try:
-        response = requests.post(url, data=template_xml, headers=headers)
+        response = _session.post(url, data=template_xml, headers=headers)
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return _json(response)  # type: ignore[no-any-return]
     except requests.RequestException as exc:
         logger.error("Failed to upload template to EHRbase: %s", exc)
         raise EhrbaseClientError("Failed to upload clinical template") from exc
@@ -221,13 +338,13 @@ def list_templates() -> list[str]:
     Raises:
         EhrbaseClientError: If the request fails.
     """
-    url = f"{settings.EHRBASE_URL}/rest/openehr/v1/definition/template/adl1.4"
-    headers = get_auth_header()
+    url = _api_base() + _TEMPLATE_PATH
+    headers = _headers()
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers)
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return _json(response)  # type: ignore[no-any-return]
     except requests.RequestException as exc:
         logger.error("Failed to list EHRbase templates: %s", exc)
         raise EhrbaseClientError(
@@ -252,17 +369,15 @@ def create_composition(
     Raises:
         EhrbaseClientError: If the request fails.
     """
-    url = f"{settings.EHRBASE_URL}/rest/openehr/v1/ehr/{ehr_id}/composition"
-    headers = {
-        **get_auth_header(),
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",
-    }
+    url = _api_base() + _COMPOSITIONS_PATH.format(ehr_id=ehr_id)
+    headers = _headers(_JSON, prefer="return=representation")
 
     try:
-        response = requests.post(url, json=composition_data, headers=headers)
+        response = _session.post(
+            url, data=orjson.dumps(composition_data), headers=headers
+        )
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return _json(response)  # type: ignore[no-any-return]
     except requests.RequestException as exc:
         logger.error(
             "Failed to create composition for EHR %s: %s", ehr_id, exc
@@ -284,13 +399,15 @@ def get_composition(ehr_id: str, composition_uid: str) -> dict[str, Any]:
     Raises:
         EhrbaseClientError: If the request fails.
     """
-    url = f"{settings.EHRBASE_URL}/rest/openehr/v1/ehr/{ehr_id}/composition/{composition_uid}"
-    headers = get_auth_header()
+    url = _api_base() + _COMPOSITION_PATH.format(
+        ehr_id=ehr_id, composition_uid=composition_uid
+    )
+    headers = _headers()
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers)
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return _json(response)  # type: ignore[no-any-return]
     except requests.RequestException as exc:
         logger.error("Failed to get composition %s: %s", composition_uid, exc)
         raise EhrbaseClientError(
@@ -298,12 +415,15 @@ def get_composition(ehr_id: str, composition_uid: str) -> dict[str, Any]:
         ) from exc
 
 
-def query_aql(aql_query: str) -> dict[str, Any]:
+def query_aql(
+    aql_query: str, params: dict[str, Any] | None = None
+) -> dict[str, Any]:
     """
     Execute an AQL query against EHRbase.
 
     Args:
         aql_query: The AQL query string
+        params: Optional values for ``$name`` placeholders in the query
 
     Returns:
         Query results
@@ -311,23 +431,54 @@ def query_aql(aql_query: str) -> dict[str, Any]:
     Raises:
         EhrbaseClientError: If the request fails.
     """
-    url = f"{settings.EHRBASE_URL}/rest/openehr/v1/query/aql"
-    headers = {
-        **get_auth_header(),
-        "Content-Type": "application/json",
-    }
+    url = _api_base() + _AQL_PATH
+    headers = _headers(_JSON)
 
-    payload = {"q": aql_query}
+    payload: dict[str, Any] = {"q": aql_query}
+    if params:
+        payload["query_parameters"] = params
 
     try:
-        response = requests.post(url, json=payload, headers=headers)
+        response = _session.post(
+            url, data=orjson.dumps(payload), headers=headers
+        )
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return _json(response)  # type: ignore[no-any-return]
     except requests.RequestException as exc:
         logger.error("AQL query failed: %s", exc)
         raise EhrbaseClientError("Failed to query clinical records") from exc
 
 
+# AQL texts are fixed and take the EHR as a query parameter, so EHRbase
+# sees one query string per shape and can reuse its parsed plan.
+_COMPOSITIONS_FOR_EHR_AQL = """
+SELECT c
+FROM EHR e[ehr_id/value=$ehr_id]
+CONTAINS COMPOSITION c
+"""
+
+# Query for all report compositions (letters). The EHR is matched on its
+# subject, so listing needs no separate EHR lookup round-trip; a patient
+# without an EHR simply yields no rows.
+_LETTERS_FOR_SUBJECT_AQL = """
+SELECT
+    c/uid/value as composition_uid,
+    c/name/value as title,
+    c/context/start_time/value as created_at,
+    c/composer/name as author
+FROM EHR e
+CONTAINS COMPOSITION c[openEHR-EHR-COMPOSITION.report.v1]
+WHERE e/ehr_status/subject/external_ref/id/value = $subject_id
+AND e/ehr_status/subject/external_ref/namespace = $subject_namespace
+ORDER BY c/context/start_time/value DESC
+"""
+
+
+def _letters_query_params(patient_id: str) -> dict[str, Any]:
+    """Build the AQL parameters for listing a patient's letters."""
+    return {"subject_id": patient_id, "subject_namespace": "fhir"}
+
+
 def list_compositions_for_ehr(ehr_id: str) -> list[dict[str, Any]]:
     """
     List all compositions for an EHR using AQL.
@@ -338,70 +489,75 @@ def list_compositions_for_ehr(ehr_id: str) -> list[dict[str, Any]]:
     Returns:
         List of compositions
     """
-    aql = f"""
-    SELECT c
-    FROM EHR e[ehr_id/value='{ehr_id}']
-    CONTAINS COMPOSITION c
-    """
-
-    result = query_aql(aql)
+    result = query_aql(_COMPOSITIONS_FOR_EHR_AQL, {"ehr_id": ehr_id})
     return result.get("rows", [])  # type: ignore[no-any-return]
 
 
-def create_letter_composition(
-    patient_id: str, title: str, body: str, author_name: str | None = None
+# Invariant parts of the letter composition, built once at import and
+# shared between requests. They are only ever serialised, never mutated.
+_LETTER_TEMPLATE_ID = "openEHR-EHR-COMPOSITION.report.v1"
+_LETTER_LANGUAGE: dict[str, Any] = {
+    "_type": "CODE_PHRASE",
+    "terminology_id": {
+        "_type": "TERMINOLOGY_ID",
+        "value": "ISO_639-1",
+    },
+    "code_string": "en",
+}
+_LETTER_TERRITORY: dict[str, Any] = {
+    "_type": "CODE_PHRASE",
+    "terminology_id": {
+        "_type": "TERMINOLOGY_ID",
+        "value": "ISO_3166-1",
+    },
+    "code_string": "US",
+}
+_LETTER_CATEGORY: dict[str, Any] = {
+    "_type": "DV_CODED_TEXT",
+    "value": "event",
+    "defining_code": {
+        "_type": "CODE_PHRASE",
+        "terminology_id": {
+            "_type": "TERMINOLOGY_ID",
+            "value": "openehr",
+        },
+        "code_string": "433",
+    },
+}
+_LETTER_SETTING: dict[str, Any] = {
+    "_type": "DV_CODED_TEXT",
+    "value": "other care",
+    "defining_code": {
+        "_type": "CODE_PHRASE",
+        "terminology_id": {
+            "_type": "TERMINOLOGY_ID",
+            "value": "openehr",
+        },
+        "code_string": "238",
+    },
+}
+_LETTER_SECTION_NAME: dict[str, Any] = {"_type": "DV_TEXT", "value": "Letter"}
+_LETTER_TREE_NAME: dict[str, Any] = {"_type": "DV_TEXT", "value": "Tree"}
+_LETTER_SYNOPSIS_NAME: dict[str, Any] = {
+    "_type": "DV_TEXT",
+    "value": "Synopsis",
+}
+
+
+def _letter_composition(
+    title: str, body: str, author_name: str | None
 ) -> dict[str, Any]:
-    """
-    Create a letter/correspondence composition in OpenEHR.
-
-    Args:
-        patient_id: FHIR Patient ID
-        title: Letter title
-        body: Letter content (markdown)
-        author_name: Optional author name
-
-    Returns:
-        Created composition response with composition_uid
-    """
-    from datetime import UTC, datetime
-
-    # Get or create EHR for this patient
-    ehr_id = get_or_create_ehr(patient_id)
-
+    """Build the composition body for a new letter."""
     # Create a simple letter composition
-    # Using a generic composition structure for letters
-    composition_data = {
+    # Using a generic composition structure for letters; only the
+    # per-letter fields are built here, the rest is shared.
+    return {
         "_type": "COMPOSITION",
         "name": {"_type": "DV_TEXT", "value": title},
-        "archetype_node_id": "openEHR-EHR-COMPOSITION.report.v1",
-        "language": {
-            "_type": "CODE_PHRASE",
-            "terminology_id": {
-                "_type": "TERMINOLOGY_ID",
-                "value": "ISO_639-1",
-            },
-            "code_string": "en",
-        },
-        "territory": {
-            "_type": "CODE_PHRASE",
-            "terminology_id": {
-                "_type": "TERMINOLOGY_ID",
-                "value": "ISO_3166-1",
-            },
-            "code_string": "US",
-        },
-        "category": {
-            "_type": "DV_CODED_TEXT",
-            "value": "event",
-            "defining_code": {
-                "_type": "CODE_PHRASE",
-                "terminology_id": {
-                    "_type": "TERMINOLOGY_ID",
-                    "value": "openehr",
-                },
-                "code_string": "433",
-            },
-        },
+        "archetype_node_id": _LETTER_TEMPLATE_ID,
+        "language": _LETTER_LANGUAGE,
+        "territory": _LETTER_TERRITORY,
+        "category": _LETTER_CATEGORY,
         "composer": {
             "_type": "PARTY_IDENTIFIED",
             "name": author_name or "System",
@@ -410,34 +566,23 @@ def create_letter_composition(
             "_type": "EVENT_CONTEXT",
             "start_time": {
                 "_type": "DV_DATE_TIME",
-                "value": datetime.now(UTC).isoformat(),
-            },
-            "setting": {
-                "_type": "DV_CODED_TEXT",
-                "value": "other care",
-                "defining_code": {
-                    "_type": "CODE_PHRASE",
-                    "terminology_id": {
-                        "_type": "TERMINOLOGY_ID",
-                        "value": "openehr",
-                    },
-                    "code_string": "238",
-                },
+                "value": datetime.now(UTC).isoformat(timespec="milliseconds"),
             },
+            "setting": _LETTER_SETTING,
         },
         "content": [
             {
                 "_type": "EVALUATION",
-                "name": {"_type": "DV_TEXT", "value": "Letter"},
+                "name": _LETTER_SECTION_NAME,
                 "archetype_node_id": "openEHR-EHR-EVALUATION.clinical_synopsis.v1",
                 "data": {
                     "_type": "ITEM_TREE",
-                    "name": {"_type": "DV_TEXT", "value": "Tree"},
+                    "name": _LETTER_TREE_NAME,
                     "archetype_node_id": "at0001",
                     "items": [
                         {
                             "_type": "ELEMENT",
-                            "name": {"_type": "DV_TEXT", "value": "Synopsis"},
+                            "name": _LETTER_SYNOPSIS_NAME,
                             "archetype_node_id": "at0002",
                             "value": {"_type": "DV_TEXT", "value": body},
                         }
@@ -447,9 +592,27 @@ def create_letter_composition(
         ],
     }
 
-    return create_composition(
-        ehr_id, "openEHR-EHR-COMPOSITION.report.v1", composition_data
-    )
+
+def create_letter_composition(
+    patient_id: str, title: str, body: str, author_name: str | None = None
+) -> dict[str, Any]:
+    """
+    Create a letter/correspondence composition in OpenEHR.
+
+    Args:
+        patient_id: FHIR Patient ID
+        title: Letter title
+        body: Letter content (markdown)
+        author_name: Optional author name
+
+    Returns:
+        Created composition response with composition_uid
+    """
+    # Get or create EHR for this patient
+    ehr_id = get_or_create_ehr(patient_id)
+
+    composition_data = _letter_composition(title, body, author_name)
+    return create_composition(ehr_id, _LETTER_TEMPLATE_ID, composition_data)
 
 
 def get_letter_composition(
@@ -466,11 +629,10 @@ def get_letter_composition(
         Composition data or None if not found
     """
     try:
-        ehr = get_ehr_by_subject(patient_id)
-        if not ehr:
+        ehr_id = get_ehr_id(patient_id)
+        if not ehr_id:
             return None
 
-        ehr_id = ehr["ehr_id"]["value"]
         return get_composition(ehr_id, composition_uid)
     except EhrbaseClientError:
         raise
@@ -494,25 +656,9 @@ def list_letters_for_patient(patient_id: str) -> list[dict[str, Any]]:
         List of letter compositions with metadata
     """
     try:
-        ehr = get_ehr_by_subject(patient_id)
-        if not ehr:
-            return []
-
-        ehr_id = ehr["ehr_id"]["value"]
-
-        # Query for all report compositions (letters)
-        aql = f"""
-        SELECT
-            c/uid/value as composition_uid,
-            c/name/value as title,
-            c/context/start_time/value as created_at,
-            c/composer/name as author
-        FROM EHR e[ehr_id/value='{ehr_id}']
-        CONTAINS COMPOSITION c[openEHR-EHR-COMPOSITION.report.v1]
-        ORDER BY c/context/start_time/value DESC
-        """
-
-        result = query_aql(aql)
+        result = query_aql(
+            _LETTERS_FOR_SUBJECT_AQL, _letters_query_params(patient_id)
+        )
         return result.get("rows", [])  # type: ignore[no-any-return]
     except EhrbaseClientError:
         raise
@@ -521,3 +667,290 @@ def list_letters_for_patient(patient_id: str) -> list[dict[str, Any]]:
             "Failed to list letters for patient %s: %s", patient_id, exc
         )
         raise EhrbaseClientError("Failed to retrieve letters") from exc
+
+
+# --- Async path ---
+#
+# Used by the async letter endpoints so EHRbase I/O does not hold a
+# threadpool worker, and so independent composition fetches can run
+# concurrently. Shares the auth header and ehr_id cache with the sync API.
+
+
+@lru_cache(maxsize=1)
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the shared async EHRbase client, creating it on first use."""
+    return httpx.AsyncClient(
+        base_url=_api_base(),
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+
+async def aclose_async_client() -> None:
+    """Close the shared async client if it has been created."""
+    if _get_async_client.cache_info().currsize:
+        await _get_async_client().aclose()
+        _get_async_client.cache_clear()
+
+
+async def aget_ehr_id(
+    subject_id: str, subject_namespace: str = "fhir"
+) -> str | None:
+    """
+    Async variant of get_ehr_id.
+
+    Args:
+        subject_id: The FHIR Patient ID
+        subject_namespace: The namespace (default: 'fhir')
+
+    Returns:
+        ehr_id (UUID string) or None if the subject has no EHR
+
+    Raises:
+        ValueError: If subject_id is empty
+        EhrbaseClientError: If the request fails
+    """
+    if not subject_id or subject_id.isspace():
+        raise ValueError("subject_id cannot be empty")
+    cached = _ehr_id_cache.get((subject_id, subject_namespace))
+    if cached is not None:
+        return cached
+
+    url = _EHR_PATH
+    params = {"subject_id": subject_id, "subject_namespace": subject_namespace}
+    try:
+        response = await _get_async_client().get(
+            url, params=params, headers=_headers()
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        ehr = orjson.loads(response.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+        logger.error("Failed to get EHR for subject %s: %s", subject_id, exc)
+        raise EhrbaseClientError("Failed to retrieve clinical record") from exc
+    return _remember_ehr_id(
+        subject_id, subject_namespace, ehr["ehr_id"]["value"]
+    )
+
+
+async def acreate_ehr(
+    subject_id: str, subject_namespace: str = "fhir"
+) -> dict[str, Any]:
+    """
+    Async variant of create_ehr.
+
+    Args:
+        subject_id: The FHIR Patient ID
+        subject_namespace: The namespace (default: 'fhir')
+
+    Returns:
+        EHR response containing ehr_id
+
+    Raises:
+        ValueError: If subject_id is empty or invalid
+        EhrAlreadyExistsError: If the subject already has an EHR
+        EhrbaseClientError: If the request fails
+    """
+    if not subject_id or subject_id.isspace():
+        raise ValueError("subject_id cannot be empty")
+    if not subject_namespace or subject_namespace.isspace():
+        raise ValueError("subject_namespace cannot be empty")
+    payload = _ehr_status(subject_id, subject_namespace)
+
+    try:
+        response = await _get_async_client().post(
+            _EHR_PATH, content=orjson.dumps(payload), headers=_headers(_JSON)
+        )
+        if response.status_code == 409:
+            raise EhrAlreadyExistsError(
+                f"EHR already exists for subject {subject_id}"
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content)  # type: ignore[no-any-return]
+    except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+        logger.error(
+            "Failed to create EHR for subject %s: %s", subject_id, exc
+        )
+        raise EhrbaseClientError("Failed to create clinical record") from exc
+
+
+async def aget_or_create_ehr(
+    subject_id: str, subject_namespace: str = "fhir"
+) -> str:
+    """
+    Async variant of get_or_create_ehr.
+
+    Args:
+        subject_id: The FHIR Patient ID
+        subject_namespace: The namespace (default: 'fhir')
+
+    Returns:
+        ehr_id (UUID string)
+    """
+    cached = _ehr_id_cache.get((subject_id, subject_namespace))
+    if cached is not None:
+        return cached
+
+    try:
+        new_ehr = await acreate_ehr(subject_id, subject_namespace)
+        return _remember_ehr_id(
+            subject_id, subject_namespace, new_ehr["ehr_id"]["value"]
+        )
+    except EhrAlreadyExistsError:
+        ehr_id = await aget_ehr_id(subject_id, subject_namespace)
+        if ehr_id:
+            return ehr_id
+        raise
+
+
+async def acreate_composition(
+    ehr_id: str, template_id: str, composition_data: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Async variant of create_composition.
+
+    Args:
+        ehr_id: The EHR UUID
+        template_id: The template ID
+        composition_data: The composition content in JSON format
+
+    Returns:
+        Created composition response
+
+    Raises:
+        EhrbaseClientError: If the request fails.
+    """
+    url = _COMPOSITIONS_PATH.format(ehr_id=ehr_id)
+    headers = _headers(_JSON, prefer="return=representation")
+
+    try:
+        response = await _get_async_client().post(
+            url, content=orjson.dumps(composition_data), headers=headers
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)  # type: ignore[no-any-return]
+    except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+        logger.error(
+            "Failed to create composition for EHR %s: %s", ehr_id, exc
+        )
+        raise EhrbaseClientError("Failed to create clinical document") from exc
+
+
+async def aget_composition(
+    ehr_id: str, composition_uid: str
+) -> dict[str, Any]:
+    """
+    Async variant of get_composition.
+
+    Args:
+        ehr_id: The EHR UUID
+        composition_uid: The composition UID
+
+    Returns:
+        Composition data
+
+    Raises:
+        EhrbaseClientError: If the request fails.
+    """
+    url = _COMPOSITION_PATH.format(
+        ehr_id=ehr_id, composition_uid=composition_uid
+    )
+    try:
+        response = await _get_async_client().get(url, headers=_headers())
+        response.raise_for_status()
+        return orjson.loads(response.content)  # type: ignore[no-any-return]
+    except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+        logger.error("Failed to get composition %s: %s", composition_uid, exc)
+        raise EhrbaseClientError(
+            "Failed to retrieve clinical document"
+        ) from exc
+
+
+async def aquery_aql(
+    aql_query: str, params: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Async variant of query_aql.
+
+    Args:
+        aql_query: The AQL query string
+        params: Optional values for ``$name`` placeholders in the query
+
+    Returns:
+        Query results
+
+    Raises:
+        EhrbaseClientError: If the request fails.
+    """
+    url = _AQL_PATH
+    headers = _headers(_JSON)
+    payload: dict[str, Any] = {"q": aql_query}
+    if params:
+        payload["query_parameters"] = params
+
+    try:
+        response = await _get_async_client().post(
+            url, content=orjson.dumps(payload), headers=headers
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)  # type: ignore[no-any-return]
+    except (httpx.HTTPError, orjson.JSONDecodeError) as exc:
+        logger.error("AQL query failed: %s", exc)
+        raise EhrbaseClientError("Failed to query clinical records") from exc
+
+
+async def acreate_letter_composition(
+    patient_id: str, title: str, body: str, author_name: str | None = None
+) -> dict[str, Any]:
+    """
+    Async variant of create_letter_composition.
+
+    Args:
+        patient_id: FHIR Patient ID
+        title: Letter title
+        body: Letter content (markdown)
+        author_name: Optional author name
+
+    Returns:
+        Created composition response with composition_uid
+    """
+    ehr_id = await aget_or_create_ehr(patient_id)
+    composition_data = _letter_composition(title, body, author_name)
+    return await acreate_composition(
+        ehr_id, _LETTER_TEMPLATE_ID, composition_data
+    )
+
+
+async def aget_letter_composition(
+    patient_id: str, composition_uid: str
+) -> dict[str, Any] | None:
+    """
+    Async variant of get_letter_composition.
+
+    Args:
+        patient_id: FHIR Patient ID
+        composition_uid: The composition UID
+
+    Returns:
+        Composition data or None if not found
+    """
+    ehr_id = await aget_ehr_id(patient_id)
+    if not ehr_id:
+        return None
+    return await aget_composition(ehr_id, composition_uid)
+
+
+async def alist_letters_for_patient(patient_id: str) -> list[dict[str, Any]]:
+    """
+    Async variant of list_letters_for_patient.
+
+    Args:
+        patient_id: FHIR Patient ID
+
+    Returns:
+        List of letter compositions with metadata
+    """
+    result = await aquery_aql(
+        _LETTERS_FOR_SUBJECT_AQL, _letters_query_params(patient_id)
+    )
+    return result.get("rows", [])  # type: ignore[no-any-return]
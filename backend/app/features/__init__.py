@@ -7,11 +7,12 @@ Same ergonomics as ``has_competency`` in ``app.cbac.decorators``.
 
 from collections.abc import Callable
 
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db import get_session
+from app.deps import DEP_CURRENT_USER
 from app.models import (
     OrganisationFeature,
     User,
@@ -36,14 +37,9 @@ def requires_feature(feature_key: str) -> Callable[..., User]:
     """
 
     def _check(
-        request: Request,
+        user: User = DEP_CURRENT_USER,
         db: Session = Depends(get_session),
     ) -> User:
-        # Lazy import to avoid circular dependency with app.main
-        from app.main import current_user
-
-        user = current_user(request, db)
-
         user_org_ids = list(
             set(
                 db.execute(
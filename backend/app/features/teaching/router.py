@@ -12,12 +12,13 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, lazyload
 
 from app.cbac.decorators import has_competency
 from app.db import get_session
+from app.deps import DEP_CURRENT_USER
 from app.features import requires_feature
 from app.features.teaching.models import (
     Assessment,
@@ -94,14 +95,7 @@ teaching_router = APIRouter(
 _DEP_SESSION = Depends(get_session)
 
 
-def _get_current_user(request: Request, db: Session = _DEP_SESSION) -> User:
-    """Resolve authenticated user (lazy import to avoid circular dep)."""
-    from app.main import current_user
-
-    return current_user(request, db)
-
-
-_DEP_USER = Depends(_get_current_user)
+_DEP_USER = DEP_CURRENT_USER
 
 
 def _get_user_org_ids(user: User, db: Session) -> list[int]:
@@ -1732,7 +1726,9 @@ def list_delegates(
     users_map: dict[int, User] = {
         u.id: u
         for u in db.execute(
-            select(User).where(
+            select(User)
+            .options(lazyload(User.roles))
+            .where(
                 User.id.in_(user_ids),
                 User.system_permissions.notin_(["admin", "superadmin"]),
             )
@@ -12,6 +12,7 @@ from __future__ import annotations
 import logging
 import re
 import tempfile
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -125,6 +126,29 @@ def _has_assessment_config(directory: Path) -> bool:
     ).is_file()
 
 
+# Subdirectories of each local bank root, reused while the root's mtime is
+# unchanged (adding or removing a repo updates it), so per-bank lookups do
+# not list the root again. Only the root listing is cached; everything
+# below it is checked live.
+_subdirs_cache: dict[Path, tuple[int, list[Path]]] = {}
+# A listing taken within the filesystem's timestamp granularity of the
+# last change could miss a further change that keeps the same mtime, so
+# listings are only kept once the root has been quiet this long.
+_SUBDIRS_SETTLE_NS = 1_000_000_000
+
+
+def _subdirs(base: Path) -> list[Path]:
+    """Return the sorted subdirectories of ``base``, cached by mtime."""
+    mtime = base.stat().st_mtime_ns
+    cached = _subdirs_cache.get(base)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    dirs = sorted(child for child in base.iterdir() if child.is_dir())
+    if time.time_ns() - mtime > _SUBDIRS_SETTLE_NS:
+        _subdirs_cache[base] = (mtime, dirs)
+    return dirs
+
+
 def discover_local_banks(base_path: str) -> list[str]:
     """Discover question bank IDs from the local teaching-repos layout.
 
@@ -142,9 +166,7 @@ def discover_local_banks(base_path: str) -> list[str]:
 
     bank_ids: set[str] = set()
 
-    for child in base.iterdir():
-        if not child.is_dir():
-            continue
+    for child in _subdirs(base):
         # Check flat layout: <base>/<bank_id>/{assessment,config}.yaml
         if _has_assessment_config(child):
             bank_ids.add(child.name)
@@ -191,9 +213,7 @@ def resolve_local_bank(base_path: str, bank_id: str) -> Path | None:
         return flat
 
     # Check repo subdirectories
-    for child in base.iterdir():
-        if not child.is_dir():
-            continue
+    for child in _subdirs(base):
         # Check modules layout: <base>/<repo>/modules/<bank_id>/assessment/
         assessment_dir = child / "modules" / bank_id / "assessment"
         if assessment_dir.is_dir() and _has_assessment_config(assessment_dir):
@@ -217,9 +237,7 @@ def resolve_module_dir(base_path: str, module_id: str) -> Path | None:
     if not base.is_dir():
         return None
 
-    for child in base.iterdir():
-        if not child.is_dir():
-            continue
+    for child in _subdirs(base):
         module_dir = child / "modules" / module_id
         if module_dir.is_dir() and (module_dir / "module.yaml").is_file():
             return module_dir
@@ -7,27 +7,28 @@ including Patient demographics and Communication (messaging).
 """
 
 import logging
+import re
+import threading
 import uuid
+from collections.abc import Iterable
+from datetime import date
+from functools import lru_cache
 from typing import Any
+from urllib.parse import urlencode, urljoin
 
+import httpx
+import orjson
+import requests
 from fhirclient import client  # type: ignore[import-untyped]
-from fhirclient.models.address import Address  # type: ignore[import-untyped]
-from fhirclient.models.contactpoint import (  # type: ignore[import-untyped]
-    ContactPoint,
+from fhirclient.server import (  # type: ignore[import-untyped]
+    FHIRNotFoundException,
+    FHIRPermissionDeniedException,
+    FHIRUnauthorizedException,
 )
-from fhirclient.models.extension import (  # type: ignore[import-untyped]
-    Extension,
-)
-from fhirclient.models.fhirdate import FHIRDate  # type: ignore[import-untyped]
-from fhirclient.models.fhirdatetime import (  # type: ignore[import-untyped]
-    FHIRDateTime,
-)
-from fhirclient.models.humanname import (  # type: ignore[import-untyped]
-    HumanName,
-)
-from fhirclient.models.patient import Patient  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from app.config import settings
+from app.config import get_settings
 from app.utils.colors import generate_avatar_gradient_index
 
 logger = logging.getLogger(__name__)
@@ -35,6 +36,26 @@ logger = logging.getLogger(__name__)
 # FHIR extension URL for avatar gradient index
 AVATAR_GRADIENT_EXTENSION_URL = "urn:quillmedical:avatar-gradient"
 
+# FHIR administrative-gender codes
+_VALID_GENDERS: frozenset[str] = frozenset(
+    {"male", "female", "other", "unknown"}
+)
+
+# FHIR ``date``: YYYY, YYYY-MM or YYYY-MM-DD
+_FHIR_DATE_RE = re.compile(
+    r"([0-9]([0-9]([0-9][1-9]|[1-9]0)|[1-9]00)|[1-9]000)"
+    r"(-(0[1-9]|1[0-2])(-(0[1-9]|[1-2][0-9]|3[0-1]))?)?"
+)
+
+
+def _validate_fhir_date(value: str) -> None:
+    """Raise ValueError unless value is a valid FHIR date."""
+    if not _FHIR_DATE_RE.fullmatch(value):
+        raise ValueError(f"Date must be YYYY, YYYY-MM or YYYY-MM-DD: {value}")
+    if len(value) == 10:
+        # Catch days that do not exist in the month, e.g. 1990-02-30
+        date.fromisoformat(value)
+
 
 class FhirClientError(Exception):
     """Raised when a FHIR patient/resource operation fails.
@@ -44,17 +65,55 @@ class FhirClientError(Exception):
     """
 
 
+# Failures talking to the FHIR server: transport and HTTP errors (incl.
+# exhausted retries), auth rejections from fhirclient's status check, and
+# bodies that are not valid JSON. Anything else is a bug and propagates.
+_FHIR_ERRORS = (
+    requests.RequestException,
+    FHIRUnauthorizedException,
+    FHIRPermissionDeniedException,
+    ValueError,
+)
+
+
 def _require_clinical_services() -> None:
     """Raise if clinical services are disabled."""
-    if not settings.CLINICAL_SERVICES_ENABLED:
+    if not get_settings().CLINICAL_SERVICES_ENABLED:
         raise FhirCommunicationError(
             "Clinical services are disabled in this deployment"
         )
 
 
+# Transient gateway errors from HAPI are retried with a short backoff.
+# POST is excluded by urllib3's defaults; PUTs here use client-assigned
+# IDs and so are safe to repeat.
+_FHIR_RETRY = Retry(
+    total=3, backoff_factor=0.1, status_forcelist=(502, 503, 504)
+)
+
+
+@lru_cache(maxsize=1)
+def _fhir_client() -> client.FHIRClient:
+    """Build the process-wide FHIR client, reused so its session is kept."""
+    fhir_settings = {
+        "app_id": "quill_medical",
+        "api_base": get_settings().FHIR_SERVER_URL,
+    }
+    fhir = client.FHIRClient(settings=fhir_settings)
+    # Pool keep-alive connections on fhirclient's own requests session
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=32, max_retries=_FHIR_RETRY
+    )
+    fhir.server.session.mount("http://", adapter)
+    fhir.server.session.mount("https://", adapter)
+    return fhir
+
+
 def get_fhir_client() -> client.FHIRClient:
     """Get configured FHIR client instance.
 
+    The client is created on first use and shared by later calls.
+
     Returns:
         FHIRClient: Configured client connected to HAPI FHIR server.
 
@@ -62,15 +121,11 @@ def get_fhir_client() -> client.FHIRClient:
         FhirCommunicationError: If clinical services are disabled.
     """
     _require_clinical_services()
-    fhir_settings = {
-        "app_id": "quill_medical",
-        "api_base": settings.FHIR_SERVER_URL,
-    }
-    return client.FHIRClient(settings=fhir_settings)
+    return _fhir_client()
 
 
 def add_avatar_gradient_extension(
-    patient: Patient, gradient_index: int | None = None
+    patient: dict[str, Any], gradient_index: int | None = None
 ) -> None:
     """Add avatar gradient index extension to FHIR Patient.
 
@@ -78,29 +133,50 @@ def add_avatar_gradient_extension(
     gradients in the frontend.
 
     Args:
-        patient: FHIR Patient resource instance.
-        gradient_index: Index of gradient (0-29), or None to generate random.
+        patient: FHIR Patient resource as a JSON dictionary.
+        gradient_index: Index of gradient (0-29), or None to derive one
+            from the patient's id (random if it has none).
 
     Example:
-        >>> patient = Patient()
+        >>> patient = {"resourceType": "Patient"}
         >>> add_avatar_gradient_extension(patient, gradient_index=5)
-        >>> # patient.extension now contains gradientIndex = 5
+        >>> # patient["extension"] now contains gradientIndex = 5
     """
     if gradient_index is None:
-        gradient_index = generate_avatar_gradient_index()
-
-    # Create extension with gradient index
-    gradient_ext = Extension()
-    gradient_ext.url = AVATAR_GRADIENT_EXTENSION_URL
-    gradient_ext.valueInteger = gradient_index
+        gradient_index = generate_avatar_gradient_index(patient.get("id"))
 
     # Add to patient extensions
-    if patient.extension is None:
-        patient.extension = []
-    patient.extension.append(gradient_ext)
+    patient.setdefault("extension", []).append(
+        {"url": AVATAR_GRADIENT_EXTENSION_URL, "valueInteger": gradient_index}
+    )
 
 
-def create_fhir_patient(
+_FHIR_JSON_HEADERS = {
+    "Accept": "application/fhir+json",
+    "Accept-Charset": "UTF-8",
+}
+_FHIR_PUT_HEADERS = {
+    **_FHIR_JSON_HEADERS,
+    "Content-Type": "application/fhir+json",
+}
+
+
+def _put_json(
+    fhir: client.FHIRClient, path: str, resource: dict[str, Any]
+) -> None:
+    """PUT a resource to a path relative to the FHIR base.
+
+    Equivalent to ``fhir.server.put_json`` but serialised with orjson.
+    """
+    response = fhir.server.session.put(
+        urljoin(fhir.server.base_uri, path),
+        data=orjson.dumps(resource),
+        headers=_FHIR_PUT_HEADERS,
+    )
+    fhir.server.raise_for_status(response)
+
+
+def _patient_resource(
     given_name: str,
     family_name: str,
     birth_date: str | None = None,
@@ -109,23 +185,13 @@ def create_fhir_patient(
     mrn: str | None = None,
     patient_id: str | None = None,
 ) -> dict[str, Any]:
-    """Create a new FHIR Patient resource.
+    """Validate demographics and build a new Patient resource.
 
-    Args:
-        given_name (str): Patient's first/given name.
-        family_name (str): Patient's family/last name.
-        birth_date (str | None): Date of birth in YYYY-MM-DD format.
-        gender (str | None): Gender (male, female, other, unknown).
-        nhs_number (str | None): NHS number (10-digit UK national identifier).
-        mrn (str | None): Medical Record Number (local hospital identifier).
-        patient_id (str | None): Optional ID for the patient.
-
-    Returns:
-        dict: Created patient resource as dictionary.
+    Shared by create_fhir_patient and acreate_fhir_patient; see there for
+    the arguments.
 
     Raises:
         ValueError: If required fields are empty or invalid.
-        Exception: If creation fails.
     """
     # Defensive programming: validate required inputs
     if not given_name or not given_name.strip():
@@ -135,10 +201,9 @@ def create_fhir_patient(
 
     # Validate gender if provided
     if gender is not None:
-        valid_genders = {"male", "female", "other", "unknown"}
-        if gender.lower() not in valid_genders:
+        if gender.lower() not in _VALID_GENDERS:
             raise ValueError(
-                f"Gender must be one of {valid_genders}, got: {gender}"
+                f"Gender must be one of {set(_VALID_GENDERS)}, got: {gender}"
             )
 
     # Validate NHS number format if provided
@@ -148,72 +213,181 @@ def create_fhir_patient(
             raise ValueError(
                 f"NHS number must be 10 digits, got: {nhs_number}"
             )
-    fhir = get_fhir_client()
-
-    # Create Patient resource
-    patient = Patient()
 
     # Generate UUID for client-assigned ID (standard FHIR pattern)
     # FHIR servers must support client-assigned IDs via PUT requests
     patient_uuid = patient_id if patient_id else str(uuid.uuid4())
-    patient.id = patient_uuid
-
-    # Create name
-    name = HumanName()
-    name.given = [given_name]
-    name.family = family_name
-    name.use = "official"
 
-    patient.name = [name]
+    # Build the Patient resource as plain FHIR JSON
+    resource: dict[str, Any] = {
+        "resourceType": "Patient",
+        "id": patient_uuid,
+        "name": [
+            {"use": "official", "given": [given_name], "family": family_name}
+        ],
+    }
 
     # Add birth date if provided
     if birth_date:
-        patient.birthDate = FHIRDate(birth_date)
+        _validate_fhir_date(birth_date)
+        resource["birthDate"] = birth_date
 
     # Add gender if provided (must be one of: male, female, other, unknown)
-    if gender and gender.lower() in ["male", "female", "other", "unknown"]:
-        patient.gender = gender.lower()
+    if gender and gender.lower() in _VALID_GENDERS:
+        resource["gender"] = gender.lower()
 
     # Add identifiers
     identifiers = []
 
     # NHS Number (UK national identifier)
     if nhs_number:
-        from fhirclient.models.identifier import (  # type: ignore[import-untyped]
-            Identifier,
+        identifiers.append(
+            {
+                "system": "https://fhir.nhs.uk/Id/nhs-number",
+                "value": nhs_number,
+            }
         )
 
-        nhs_id = Identifier()
-        nhs_id.system = "https://fhir.nhs.uk/Id/nhs-number"
-        nhs_id.value = nhs_number
-        identifiers.append(nhs_id)
-
     # Medical Record Number (local hospital identifier)
     if mrn:
-        from fhirclient.models.identifier import Identifier
-
-        mrn_id = Identifier()
-        mrn_id.system = "http://hospital.example.org/identifiers/mrn"
-        mrn_id.value = mrn
-        identifiers.append(mrn_id)
+        identifiers.append(
+            {
+                "system": "http://hospital.example.org/identifiers/mrn",
+                "value": mrn,
+            }
+        )
 
     if identifiers:
-        patient.identifier = identifiers
+        resource["identifier"] = identifiers
 
     # Add avatar gradient extension (generate colors automatically)
-    add_avatar_gradient_extension(patient)
+    add_avatar_gradient_extension(resource)
+
+    return resource
+
+
+def create_fhir_patient(
+    given_name: str,
+    family_name: str,
+    birth_date: str | None = None,
+    gender: str | None = None,
+    nhs_number: str | None = None,
+    mrn: str | None = None,
+    patient_id: str | None = None,
+) -> dict[str, Any]:
+    """Create a new FHIR Patient resource.
+
+    Args:
+        given_name (str): Patient's first/given name.
+        family_name (str): Patient's family/last name.
+        birth_date (str | None): Date of birth in YYYY-MM-DD format.
+        gender (str | None): Gender (male, female, other, unknown).
+        nhs_number (str | None): NHS number (10-digit UK national identifier).
+        mrn (str | None): Medical Record Number (local hospital identifier).
+        patient_id (str | None): Optional ID for the patient.
+
+    Returns:
+        dict: Created patient resource as dictionary.
+
+    Raises:
+        ValueError: If required fields are empty or invalid.
+        Exception: If creation fails.
+    """
+    resource = _patient_resource(
+        given_name,
+        family_name,
+        birth_date=birth_date,
+        gender=gender,
+        nhs_number=nhs_number,
+        mrn=mrn,
+        patient_id=patient_id,
+    )
+    patient_uuid = resource["id"]
+    fhir = get_fhir_client()
 
     # Use PUT to create with client-assigned UUID (standard FHIR pattern)
     # PUT /Patient/{uuid} creates the resource with our specified ID
     # This is standard FHIR behavior - no server configuration needed
+    _patient_cache.pop(patient_uuid, None)
     try:
-        fhir.server.put_json(f"Patient/{patient_uuid}", patient.as_json())
-    except Exception as exc:
+        _put_json(fhir, f"Patient/{patient_uuid}", resource)
+    except _FHIR_ERRORS as exc:
         logger.error("Failed to create FHIR Patient %s: %s", patient_uuid, exc)
         raise FhirClientError("Failed to create patient record") from exc
 
     # Return the patient data with the UUID
-    return patient.as_json()  # type: ignore[no-any-return]
+    return resource
+
+
+# Recently read Patient resources, keyed on id. They are never served
+# unchecked: each read revalidates its entry with If-None-Match and only
+# reuses the body on a 304, so edits made through another worker are seen
+# at once. Writes made through this module drop the entry. Misses are
+# never cached.
+_PATIENT_CACHE_MAX = 4096
+_patient_cache: dict[str, dict[str, Any]] = {}
+# Sync reads and writes run on threadpool workers; writers take the lock
+# so eviction never iterates the dict while another thread resizes it.
+_patient_cache_lock = threading.Lock()
+
+
+def _version_id(resource: dict[str, Any] | None) -> str | None:
+    """Return the resource's meta.versionId, or None if it has none."""
+    return (resource or {}).get("meta", {}).get("versionId") or None
+
+
+def _conditional_headers(
+    headers: dict[str, str], cached: dict[str, Any] | None
+) -> dict[str, str]:
+    """Add If-None-Match for a cached resource that carries a version."""
+    version = _version_id(cached)
+    if version is None:
+        return headers
+    return {**headers, "If-None-Match": f'W/"{version}"'}
+
+
+def _if_match_headers(
+    headers: dict[str, str], base: dict[str, Any] | None
+) -> dict[str, str]:
+    """Add If-Match so a write only applies to the version it was built on."""
+    version = _version_id(base)
+    if version is None:
+        return headers
+    return {**headers, "If-Match": f'W/"{version}"'}
+
+
+def _remember_patient(
+    patient_id: str, resource: dict[str, Any]
+) -> dict[str, Any]:
+    """Cache a Patient resource, evicting the oldest entry when full."""
+    with _patient_cache_lock:
+        _patient_cache.pop(patient_id, None)
+        if len(_patient_cache) >= _PATIENT_CACHE_MAX:
+            _patient_cache.pop(next(iter(_patient_cache)), None)
+        _patient_cache[patient_id] = resource
+    return resource
+
+
+def _get_json(
+    path: str, cached: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """GET a path relative to the FHIR base and return the decoded JSON.
+
+    Read paths use this instead of fhirclient models, which would parse
+    the resource into an object tree only to serialise it straight back.
+    The body is decoded with orjson rather than fhirclient's stdlib json.
+    When ``cached`` is an earlier read of the same resource, the GET is
+    conditional on its version and a 304 reply returns ``cached``.
+    """
+    fhir = get_fhir_client()
+    response = fhir.server.session.get(
+        urljoin(fhir.server.base_uri, path),
+        headers=_conditional_headers(_FHIR_JSON_HEADERS, cached),
+    )
+    if response.status_code == 304 and cached is not None:
+        return cached
+    fhir.server.raise_for_status(response)
+    return orjson.loads(response.content)  # type: ignore[no-any-return]
 
 
 def read_fhir_patient(patient_id: str) -> dict[str, Any] | None:
@@ -229,18 +403,69 @@ def read_fhir_patient(patient_id: str) -> dict[str, Any] | None:
         FhirClientError: If the FHIR server is unreachable or returns
             an unexpected error.
     """
-    fhir = get_fhir_client()
+    _require_clinical_services()
+    return _fetch_patient(patient_id, _patient_cache.get(patient_id))
+
+
+def _fetch_patient(
+    patient_id: str, cached: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """Read a Patient from the server and cache it.
 
+    The read is conditional on ``cached``'s version, and ``cached`` itself
+    is returned when the server confirms it is still current.
+    """
     try:
-        patient = Patient.read(patient_id, fhir.server)
-        return patient.as_json()  # type: ignore[no-any-return]
-    except Exception as exc:
-        # fhirclient raises generic exceptions — check for 404-like cases
-        exc_str = str(exc).lower()
-        if "not found" in exc_str or "404" in exc_str:
-            return None
+        resource = _get_json(f"Patient/{patient_id}", cached)
+    except FHIRNotFoundException:
+        _patient_cache.pop(patient_id, None)
+        return None
+    except _FHIR_ERRORS as exc:
         logger.error("Failed to read FHIR Patient %s: %s", patient_id, exc)
         raise FhirClientError("Failed to retrieve patient record") from exc
+    return _remember_patient(patient_id, resource)
+
+
+# Ids per _id search; keeps the query string well under URL length limits.
+_PATIENT_BATCH_SIZE = 100
+
+
+def read_fhir_patients(
+    patient_ids: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """Read several FHIR Patient resources in as few requests as possible.
+
+    Ids are fetched with ``GET Patient?_id=a,b,...`` searches of up to
+    100 ids each, instead of one read per patient. A search cannot be
+    made conditional, so cached entries are refreshed rather than reused.
+
+    Args:
+        patient_ids (Iterable[str]): FHIR Patient resource IDs.
+
+    Returns:
+        dict: Patient resources keyed on id. Ids that do not exist are
+            left out.
+
+    Raises:
+        FhirClientError: If the FHIR server is unreachable or returns
+            an unexpected error.
+    """
+    _require_clinical_services()
+
+    found: dict[str, dict[str, Any]] = {}
+    ids = list(dict.fromkeys(patient_ids))
+    for start in range(0, len(ids), _PATIENT_BATCH_SIZE):
+        batch = ids[start : start + _PATIENT_BATCH_SIZE]
+        query = urlencode({"_id": ",".join(batch), "_count": len(batch)})
+        try:
+            bundle = _get_json(f"Patient?{query}")
+        except _FHIR_ERRORS as exc:
+            logger.error("Failed to read FHIR Patients: %s", exc)
+            raise FhirClientError("Failed to retrieve patient list") from exc
+        for resource in _bundle_resources(bundle):
+            found[resource["id"]] = _remember_patient(resource["id"], resource)
+
+    return found
 
 
 def delete_fhir_patient(patient_id: str) -> bool:
@@ -254,42 +479,205 @@ def delete_fhir_patient(patient_id: str) -> bool:
         patient_id (str): FHIR Patient resource ID to delete.
 
     Returns:
-        bool: True if deletion successful, False otherwise.
+        bool: True if deletion successful, False if the patient does not
+            exist.
+
+    Raises:
+        FhirClientError: If the FHIR server is unreachable or returns
+            an unexpected error.
     """
     fhir = get_fhir_client()
+    _patient_cache.pop(patient_id, None)
 
     try:
-        patient = Patient.read(patient_id, fhir.server)
-        patient.delete()
+        _get_json(f"Patient/{patient_id}")
+        fhir.server.delete_json(f"Patient/{patient_id}")
         return True
-    except Exception:
+    except FHIRNotFoundException:
         return False
+    except _FHIR_ERRORS as exc:
+        logger.error("Failed to delete FHIR Patient %s: %s", patient_id, exc)
+        raise FhirClientError("Failed to delete patient record") from exc
+
+
+# Search page size; each page is one round trip parsed as raw JSON.
+PATIENT_PAGE_SIZE = 50
+
+# Patient elements shown by the patient list views (the id is always
+# returned). Passing these as _elements lets the server drop the rest.
+PATIENT_SUMMARY_ELEMENTS = (
+    "identifier",
+    "name",
+    "gender",
+    "birthDate",
+    "extension",
+)
 
 
-def list_fhir_patients() -> list[dict[str, Any]]:
-    """List all FHIR Patient resources.
+def _patient_search_path(
+    page_size: int, elements: Iterable[str] | None
+) -> str:
+    """Build the first-page Patient search path."""
+    params: dict[str, Any] = {"_count": page_size}
+    if elements:
+        params["_elements"] = ",".join(elements)
+    return f"Patient?{urlencode(params)}"
+
+
+def _bundle_resources(bundle: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the resource dicts held in a searchset Bundle."""
+    return [
+        entry["resource"]
+        for entry in bundle.get("entry", ())
+        if "resource" in entry
+    ]
+
+
+def _bundle_next_link(bundle: dict[str, Any]) -> str | None:
+    """Return the Bundle's ``next`` page URL, or None on the last page."""
+    for link in bundle.get("link", ()):
+        if link.get("relation") == "next":
+            return link["url"]  # type: ignore[no-any-return]
+    return None
+
+
+def list_fhir_patients_page(
+    page_size: int = PATIENT_PAGE_SIZE,
+    cursor: str | None = None,
+    elements: Iterable[str] | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Fetch one page of FHIR Patient resources.
+
+    Resources are returned as the server's JSON rather than being
+    inflated into fhirclient models.
+
+    Args:
+        page_size (int): Number of patients to request per page.
+        cursor (str | None): ``next`` link returned by a previous call,
+            or None for the first page.
+        elements (Iterable[str] | None): Top-level elements to return
+            (FHIR ``_elements``), or None for whole resources. Only used
+            for the first page; the server carries it into next links.
 
     Returns:
-        list[dict]: List of patient resources as dictionaries.
+        tuple: Patient resources as dictionaries, and the cursor for the
+            next page (None when there are no more pages).
 
     Raises:
         FhirClientError: If the FHIR server is unreachable or returns
             an unexpected error.
     """
-    fhir = get_fhir_client()
+    path = cursor if cursor else _patient_search_path(page_size, elements)
 
     try:
-        # Search for all patients
-        search = Patient.where(struct={})
-        patients = search.perform_resources(fhir.server)
-        return [p.as_json() for p in patients]
-    except Exception as exc:
+        bundle = _get_json(path)
+    except _FHIR_ERRORS as exc:
         logger.error("Failed to list FHIR Patients: %s", exc)
         raise FhirClientError("Failed to retrieve patient list") from exc
+    return _bundle_resources(bundle), _bundle_next_link(bundle)
+
+
+def list_fhir_patients(
+    page_size: int = PATIENT_PAGE_SIZE,
+    elements: Iterable[str] | None = None,
+) -> list[dict[str, Any]]:
+    """List all FHIR Patient resources.
+
+    Args:
+        page_size (int): Number of patients to request per page.
+        elements (Iterable[str] | None): Top-level elements to return,
+            e.g. PATIENT_SUMMARY_ELEMENTS, or None for whole resources.
+
+    Returns:
+        list[dict]: List of patient resources as dictionaries.
+
+    Raises:
+        FhirClientError: If the FHIR server is unreachable or returns
+            an unexpected error.
+    """
+    patients, cursor = list_fhir_patients_page(page_size, elements=elements)
+    while cursor is not None:
+        page, cursor = list_fhir_patients_page(page_size, cursor)
+        patients.extend(page)
+    return patients
+
+
+_JSON_PATCH_HEADERS = {
+    **_FHIR_JSON_HEADERS,
+    "Content-Type": "application/json-patch+json",
+    "Prefer": "return=representation",
+}
+
+
+def _demographics_patch(
+    demographics: dict[str, Any], existing: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """Build JSON Patch operations for the provided demographics fields.
+
+    Each field replaces the whole element, as a full update would. ``add``
+    is used rather than ``replace`` so elements missing from the stored
+    resource are created instead of failing the patch. Given the stored
+    resource, elements that already hold the new value are left out.
+    """
+    operations: list[dict[str, Any]] = []
+
+    def _set(element: str, value: Any) -> None:
+        operations.append({"op": "add", "path": f"/{element}", "value": value})
+
+    if demographics.get("given_name") or demographics.get("family_name"):
+        _set(
+            "name",
+            [
+                {
+                    "use": "official",
+                    "given": [demographics.get("given_name", "")],
+                    "family": demographics.get("family_name", ""),
+                }
+            ],
+        )
+
+    if demographics.get("date_of_birth"):
+        _set("birthDate", demographics["date_of_birth"])
+
+    if demographics.get("sex"):
+        # Map to FHIR gender values
+        sex = demographics["sex"].lower()
+        _set("gender", sex if sex in _VALID_GENDERS else "unknown")
+
+    if demographics.get("address"):
+        addr_data = demographics["address"]
+        address = {
+            key: addr_data[key]
+            for key in ("line", "city", "state", "postalCode", "country")
+            if addr_data.get(key)
+        }
+        if address:
+            _set("address", [address])
+
+    if demographics.get("contact"):
+        contact_data = demographics["contact"]
+        telecoms = [
+            {"system": system, "value": contact_data[system]}
+            for system in ("phone", "email")
+            if contact_data.get(system)
+        ]
+        if telecoms:
+            _set("telecom", telecoms)
+
+    if existing is not None:
+        operations = [
+            op
+            for op in operations
+            if existing.get(op["path"][1:]) != op["value"]
+        ]
+    return operations
 
 
 def update_fhir_patient(
-    patient_id: str, demographics: dict[str, Any]
+    patient_id: str,
+    demographics: dict[str, Any],
+    *,
+    existing: dict[str, Any] | None = None,
 ) -> dict[str, Any] | None:
     """Update a FHIR Patient resource with demographics data.
 
@@ -302,88 +690,255 @@ def update_fhir_patient(
             - sex (str): Gender (male|female|other|unknown)
             - address (dict): Address information
             - contact (dict): Contact information
+        existing (dict | None): The resource, if the caller has already
+            read it. When it carries a versionId, fields that already hold
+            the requested value are left out of the patch, which is sent
+            with If-Match on that version. If nothing differs, the
+            resource is revalidated with a conditional read rather than
+            returned unchecked, as it may have changed since it was read.
 
     Returns:
         dict | None: Updated patient resource as dictionary, or None if not found.
 
     Raises:
-        Exception: If update fails.
+        FhirClientError: If the FHIR server rejects the update or cannot
+            be reached.
     """
+    # Only a versioned resource is diffed against: the version lets the
+    # server reject the patch if the resource has moved on since.
+    base = existing if _version_id(existing) else None
+    operations = _demographics_patch(demographics, base)
+    if not operations:
+        if base is None:
+            return read_fhir_patient(patient_id)
+        current = _fetch_patient(patient_id, base)
+        if current is None or current is base:
+            return current
+        base = current
+        operations = _demographics_patch(demographics, base)
+        if not operations:
+            return base
+
     fhir = get_fhir_client()
+    _patient_cache.pop(patient_id, None)
+    url = urljoin(fhir.server.base_uri, f"Patient/{patient_id}")
 
+    # One JSON Patch request instead of a read followed by a full PUT
     try:
-        # Read existing patient
-        patient = Patient.read(patient_id, fhir.server)
-
-        # Update name if provided
-        if demographics.get("given_name") or demographics.get("family_name"):
-            name = HumanName()
-            name.given = [demographics.get("given_name", "")]
-            name.family = demographics.get("family_name", "")
-            name.use = "official"
-            patient.name = [name]
-
-        # Update birth date if provided
-        if demographics.get("date_of_birth"):
-            patient.birthDate = FHIRDate(demographics["date_of_birth"])
-
-        # Update gender if provided
-        if demographics.get("sex"):
-            # Map to FHIR gender values
-            gender_map = {
-                "male": "male",
-                "female": "female",
-                "other": "other",
-                "unknown": "unknown",
-            }
-            patient.gender = gender_map.get(
-                demographics["sex"].lower(), "unknown"
+        response = fhir.server.session.patch(
+            url,
+            data=orjson.dumps(operations),
+            headers=_if_match_headers(_JSON_PATCH_HEADERS, base),
+        )
+        if response.status_code == 412:
+            # Changed since ``base`` was read; send every field instead
+            response = fhir.server.session.patch(
+                url,
+                data=orjson.dumps(_demographics_patch(demographics)),
+                headers=_JSON_PATCH_HEADERS,
             )
+        fhir.server.raise_for_status(response)
+        return orjson.loads(response.content)  # type: ignore[no-any-return]
+    except FHIRNotFoundException:
+        return None
+    except _FHIR_ERRORS as exc:
+        logger.error("Failed to update FHIR Patient %s: %s", patient_id, exc)
+        raise FhirClientError("Failed to update patient record") from exc
+
+
+# --- Async read path ---
+#
+# Used by async endpoints so FHIR I/O does not hold a threadpool worker.
+# Talks to the REST API directly rather than through fhirclient, whose
+# server object is requests-based.
+
+
+@lru_cache(maxsize=1)
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the shared async FHIR client, creating it on first use."""
+    return httpx.AsyncClient(
+        base_url=get_settings().FHIR_SERVER_URL,
+        headers={"Accept": "application/fhir+json"},
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+
+async def aclose_async_client() -> None:
+    """Close the shared async client if it has been created."""
+    if _get_async_client.cache_info().currsize:
+        await _get_async_client().aclose()
+        _get_async_client.cache_clear()
+
+
+async def aread_fhir_patient(patient_id: str) -> dict[str, Any] | None:
+    """Async variant of read_fhir_patient.
+
+    Args:
+        patient_id (str): FHIR Patient resource ID.
+
+    Returns:
+        dict | None: Patient resource as dictionary, or None if not found.
+
+    Raises:
+        FhirClientError: If the FHIR server is unreachable or returns
+            an unexpected error.
+    """
+    _require_clinical_services()
+    return await _afetch_patient(patient_id, _patient_cache.get(patient_id))
+
+
+async def _afetch_patient(
+    patient_id: str, cached: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """Async variant of _fetch_patient."""
+    try:
+        response = await _get_async_client().get(
+            f"Patient/{patient_id}", headers=_conditional_headers({}, cached)
+        )
+        if response.status_code == 304 and cached is not None:
+            return _remember_patient(patient_id, cached)
+        if response.status_code in (404, 410):
+            _patient_cache.pop(patient_id, None)
+            return None
+        response.raise_for_status()
+        resource = orjson.loads(response.content)
+    except (httpx.HTTPError, ValueError) as exc:
+        logger.error("Failed to read FHIR Patient %s: %s", patient_id, exc)
+        raise FhirClientError("Failed to retrieve patient record") from exc
+    return _remember_patient(patient_id, resource)
+
+
+async def alist_fhir_patients(
+    page_size: int = PATIENT_PAGE_SIZE,
+    elements: Iterable[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Async variant of list_fhir_patients.
+
+    Args:
+        page_size (int): Number of patients to request per page.
+        elements (Iterable[str] | None): Top-level elements to return,
+            or None for whole resources.
+
+    Returns:
+        list[dict]: List of patient resources as dictionaries.
 
-        # Update address if provided
-        if demographics.get("address"):
-            addr = Address()
-            addr_data = demographics["address"]
-            if addr_data.get("line"):
-                addr.line = addr_data["line"]
-            if addr_data.get("city"):
-                addr.city = addr_data["city"]
-            if addr_data.get("state"):
-                addr.state = addr_data["state"]
-            if addr_data.get("postalCode"):
-                addr.postalCode = addr_data["postalCode"]
-            if addr_data.get("country"):
-                addr.country = addr_data["country"]
-            patient.address = [addr]
-
-        # Update contact/telecom if provided
-        if demographics.get("contact"):
-            contact_data = demographics["contact"]
-            telecoms = []
-
-            if contact_data.get("phone"):
-                phone = ContactPoint()
-                phone.system = "phone"
-                phone.value = contact_data["phone"]
-                telecoms.append(phone)
-
-            if contact_data.get("email"):
-                email = ContactPoint()
-                email.system = "email"
-                email.value = contact_data["email"]
-                telecoms.append(email)
-
-            if telecoms:
-                patient.telecom = telecoms
-
-        # Save updates
-        patient.update(fhir.server)
-
-        return patient.as_json()  # type: ignore[no-any-return]
-    except Exception as exc:
-        exc_str = str(exc).lower()
-        if "not found" in exc_str or "404" in exc_str:
+    Raises:
+        FhirClientError: If the FHIR server is unreachable or returns
+            an unexpected error.
+    """
+    _require_clinical_services()
+
+    patients: list[dict[str, Any]] = []
+    url: str | None = _patient_search_path(page_size, elements)
+    try:
+        while url is not None:
+            response = await _get_async_client().get(url)
+            response.raise_for_status()
+            bundle = orjson.loads(response.content)
+            patients.extend(_bundle_resources(bundle))
+            url = _bundle_next_link(bundle)
+    except (httpx.HTTPError, ValueError, KeyError) as exc:
+        logger.error("Failed to list FHIR Patients: %s", exc)
+        raise FhirClientError("Failed to retrieve patient list") from exc
+    return patients
+
+
+async def acreate_fhir_patient(
+    given_name: str,
+    family_name: str,
+    birth_date: str | None = None,
+    gender: str | None = None,
+    nhs_number: str | None = None,
+    mrn: str | None = None,
+    patient_id: str | None = None,
+) -> dict[str, Any]:
+    """Async variant of create_fhir_patient.
+
+    Returns:
+        dict: Created patient resource as dictionary.
+
+    Raises:
+        ValueError: If required fields are empty or invalid.
+        FhirClientError: If the FHIR server rejects the resource or cannot
+            be reached.
+    """
+    resource = _patient_resource(
+        given_name,
+        family_name,
+        birth_date=birth_date,
+        gender=gender,
+        nhs_number=nhs_number,
+        mrn=mrn,
+        patient_id=patient_id,
+    )
+    patient_uuid = resource["id"]
+    _require_clinical_services()
+
+    _patient_cache.pop(patient_uuid, None)
+    try:
+        response = await _get_async_client().put(
+            f"Patient/{patient_uuid}",
+            content=orjson.dumps(resource),
+            headers=_FHIR_PUT_HEADERS,
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as exc:
+        logger.error("Failed to create FHIR Patient %s: %s", patient_uuid, exc)
+        raise FhirClientError("Failed to create patient record") from exc
+    return resource
+
+
+async def aupdate_fhir_patient(
+    patient_id: str,
+    demographics: dict[str, Any],
+    *,
+    existing: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    """Async variant of update_fhir_patient.
+
+    Returns:
+        dict | None: Updated patient resource as dictionary, or None if not
+            found.
+
+    Raises:
+        FhirClientError: If the FHIR server rejects the update or cannot
+            be reached.
+    """
+    base = existing if _version_id(existing) else None
+    operations = _demographics_patch(demographics, base)
+    if not operations:
+        if base is None:
+            return await aread_fhir_patient(patient_id)
+        _require_clinical_services()
+        current = await _afetch_patient(patient_id, base)
+        if current is None or current is base:
+            return current
+        base = current
+        operations = _demographics_patch(demographics, base)
+        if not operations:
+            return base
+
+    _require_clinical_services()
+    _patient_cache.pop(patient_id, None)
+    client = _get_async_client()
+    try:
+        response = await client.patch(
+            f"Patient/{patient_id}",
+            content=orjson.dumps(operations),
+            headers=_if_match_headers(_JSON_PATCH_HEADERS, base),
+        )
+        if response.status_code == 412:
+            # Changed since ``base`` was read; send every field instead
+            response = await client.patch(
+                f"Patient/{patient_id}",
+                content=orjson.dumps(_demographics_patch(demographics)),
+                headers=_JSON_PATCH_HEADERS,
+            )
+        if response.status_code in (404, 410):
             return None
+        response.raise_for_status()
+        return orjson.loads(response.content)  # type: ignore[no-any-return]
+    except (httpx.HTTPError, ValueError) as exc:
         logger.error("Failed to update FHIR Patient %s: %s", patient_id, exc)
         raise FhirClientError("Failed to update patient record") from exc
 
@@ -447,7 +1002,7 @@ def create_fhir_communication(
                 }
             ],
         },
-        "sent": FHIRDateTime(datetime_module_now_utc_iso()).as_json(),
+        "sent": datetime_module_now_utc_iso(),
         "payload": [{"contentString": body}],
         "extension": [
             {
@@ -473,8 +1028,8 @@ def create_fhir_communication(
         )
 
     try:
-        fhir.server.put_json(f"Communication/{comm_uuid}", resource)
-    except Exception as exc:
+        _put_json(fhir, f"Communication/{comm_uuid}", resource)
+    except _FHIR_ERRORS as exc:
         logger.error(
             "Failed to create FHIR Communication %s: %s",
             comm_uuid,
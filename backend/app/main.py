@@ -24,7 +24,7 @@ Architecture:
 import hmac
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -40,31 +40,39 @@ from fastapi import (
     Response,
 )
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select, union
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, lazyload
 
 from app.cbac.decorators import has_competency
 from app.config import settings
 from app.db import get_session
+from app.deps import DEP_CURRENT_USER, USER_BY_USERNAME, warm_user_lookup
 from app.ehrbase_client import (
     EhrbaseClientError,
-    create_letter_composition,
-    get_letter_composition,
-    list_letters_for_patient,
+    aclose_async_client,
+    acreate_letter_composition,
+    aget_letter_composition,
+    alist_letters_for_patient,
 )
 from app.email_send import send_email
 from app.fhir_client import (
+    PATIENT_SUMMARY_ELEMENTS,
     FhirClientError,
     FhirCommunicationError,
-    create_fhir_patient,
+    acreate_fhir_patient,
+    aread_fhir_patient,
+    aupdate_fhir_patient,
     list_fhir_patients,
     read_fhir_patient,
-    update_fhir_patient,
+    read_fhir_patients,
 )
+from app.fhir_client import aclose_async_client as aclose_fhir_async_client
 from app.log_context import request_id_var, user_id_var
 from app.logging_config import setup_logging
 from app.messaging import (
@@ -171,6 +179,7 @@ app = FastAPI(
     redoc_url=f"{settings.API_PREFIX}/redoc" if DEV_MODE else None,
     openapi_url=f"{settings.API_PREFIX}/openapi.json" if DEV_MODE else None,
     swagger_ui_parameters={"persistAuthorization": True},
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -212,9 +221,7 @@ async def fhir_client_error_handler(
     request: Request, exc: FhirClientError
 ) -> Response:
     """Return a clean 502 response for FHIR service failures."""
-    from fastapi.responses import JSONResponse
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=502,
         content={"detail": str(exc)},
     )
@@ -226,9 +233,7 @@ async def ehrbase_client_error_handler(
     request: Request, exc: EhrbaseClientError
 ) -> Response:
     """Return a clean 502 response for EHRbase service failures."""
-    from fastapi.responses import JSONResponse
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=502,
         content={"detail": str(exc)},
     )
@@ -283,13 +288,37 @@ app.include_router(push_send_router)
 DEP_GET_SESSION = Depends(get_session)
 
 
-# Type the cookie kwargs properly to avoid mypy complaints
-COOKIE_KW: dict[str, Any] = {
-    "httponly": True,
-    "samesite": "lax",
-    "secure": settings.SECURE_COOKIES,
-    "domain": settings.COOKIE_DOMAIN,
-}
+def _cookie_attrs(path: str, *, httponly: bool) -> str:
+    """Build the attribute part of an auth Set-Cookie header value."""
+    attrs = ""
+    if settings.COOKIE_DOMAIN:
+        attrs += f"; Domain={settings.COOKIE_DOMAIN}"
+    if httponly:
+        attrs += "; HttpOnly"
+    attrs += f"; Path={path}; SameSite=lax"
+    if settings.SECURE_COOKIES:
+        attrs += "; Secure"
+    return attrs
+
+
+# Cookie attributes are fixed for the life of the process, so the
+# Set-Cookie suffixes are formatted once rather than on every login.
+_REFRESH_COOKIE_PATH = f"{settings.API_PREFIX}/auth/refresh"
+_ACCESS_COOKIE_ATTRS = _cookie_attrs("/", httponly=True)
+_REFRESH_COOKIE_ATTRS = _cookie_attrs(_REFRESH_COOKIE_PATH, httponly=True)
+_XSRF_COOKIE_ATTRS = _cookie_attrs("/", httponly=False)
+
+# Logout overwrites each cookie with an empty, already-expired one. The
+# expiry is a fixed past date, so the headers are complete at import.
+_EXPIRED = "; Max-Age=0; expires=Thu, 01 Jan 1970 00:00:00 GMT"
+_CLEAR_AUTH_COOKIE_HEADERS = tuple(
+    (b"set-cookie", f'{name}=""{_EXPIRED}{attrs}'.encode())
+    for name, attrs in (
+        ("access_token", _ACCESS_COOKIE_ATTRS),
+        ("refresh_token", _REFRESH_COOKIE_ATTRS),
+        ("XSRF-TOKEN", _XSRF_COOKIE_ATTRS),
+    )
+)
 
 
 def require_clinical_services() -> None:
@@ -369,6 +398,12 @@ async def startup_event() -> None:
     print("Quill Medical Backend Starting...")
     print("=" * 60)
 
+    try:
+        warm_user_lookup(settings.CORE_DB_POOL_SIZE)
+        print("✓ Core database pool is warm")
+    except Exception as e:
+        print(f"✗ WARNING: Core database warm-up failed - {e}")
+
     if settings.CLINICAL_SERVICES_ENABLED:
         fhir_status = check_fhir_health()
         if fhir_status["available"]:
@@ -395,6 +430,13 @@ async def startup_event() -> None:
     print("=" * 60 + "\n")
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Release pooled EHRbase and FHIR connections."""
+    await aclose_async_client()
+    await aclose_fhir_async_client()
+
+
 def set_auth_cookies(
     response: Response, access: str, refresh: str, xsrf: str
 ) -> None:
@@ -416,21 +458,22 @@ def set_auth_cookies(
         refresh: Encoded JWT refresh token.
         xsrf: CSRF protection token.
     """
-    response.set_cookie("access_token", access, path="/", **COOKIE_KW)
-    response.set_cookie(
-        "refresh_token",
-        refresh,
-        path=f"{settings.API_PREFIX}/auth/refresh",
-        **COOKIE_KW,
-    )
-    response.set_cookie(
-        "XSRF-TOKEN",
-        xsrf,
-        path="/",
-        httponly=False,
-        samesite="lax",
-        secure=settings.SECURE_COOKIES,
-        domain=settings.COOKIE_DOMAIN,
+    # Token values are URL-safe base64, so they need no cookie quoting
+    response.raw_headers.extend(
+        (
+            (
+                b"set-cookie",
+                f"access_token={access}{_ACCESS_COOKIE_ATTRS}".encode(),
+            ),
+            (
+                b"set-cookie",
+                f"refresh_token={refresh}{_REFRESH_COOKIE_ATTRS}".encode(),
+            ),
+            (
+                b"set-cookie",
+                f"XSRF-TOKEN={xsrf}{_XSRF_COOKIE_ATTRS}".encode(),
+            ),
+        )
     )
 
 
@@ -444,17 +487,7 @@ def clear_auth_cookies(response: Response) -> None:
     Args:
         response: FastAPI response object to clear cookies from.
     """
-    response.delete_cookie(
-        "access_token", path="/", domain=settings.COOKIE_DOMAIN
-    )
-    response.delete_cookie(
-        "refresh_token",
-        path=f"{settings.API_PREFIX}/auth/refresh",
-        domain=settings.COOKIE_DOMAIN,
-    )
-    response.delete_cookie(
-        "XSRF-TOKEN", path="/", domain=settings.COOKIE_DOMAIN
-    )
+    response.raw_headers.extend(_CLEAR_AUTH_COOKIE_HEADERS)
 
 
 @router.get("/health")
@@ -495,51 +528,9 @@ def health_check() -> dict[str, Any]:
     }
 
 
-def current_user(request: Request, db: Session = DEP_GET_SESSION) -> User:
-    """Get Currently Authenticated User.
-
-    FastAPI dependency that extracts and validates the JWT access token from
-    cookies, then loads the corresponding user from the database. The user's
-    roles are stored in request.state for authorization checks.
-
-    Token Validation:
-    - Checks for access_token cookie presence
-    - Verifies JWT signature and expiration
-    - Loads user from database by username
-    - Verifies user account is active
-
-    Args:
-        request: Incoming FastAPI request with cookies.
-        db: Active SQLAlchemy database session.
-
-    Returns:
-        User: The authenticated and active user with roles loaded.
-
-    Raises:
-        HTTPException: 401 if token missing, invalid, expired, or user inactive.
-    """
-    tok = request.cookies.get("access_token")
-    if not tok:
-        raise HTTPException(401, "Not authenticated")
-    try:
-        payload = decode_token(tok)
-    except Exception as e:
-        raise HTTPException(401, "Invalid token") from e
-    sub = payload.get("sub")
-    user = db.scalar(select(User).where(User.username == sub))
-    if not user or not user.is_active:
-        raise HTTPException(401, "Inactive user")
-    # Reject tokens minted before a password change
-    if payload.get("tv", 0) != user.token_version:
-        raise HTTPException(401, "Session invalidated")
-    request.state.roles = [r.name for r in user.roles]
-    return user
-
-
-DEP_CURRENT_USER = Depends(current_user)
-
-
-def require_roles(*need: str) -> Callable[[Request, User], User]:
+def require_roles(
+    *need: str, csrf: bool = False
+) -> Callable[[Request, User], Awaitable[User]]:
     """Create Role Authorization Dependency.
 
     Factory function that creates a FastAPI dependency to enforce role-based
@@ -552,6 +543,8 @@ def require_roles(*need: str) -> Callable[[Request, User], User]:
 
     Args:
         *need: One or more role names required (e.g., "Clinician", "Administrator").
+        csrf: Also validate the CSRF token, as require_csrf does. One
+            combined dependency is cheaper to resolve than two.
 
     Returns:
         Callable: FastAPI dependency function that validates roles.
@@ -560,16 +553,20 @@ def require_roles(*need: str) -> Callable[[Request, User], User]:
         HTTPException: 403 Forbidden if user lacks any required role.
     """
 
-    def dep(request: Request, _u: User = DEP_CURRENT_USER) -> User:
-        have = set(getattr(request.state, "roles", []))
-        if not set(need).issubset(have):
+    need_set = frozenset(need)
+
+    # No I/O here, so stay on the event loop rather than the threadpool
+    async def dep(request: Request, _u: User = DEP_CURRENT_USER) -> User:
+        if not need_set <= getattr(request.state, "roles", frozenset()):
             raise HTTPException(403, "Forbidden")
+        if csrf:
+            return await require_csrf(request, _u)
         return _u
 
     return dep
 
 
-def require_csrf(request: Request, u: User = DEP_CURRENT_USER) -> User:
+async def require_csrf(request: Request, u: User = DEP_CURRENT_USER) -> User:
     """Validate CSRF Token.
 
     FastAPI dependency that validates CSRF tokens to protect against cross-site
@@ -592,21 +589,25 @@ def require_csrf(request: Request, u: User = DEP_CURRENT_USER) -> User:
 
     Raises:
         HTTPException: 403 Forbidden if CSRF validation fails.
+
+    Declared async because it does no I/O (current_user has already loaded
+    u), so it runs on the event loop instead of in the threadpool.
     """
     header = request.headers.get("x-csrf-token")
     cookie = request.cookies.get("XSRF-TOKEN")
     if (
         not header
         or not cookie
-        or header != cookie
+        # Constant-time, so the match leaks nothing through timing
+        or not hmac.compare_digest(header.encode(), cookie.encode())
         or not verify_csrf(cookie, u.username)
     ):
         raise HTTPException(403, "CSRF failed")
     return u
 
 
-DEP_REQUIRE_ROLES_CLINICIAN = Depends(require_roles("Clinician"))
 DEP_REQUIRE_CSRF = Depends(require_csrf)
+DEP_REQUIRE_CLINICIAN_CSRF = Depends(require_roles("Clinician", csrf=True))
 
 
 @router.post("/auth/login")
@@ -646,9 +647,7 @@ def login(
         HTTPException: 400 if credentials invalid, 2FA required, or TOTP code invalid.
     """
 
-    user = db.scalar(
-        select(User).where(User.username == data.username.strip())
-    )
+    user = db.scalar(USER_BY_USERNAME, {"username": data.username.strip()})
 
     if not user or not verify_password(data.password, user.password_hash):
         raise HTTPException(400, "Invalid credentials")
@@ -945,19 +944,17 @@ def register(
         )
 
     # Use generic message to prevent account enumeration
-    existing = db.scalar(select(User).where(User.username == username))
-    if existing:
-        raise HTTPException(
-            status_code=400,
-            detail="Username or email already in use",
-        )
-
-    existing = db.scalar(select(User).where(User.email == email))
-    if existing:
-        raise HTTPException(
-            status_code=400,
-            detail="Username or email already in use",
-        )
+    in_use = HTTPException(
+        status_code=400,
+        detail="Username or email already in use",
+    )
+    existing = db.scalar(
+        select(User.id)
+        .where(or_(User.username == username, User.email == email))
+        .limit(1)
+    )
+    if existing is not None:
+        raise in_use
 
     user = User(
         username=username,
@@ -977,7 +974,12 @@ def register(
         user.base_profession = "learner"
 
     db.add(user)
-    db.flush()  # Assigns user.id so we can create memberships
+    try:
+        db.flush()  # Assigns user.id so we can create memberships
+    except IntegrityError as e:
+        # Lost a race with a concurrent signup for the same name/email
+        db.rollback()
+        raise in_use from e
 
     # Add the user to the selected organisation
     if payload.organisation_id is not None:
@@ -1330,12 +1332,14 @@ def create_user_with_cbac(
         )
 
     # Check uniqueness
-    existing = db.scalar(select(User).where(User.username == username))
-    if existing:
+    clashes = db.execute(
+        select(User.username, User.email).where(
+            or_(User.username == username, User.email == email)
+        )
+    ).all()
+    if any(row.username == username for row in clashes):
         raise HTTPException(status_code=400, detail="Username already exists")
-
-    existing = db.scalar(select(User).where(User.email == email))
-    if existing:
+    if clashes:
         raise HTTPException(status_code=400, detail="Email already exists")
 
     # Validate organisation access for non-superadmins
@@ -1806,18 +1810,16 @@ def totp_setup(
     Returns:
         TotpSetupOut: Provisioning URI encoded with issuer and account name.
     """
-    if not getattr(u, "totp_secret", None):
-        u.totp_secret = generate_totp_secret()
-
-    db.add(u)
-    db.commit()
+    # Read what the URI needs before committing, since the commit expires
+    # u and touching it afterwards would reload the row.
+    secret = u.totp_secret
+    username = u.username
+    if not secret:
+        secret = u.totp_secret = generate_totp_secret()
+        db.commit()
     issuer = getattr(settings, "PROJECT_NAME", "Quill")
-    uri = totp_provisioning_uri(
-        u.totp_secret or "",
-        u.username,
-        issuer=issuer,
-    )
-    return TotpSetupOut(provision_uri=uri)
+    uri = totp_provisioning_uri(secret, username, issuer=issuer)
+    return TotpSetupOut.model_construct(provision_uri=uri)
 
 
 class TotpVerifyIn(BaseModel):
@@ -1886,9 +1888,9 @@ def totp_verify(
             status_code=400,
             detail={"message": "Invalid code", "error_code": "invalid_totp"},
         )
-    u.is_totp_enabled = True
-    db.add(u)
-    db.commit()
+    if not u.is_totp_enabled:
+        u.is_totp_enabled = True
+        db.commit()
     return {"detail": "enabled"}
 
 
@@ -1925,7 +1927,6 @@ def totp_disable(
         raise HTTPException(status_code=400, detail="Incorrect password")
     u.is_totp_enabled = False
     u.totp_secret = None
-    db.add(u)
     db.commit()
     return {"detail": "disabled"}
 
@@ -2034,45 +2035,26 @@ def me(
             - enabled_features: Features enabled on user's primary org
             - competencies: Resolved CBAC competency IDs
     """
-    # Resolve features from all user's organisations (union)
-    # Direct org membership
-    direct_org_ids = set(
-        db.execute(
-            select(organisation_staff_member.c.organisation_id).where(
-                organisation_staff_member.c.user_id == u.id,
-            )
+    # Resolve features from all user's organisations (union): direct org
+    # membership plus orgs linked to the user's sites, in a single query.
+    user_org_ids = union(
+        select(organisation_staff_member.c.organisation_id).where(
+            organisation_staff_member.c.user_id == u.id,
+        ),
+        select(organisation_site.c.organisation_id)
+        .join(
+            site_staff_member,
+            site_staff_member.c.site_id == organisation_site.c.site_id,
         )
-        .scalars()
-        .all()
+        .where(site_staff_member.c.user_id == u.id),
     )
-    # Indirect via site → org linkage
-    site_org_ids = set(
+    enabled_features = list(
         db.execute(
-            select(organisation_site.c.organisation_id)
-            .join(
-                site_staff_member,
-                site_staff_member.c.site_id == organisation_site.c.site_id,
-            )
-            .where(site_staff_member.c.user_id == u.id)
-        )
-        .scalars()
-        .all()
+            select(OrganisationFeature.feature_key)
+            .where(OrganisationFeature.organisation_id.in_(user_org_ids))
+            .distinct()
+        ).scalars()
     )
-    user_org_ids = list(direct_org_ids | site_org_ids)
-    enabled_features: list[str] = []
-    if user_org_ids:
-        features = (
-            db.execute(
-                select(OrganisationFeature.feature_key)
-                .where(
-                    OrganisationFeature.organisation_id.in_(user_org_ids),
-                )
-                .distinct()
-            )
-            .scalars()
-            .all()
-        )
-        enabled_features = list(features)
 
     return {
         "id": u.id,
@@ -2084,7 +2066,7 @@ def me(
         "totp_enabled": u.is_totp_enabled,
         "enabled_features": enabled_features,
         "clinical_services_enabled": settings.CLINICAL_SERVICES_ENABLED,
-        "competencies": u.get_final_competencies(),
+        "competencies": sorted(u.get_final_competencies()),
     }
 
 
@@ -2190,7 +2172,11 @@ def list_users(
             return {"users": []}
 
         users = (
-            db.execute(select(User).where(User.id.in_(all_ids)))
+            db.execute(
+                select(User)
+                .options(lazyload(User.roles))
+                .where(User.id.in_(all_ids))
+            )
             .scalars()
             .unique()
             .all()
@@ -2226,6 +2212,8 @@ def list_users(
         stmt = select(User).where(User.system_permissions.in_(allowed))
     else:
         stmt = select(User)
+    # Roles are not part of the listing; skip the eager roles join
+    stmt = stmt.options(lazyload(User.roles))
 
     # Exclude users who are already staff of the given organisation
     if exclude_org is not None:
@@ -2448,7 +2436,7 @@ def refresh(
     except Exception as e:
         raise HTTPException(401, "Bad refresh token") from e
     sub = payload.get("sub")
-    user = db.scalar(select(User).where(User.username == sub))
+    user = db.scalar(USER_BY_USERNAME, {"username": sub})
     if not user or not user.is_active:
         raise HTTPException(401, "Inactive user")
     # Reject refresh tokens minted before a password change
@@ -2471,11 +2459,10 @@ def refresh(
     "/patients/verify",
     dependencies=[
         DEP_REQUIRE_CLINICAL,
-        DEP_REQUIRE_ROLES_CLINICIAN,
-        DEP_REQUIRE_CSRF,
+        DEP_REQUIRE_CLINICIAN_CSRF,
     ],
 )
-def create_patient_record(patient_id: str) -> dict[str, str]:
+async def create_patient_record(patient_id: str) -> dict[str, str]:
     """Create or Verify Patient in FHIR.
 
     Verifies that a patient exists in the FHIR server before allowing clinical
@@ -2497,7 +2484,7 @@ def create_patient_record(patient_id: str) -> dict[str, str]:
     """
     try:
         # Check if patient exists in FHIR
-        patient = read_fhir_patient(patient_id)
+        patient = await aread_fhir_patient(patient_id)
         if not patient:
             raise HTTPException(
                 status_code=404, detail="Patient not found in FHIR server"
@@ -2515,7 +2502,7 @@ def list_patients(
     scope: str | None = None,
     u: User = DEP_CURRENT_USER,
     db: Session = DEP_GET_SESSION,
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """List patients from FHIR, filtered by organisation membership.
 
     By default, staff see only patients in their organisation(s).
@@ -2529,16 +2516,11 @@ def list_patients(
         db: Database session.
 
     Returns:
-        dict: Response with patients array and fhir_ready flag.
+        ORJSONResponse: Body with patients array and fhir_ready flag. The
+            FHIR resources are already plain JSON, so they are serialised
+            directly rather than validated as a response model.
     """
     try:
-        patients = list_fhir_patients()
-
-        # Fetch all patient metadata from database
-        stmt = select(PatientMetadata)
-        metadata_records = db.execute(stmt).scalars().all()
-        metadata_map = {m.patient_id: m.is_active for m in metadata_records}
-
         # Determine which patients are accessible
         is_admin = u.system_permissions in ["admin", "superadmin"]
         admin_scope = scope == "admin" and is_admin
@@ -2549,6 +2531,21 @@ def list_patients(
         else:
             accessible_ids = get_accessible_patient_ids(db, u)
 
+        # Org-scoped users only need their own patients, fetched by id
+        if accessible_ids is None:
+            patients = list_fhir_patients(elements=PATIENT_SUMMARY_ELEMENTS)
+        elif accessible_ids:
+            patients = list(read_fhir_patients(accessible_ids).values())
+        else:
+            patients = []
+
+        # Only the activation flag is needed, and for org-scoped users only
+        # for their own patients, so fetch those two columns in one query
+        stmt = select(PatientMetadata.patient_id, PatientMetadata.is_active)
+        if accessible_ids is not None:
+            stmt = stmt.where(PatientMetadata.patient_id.in_(accessible_ids))
+        metadata_map = dict(db.execute(stmt).tuples().all())
+
         # Enrich patients with activation status and filter
         enriched_patients = []
         for patient in patients:
@@ -2564,25 +2561,26 @@ def list_patients(
 
             # Filter based on activation status
             if is_active or (include_inactive and is_admin):
-                patient["is_active"] = is_active
-                enriched_patients.append(patient)
+                # Copy: the resource may be the patient cache's own dict
+                enriched_patients.append({**patient, "is_active": is_active})
 
-        return {"patients": enriched_patients, "fhir_ready": True}
+        return ORJSONResponse(
+            {"patients": enriched_patients, "fhir_ready": True}
+        )
     except FhirClientError:
         raise
     except Exception:
-        return {"patients": [], "fhir_ready": False}
+        return ORJSONResponse({"patients": [], "fhir_ready": False})
 
 
 @router.put(
     "/patients/{patient_id}/demographics",
     dependencies=[
         DEP_REQUIRE_CLINICAL,
-        DEP_REQUIRE_ROLES_CLINICIAN,
-        DEP_REQUIRE_CSRF,
+        DEP_REQUIRE_CLINICIAN_CSRF,
     ],
 )
-def upsert_demographics(
+async def upsert_demographics(
     patient_id: str, demographics: dict[str, Any], u: User = DEP_CURRENT_USER
 ) -> dict[str, str | Any]:
     """Update Patient Demographics in FHIR.
@@ -2608,7 +2606,7 @@ def upsert_demographics(
         HTTPException: 500 if FHIR update operation fails.
     """
     try:
-        result = update_fhir_patient(patient_id, demographics)
+        result = await aupdate_fhir_patient(patient_id, demographics)
         if result is None:
             raise HTTPException(status_code=404, detail="Patient not found")
         return {"patient_id": patient_id, "updated": True, "data": result}
@@ -2622,9 +2620,9 @@ def upsert_demographics(
     "/patients/{patient_id}/demographics",
     dependencies=[DEP_REQUIRE_CLINICAL],
 )
-def get_demographics(
+async def get_demographics(
     patient_id: str, u: User = DEP_CURRENT_USER
-) -> dict[str, str | Any]:
+) -> ORJSONResponse:
     """Get Patient Demographics from FHIR.
 
     Retrieves complete demographic information for a specific patient from the
@@ -2636,7 +2634,7 @@ def get_demographics(
         u: Currently authenticated user (any role can read demographics).
 
     Returns:
-        dict: Patient demographics response with keys:
+        ORJSONResponse: Patient demographics response with keys:
             - patient_id: The requested patient ID
             - data: Complete FHIR Patient resource
 
@@ -2645,10 +2643,10 @@ def get_demographics(
         HTTPException: 500 if FHIR read operation fails.
     """
     try:
-        patient = read_fhir_patient(patient_id)
+        patient = await aread_fhir_patient(patient_id)
         if patient is None:
             raise HTTPException(status_code=404, detail="Patient not found")
-        return {"patient_id": patient_id, "data": patient}
+        return ORJSONResponse({"patient_id": patient_id, "data": patient})
     except HTTPException:
         raise
     except Exception as e:
@@ -2659,11 +2657,12 @@ def get_demographics(
     "/patients/{patient_id}/letters",
     dependencies=[
         DEP_REQUIRE_CLINICAL,
-        DEP_REQUIRE_ROLES_CLINICIAN,
-        DEP_REQUIRE_CSRF,
+        DEP_REQUIRE_CLINICIAN_CSRF,
     ],
 )
-def write_letter(patient_id: str, letter: LetterIn) -> dict[str, str]:
+async def write_letter(
+    patient_id: str, letter: LetterIn
+) -> dict[str, str | None]:
     """Create Clinical Letter in OpenEHR.
 
     Creates a new clinical letter composition in EHRbase for the specified patient.
@@ -2691,15 +2690,16 @@ def write_letter(patient_id: str, letter: LetterIn) -> dict[str, str]:
         HTTPException: 500 if EHR creation or composition write fails.
     """
     try:
-        result = create_letter_composition(
+        result = await acreate_letter_composition(
             patient_id=patient_id,
             title=letter.title,
             body=letter.body,
             author_name=letter.author_name,
         )
+        uid = result.get("uid")
         return {
             "patient_id": patient_id,
-            "composition_uid": result.get("uid", {}).get("value"),
+            "composition_uid": uid.get("value") if uid else None,
             "title": letter.title,
         }
     except Exception as e:
@@ -2710,9 +2710,9 @@ def write_letter(patient_id: str, letter: LetterIn) -> dict[str, str]:
     "/patients/{patient_id}/letters/{composition_uid}",
     dependencies=[DEP_REQUIRE_CLINICAL],
 )
-def read_letter(
+async def read_letter(
     patient_id: str, composition_uid: str, u: User = DEP_CURRENT_USER
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Read Specific Clinical Letter from OpenEHR.
 
     Retrieves a specific clinical letter composition from EHRbase by its
@@ -2725,7 +2725,7 @@ def read_letter(
         u: Currently authenticated user (any role can read letters).
 
     Returns:
-        dict: Letter retrieval response with keys:
+        ORJSONResponse: Letter retrieval response with keys:
             - patient_id: The patient ID
             - composition_uid: The composition UID
             - data: Complete OpenEHR Composition structure
@@ -2735,14 +2735,18 @@ def read_letter(
         HTTPException: 500 if EHRbase read operation fails.
     """
     try:
-        composition = get_letter_composition(patient_id, composition_uid)
+        composition = await aget_letter_composition(
+            patient_id, composition_uid
+        )
         if composition is None:
             raise HTTPException(status_code=404, detail="Letter not found")
-        return {
-            "patient_id": patient_id,
-            "composition_uid": composition_uid,
-            "data": composition,
-        }
+        return ORJSONResponse(
+            {
+                "patient_id": patient_id,
+                "composition_uid": composition_uid,
+                "data": composition,
+            }
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -2753,9 +2757,9 @@ def read_letter(
     "/patients/{patient_id}/letters",
     dependencies=[DEP_REQUIRE_CLINICAL],
 )
-def list_letters(
+async def list_letters(
     patient_id: str, u: User = DEP_CURRENT_USER
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """List All Clinical Letters for Patient.
 
     Retrieves all clinical letter compositions for a specific patient from
@@ -2768,7 +2772,7 @@ def list_letters(
         u: Currently authenticated user (any role can list letters).
 
     Returns:
-        dict: Letter list response with keys:
+        ORJSONResponse: Letter list response with keys:
             - patient_id: The patient ID
             - letters: Array of letter metadata (UID, title, created date)
 
@@ -2776,8 +2780,8 @@ def list_letters(
         HTTPException: 500 if EHRbase query fails.
     """
     try:
-        letters = list_letters_for_patient(patient_id)
-        return {"patient_id": patient_id, "letters": letters}
+        letters = await alist_letters_for_patient(patient_id)
+        return ORJSONResponse({"patient_id": patient_id, "letters": letters})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -2817,7 +2821,7 @@ class FHIRPatientCreateIn(BaseModel):
     "/patients",
     dependencies=[DEP_REQUIRE_CLINICAL, DEP_REQUIRE_CSRF],
 )
-def create_patient_in_fhir(
+async def create_patient_in_fhir(
     data: FHIRPatientCreateIn, u: User = DEP_CURRENT_USER
 ) -> dict[str, Any]:
     """Create New Patient in FHIR Server.
@@ -2837,7 +2841,7 @@ def create_patient_in_fhir(
         HTTPException: 500 if FHIR patient creation fails.
     """
     try:
-        patient = create_fhir_patient(
+        patient = await acreate_fhir_patient(
             given_name=data.given_name,
             family_name=data.family_name,
             birth_date=data.birth_date,
@@ -2857,7 +2861,9 @@ def create_patient_in_fhir(
     "/patients/{patient_id}",
     dependencies=[DEP_REQUIRE_CLINICAL],
 )
-def get_patient(patient_id: str, u: User = DEP_CURRENT_USER) -> dict[str, Any]:
+async def get_patient(
+    patient_id: str, u: User = DEP_CURRENT_USER
+) -> ORJSONResponse:
     """Get Single Patient from FHIR.
 
     Retrieves a specific patient's demographics from the FHIR server by ID.
@@ -2870,19 +2876,18 @@ def get_patient(patient_id: str, u: User = DEP_CURRENT_USER) -> dict[str, Any]:
         u: Currently authenticated user (any role can view patients).
 
     Returns:
-        dict: Complete FHIR Patient resource.
+        ORJSONResponse: Complete FHIR Patient resource, serialised as is
+            rather than re-encoded through jsonable_encoder.
 
     Raises:
         HTTPException: 404 if patient not found in FHIR server.
         HTTPException: 500 if FHIR server communication fails.
     """
     try:
-        patient = read_fhir_patient(patient_id)
+        patient = await aread_fhir_patient(patient_id)
         if not patient:
             raise HTTPException(status_code=404, detail="Patient not found")
-        # Mypy type narrowing: patient is now guaranteed to be dict[str, Any]
-        assert patient is not None
-        return patient
+        return ORJSONResponse(patient)
     except HTTPException:
         raise
     except Exception as e:
@@ -2895,7 +2900,7 @@ def get_patient(patient_id: str, u: User = DEP_CURRENT_USER) -> dict[str, Any]:
     "/patients/{patient_id}",
     dependencies=[DEP_REQUIRE_CLINICAL, DEP_REQUIRE_CSRF],
 )
-def update_patient(
+async def update_patient(
     patient_id: str,
     data: FHIRPatientCreateIn,
     u: User = DEP_CURRENT_USER,
@@ -2920,7 +2925,7 @@ def update_patient(
     """
     try:
         # Read existing patient to verify it exists
-        existing = read_fhir_patient(patient_id)
+        existing = await aread_fhir_patient(patient_id)
         if not existing:
             raise HTTPException(status_code=404, detail="Patient not found")
 
@@ -2965,7 +2970,9 @@ def update_patient(
             updates["identifier"] = identifiers
 
         # Perform update
-        updated_patient = update_fhir_patient(patient_id, updates)
+        updated_patient = await aupdate_fhir_patient(
+            patient_id, updates, existing=existing
+        )
         if not updated_patient:
             raise HTTPException(
                 status_code=500, detail="Failed to update patient"
@@ -3226,7 +3233,7 @@ async def get_my_competencies(
         base_profession=user.base_profession,
         additional_competencies=user.additional_competencies or [],
         removed_competencies=user.removed_competencies or [],
-        final_competencies=user.get_final_competencies(),
+        final_competencies=sorted(user.get_final_competencies()),
     )
 
 
@@ -3278,7 +3285,7 @@ async def prescribe_controlled(
     tags=["cbac"],
     dependencies=[DEP_REQUIRE_CSRF],
 )
-async def update_my_competencies(
+def update_my_competencies(
     data: UpdateCompetenciesRequest,
     user: User = DEP_CURRENT_USER,
     db: Session = DEP_GET_SESSION,
@@ -3320,7 +3327,7 @@ async def update_my_competencies(
         base_profession=user.base_profession,
         additional_competencies=user.additional_competencies or [],
         removed_competencies=user.removed_competencies or [],
-        final_competencies=user.get_final_competencies(),
+        final_competencies=sorted(user.get_final_competencies()),
     )
 
 
@@ -4953,7 +4960,7 @@ def list_conversations_endpoint(
         status=status,
         patient_id=patient_id,
     )
-    return ConversationListOut(conversations=items)
+    return ConversationListOut.model_construct(conversations=items)
 
 
 @router.get(
@@ -4987,7 +4994,7 @@ def list_patient_conversations_endpoint(
         user=u,
         status=status,
     )
-    return ConversationListOut(conversations=items)
+    return ConversationListOut.model_construct(conversations=items)
 
 
 @router.get(
@@ -5076,7 +5083,7 @@ def update_conversation_status_endpoint(
         if conv.messages
         else None
     )
-    return ConversationOut(
+    return ConversationOut.model_construct(
         id=conv.id,
         fhir_conversation_id=conv.fhir_conversation_id,
         patient_id=conv.patient_id,
@@ -5085,7 +5092,7 @@ def update_conversation_status_endpoint(
         created_at=conv.created_at,
         updated_at=conv.updated_at,
         participants=[
-            ParticipantOut(
+            ParticipantOut.model_construct(
                 user_id=p.user_id,
                 username=p.user.username,
                 display_name=p.user.username,
@@ -5227,7 +5234,7 @@ def list_participants_endpoint(
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     return [
-        ParticipantOut(
+        ParticipantOut.model_construct(
             user_id=p.user_id,
             username=p.user.username,
             display_name=p.user.username,
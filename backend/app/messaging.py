@@ -109,7 +109,7 @@ def _user_display_name(user: User) -> str:
 
 
 def _participant_out(cp: ConversationParticipant) -> ParticipantOut:
-    return ParticipantOut(
+    return ParticipantOut.model_construct(
         user_id=cp.user_id,
         username=cp.user.username,
         display_name=_user_display_name(cp.user),
@@ -119,7 +119,7 @@ def _participant_out(cp: ConversationParticipant) -> ParticipantOut:
 
 
 def _message_out(msg: Message) -> MessageOut:
-    return MessageOut(
+    return MessageOut.model_construct(
         id=msg.id,
         fhir_communication_id=msg.fhir_communication_id,
         sender_id=msg.sender_id,
@@ -144,7 +144,7 @@ def _build_conversation_out(
         if conv.messages
         else None
     )
-    return ConversationOut(
+    return ConversationOut.model_construct(
         id=conv.id,
         fhir_conversation_id=conv.fhir_conversation_id,
         patient_id=conv.patient_id,
@@ -254,7 +254,7 @@ def create_conversation(
     db.commit()
     db.refresh(conv)
 
-    return ConversationDetailOut(
+    return ConversationDetailOut.model_construct(
         id=conv.id,
         fhir_conversation_id=conv.fhir_conversation_id,
         patient_id=conv.patient_id,
@@ -371,7 +371,7 @@ def get_conversation_detail(
 
     sorted_msgs = sorted(conv.messages, key=lambda m: m.created_at)
 
-    return ConversationDetailOut(
+    return ConversationDetailOut.model_construct(
         id=conv.id,
         fhir_conversation_id=conv.fhir_conversation_id,
         patient_id=conv.patient_id,
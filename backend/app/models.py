@@ -17,6 +17,7 @@ The schema includes:
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Any
 
 from sqlalchemy import (
     JSON,
@@ -24,15 +25,25 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     UniqueConstraint,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    mapped_column,
+    relationship,
+)
 
 from app.cbac.base_professions import resolve_user_competencies
 
+# JSONB on Postgres (pre-parsed, GIN-indexable); plain JSON elsewhere (tests)
+_JSONB = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -90,6 +101,18 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_additional_competencies",
+            "additional_competencies",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_users_removed_competencies",
+            "removed_competencies",
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     username: Mapped[str] = mapped_column(
@@ -129,13 +152,13 @@ class User(Base):
         String(100), nullable=False, default="patient"
     )
     additional_competencies: Mapped[list[str]] = mapped_column(
-        JSON, nullable=False, default=lambda: []
+        _JSONB, nullable=False, default=lambda: []
     )
     removed_competencies: Mapped[list[str]] = mapped_column(
-        JSON, nullable=False, default=lambda: []
+        _JSONB, nullable=False, default=lambda: []
     )
     professional_registrations: Mapped[dict | None] = mapped_column(
-        JSON, nullable=True
+        _JSONB, nullable=True
     )
 
     roles: Mapped[list[Role]] = relationship(
@@ -144,17 +167,36 @@ class User(Base):
         lazy="joined",
     )
 
-    def get_final_competencies(self) -> list[str]:
+    def get_final_competencies(self) -> frozenset[str]:
         """Compute final competencies for this user.
 
+        The result is memoised on the instance (which lives for a single
+        request's session), keyed on the current ``base_profession``,
+        ``additional_competencies`` and ``removed_competencies``, so an
+        assignment, in-place edit or reload of any of them recomputes it.
+
         Returns:
-            List of competency IDs this user has.
+            Frozen set of competency IDs this user has.
         """
-        return resolve_user_competencies(
-            base_profession=self.base_profession,
-            additional_competencies=self.additional_competencies,
-            removed_competencies=self.removed_competencies,
+        key = (
+            self.base_profession,
+            tuple(self.additional_competencies or ()),
+            tuple(self.removed_competencies or ()),
+        )
+        memo: tuple[Any, frozenset[str]] | None = self.__dict__.get(
+            "_final_competencies_cache"
         )
+        if memo is None or memo[0] != key:
+            memo = (
+                key,
+                resolve_user_competencies(
+                    base_profession=self.base_profession,
+                    additional_competencies=self.additional_competencies,
+                    removed_competencies=self.removed_competencies,
+                ),
+            )
+            self.__dict__["_final_competencies_cache"] = memo
+        return memo[1]
 
 
 class PatientMetadata(Base):
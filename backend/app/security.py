@@ -9,7 +9,13 @@ This module provides cryptographic functions for:
 All functions use industry-standard algorithms and handle secrets securely.
 """
 
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Collection
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import pyotp
@@ -23,10 +29,22 @@ from itsdangerous import (
 )
 from jose import jwt  # type: ignore[import-untyped]
 
-from app.config import settings
+from app.config import get_settings
 
 _ph = PasswordHasher()
 
+# Each Argon2 operation takes 64 MiB and four lanes of CPU. Password
+# endpoints run on the threadpool, so a burst of logins could otherwise
+# run dozens at once and starve every other request; cap them at the
+# core count and let the rest queue.
+_hash_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=1)
+def _jwt_secret() -> str:
+    """Unwrap JWT_SECRET once; every token encode/decode reuses it."""
+    return get_settings().JWT_SECRET.get_secret_value()
+
 
 def _now() -> datetime:
     """Current UTC Time.
@@ -59,7 +77,8 @@ def hash_password(p: str) -> str:
     # Defensive programming: validate input
     if not p:
         raise ValueError("Password cannot be empty")
-    return _ph.hash(p)
+    with _hash_slots:
+        return _ph.hash(p)
 
 
 def verify_password(p: str, h: str) -> bool:
@@ -84,7 +103,8 @@ def verify_password(p: str, h: str) -> bool:
     if not h:
         raise ValueError("Hash cannot be empty")
     try:
-        return _ph.verify(h, p)
+        with _hash_slots:
+            return _ph.verify(h, p)
     except VerifyMismatchError:
         return False
 
@@ -116,12 +136,12 @@ def create_access_token(
         "sub": sub,
         "roles": roles,
         "tv": token_version,
-        "exp": _now() + timedelta(minutes=settings.ACCESS_TTL_MIN),
+        "exp": _now() + timedelta(minutes=get_settings().ACCESS_TTL_MIN),
     }
     return jwt.encode(  # type: ignore[no-any-return]
         payload,
-        settings.JWT_SECRET.get_secret_value(),
-        algorithm=settings.JWT_ALG,
+        _jwt_secret(),
+        algorithm=get_settings().JWT_ALG,
     )
 
 
@@ -143,12 +163,12 @@ def create_refresh_token(sub: str, token_version: int = 0) -> str:
         "sub": sub,
         "type": "refresh",
         "tv": token_version,
-        "exp": _now() + timedelta(days=settings.REFRESH_TTL_DAYS),
+        "exp": _now() + timedelta(days=get_settings().REFRESH_TTL_DAYS),
     }
     return jwt.encode(  # type: ignore[no-any-return]
         payload,
-        settings.JWT_SECRET.get_secret_value(),
-        algorithm=settings.JWT_ALG,
+        _jwt_secret(),
+        algorithm=get_settings().JWT_ALG,
     )
 
 
@@ -173,13 +193,16 @@ def decode_token(tok: str) -> dict[str, Any]:
     """
     return jwt.decode(  # type: ignore[no-any-return]
         tok,
-        settings.JWT_SECRET.get_secret_value(),
-        algorithms=[settings.JWT_ALG],
+        _jwt_secret(),
+        algorithms=[get_settings().JWT_ALG],
     )
 
 
 # CSRF (double-submit cookie)
-_csrf = URLSafeSerializer(settings.JWT_SECRET.get_secret_value(), salt="csrf")
+@lru_cache(maxsize=1)
+def _csrf() -> URLSafeSerializer:
+    """Build the CSRF token serializer on first use."""
+    return URLSafeSerializer(_jwt_secret(), salt="csrf")
 
 
 def create_csrf_token(username: str) -> str:
@@ -202,7 +225,7 @@ def create_csrf_token(username: str) -> str:
     # Defensive programming: validate input
     if not username or not username.strip():
         raise ValueError("Username cannot be empty")
-    return _csrf.dumps({"sub": username})
+    return _csrf().dumps({"sub": username})
 
 
 def make_csrf(sub: str) -> str:
@@ -218,7 +241,7 @@ def make_csrf(sub: str) -> str:
     Returns:
         str: URL-safe CSRF token.
     """
-    return _csrf.dumps({"sub": sub})
+    return _csrf().dumps({"sub": sub})
 
 
 def verify_csrf(token: str, sub: str) -> bool:
@@ -236,7 +259,7 @@ def verify_csrf(token: str, sub: str) -> bool:
         bool: True if token is valid and subject matches, False otherwise.
     """
     try:
-        data = _csrf.loads(token)
+        data = _csrf().loads(token)
         return bool(data.get("sub") == sub)
     except Exception:
         return False
@@ -276,6 +299,17 @@ def generate_totp_provision_uri(
     return totp.provisioning_uri(name=username, issuer_name=issuer)
 
 
+# Accepted TOTP codes, keyed on (secret digest, code), each mapped to the
+# end of its time step. Replays are refused before any HMAC is computed.
+# This is best-effort throttling, not the single-use guarantee of RFC 6238
+# section 5.2: the record is per worker process, so a code accepted by one
+# worker can still be accepted once by another within the same step.
+_TOTP_STEP = 30
+_TOTP_USED_MAX = 50_000
+_totp_used: dict[tuple[bytes, str], float] = {}
+_totp_lock = threading.Lock()
+
+
 def verify_totp_code(secret: str, code: str) -> bool:
     """Verify TOTP Code.
 
@@ -288,14 +322,32 @@ def verify_totp_code(secret: str, code: str) -> bool:
         code: 6-digit TOTP code from authenticator app.
 
     Returns:
-        bool: True if code is valid for current time window, False otherwise.
+        bool: True if code is valid for current time window and has not
+            already been accepted by this worker process, False otherwise.
     """
+    if len(code) != 6 or not code.isdigit():
+        return False
+    key = (hashlib.blake2b(secret.encode(), digest_size=16).digest(), code)
+    if _totp_used.get(key, 0.0) > time.time():
+        return False  # Replay: refuse without computing the HMAC
+
     try:
         totp = pyotp.TOTP(secret)
-        return totp.verify(code)
+        if not totp.verify(code):
+            return False
     except Exception:
         return False
 
+    now = time.time()
+    with _totp_lock:
+        if _totp_used.get(key, 0.0) > now:
+            return False  # Used concurrently by another request
+        if len(_totp_used) >= _TOTP_USED_MAX:
+            _totp_used.pop(next(iter(_totp_used)), None)
+        # The code stops verifying at the end of its time step anyway
+        _totp_used[key] = (now // _TOTP_STEP + 1) * _TOTP_STEP
+    return True
+
 
 def totp_provisioning_uri(
     secret: str, username: str, issuer: str | None = None
@@ -312,7 +364,7 @@ def totp_provisioning_uri(
 def create_jwt_with_competencies(
     sub: str,
     roles: list[str],
-    competencies: list[str],
+    competencies: Collection[str],
     token_version: int = 0,
 ) -> str:
     """Create JWT Access Token with CBAC Competencies.
@@ -324,7 +376,7 @@ def create_jwt_with_competencies(
     Args:
         sub: Subject (username) for the token.
         roles: List of role names assigned to the user (e.g., ["Clinician"]).
-        competencies: List of competency IDs user has (resolved from base profession).
+        competencies: Competency IDs user has (resolved from base profession).
         token_version: User's token version for session invalidation.
 
     Returns:
@@ -338,14 +390,14 @@ def create_jwt_with_competencies(
     payload: dict[str, Any] = {
         "sub": sub,
         "roles": roles,
-        "competencies": competencies,
+        "competencies": sorted(competencies),
         "tv": token_version,
-        "exp": _now() + timedelta(minutes=settings.ACCESS_TTL_MIN),
+        "exp": _now() + timedelta(minutes=get_settings().ACCESS_TTL_MIN),
     }
     return jwt.encode(  # type: ignore[no-any-return]
         payload,
-        settings.JWT_SECRET.get_secret_value(),
-        algorithm=settings.JWT_ALG,
+        _jwt_secret(),
+        algorithm=get_settings().JWT_ALG,
     )
 
 
@@ -398,8 +450,8 @@ def create_invite_token(
     }
     return jwt.encode(  # type: ignore[no-any-return]
         payload,
-        settings.JWT_SECRET.get_secret_value(),
-        algorithm=settings.JWT_ALG,
+        _jwt_secret(),
+        algorithm=get_settings().JWT_ALG,
     )
 
 
@@ -414,8 +466,8 @@ def decode_invite_token(tok: str) -> dict[str, Any]:
     """
     data: dict[str, Any] = jwt.decode(
         tok,
-        settings.JWT_SECRET.get_secret_value(),
-        algorithms=[settings.JWT_ALG],
+        _jwt_secret(),
+        algorithms=[get_settings().JWT_ALG],
     )
     if data.get("type") != "invite":
         raise jwt.JWTError("Not an invite token")
@@ -423,9 +475,10 @@ def decode_invite_token(tok: str) -> dict[str, Any]:
 
 
 # --- Password reset tokens ---
-_password_reset = URLSafeTimedSerializer(
-    settings.JWT_SECRET.get_secret_value(), salt="password-reset"
-)
+@lru_cache(maxsize=1)
+def _password_reset() -> URLSafeTimedSerializer:
+    """Build the password reset token serializer on first use."""
+    return URLSafeTimedSerializer(_jwt_secret(), salt="password-reset")
 
 
 def create_password_reset_token(email: str) -> str:
@@ -445,7 +498,7 @@ def create_password_reset_token(email: str) -> str:
     """
     if not email or not email.strip():
         raise ValueError("Email cannot be empty")
-    return _password_reset.dumps({"email": email.strip().lower()})
+    return _password_reset().dumps({"email": email.strip().lower()})
 
 
 def verify_password_reset_token(token: str) -> str | None:
@@ -461,8 +514,8 @@ def verify_password_reset_token(token: str) -> str | None:
         The email address if valid, None otherwise.
     """
     try:
-        data: dict[str, str] = _password_reset.loads(
-            token, max_age=settings.PASSWORD_RESET_TTL_MIN * 60
+        data: dict[str, str] = _password_reset().loads(
+            token, max_age=get_settings().PASSWORD_RESET_TTL_MIN * 60
         )
         return data.get("email")
     except (SignatureExpired, BadSignature):
@@ -470,9 +523,10 @@ def verify_password_reset_token(token: str) -> str | None:
 
 
 # --- Email verification tokens ---
-_email_verify = URLSafeTimedSerializer(
-    settings.JWT_SECRET.get_secret_value(), salt="email-verify"
-)
+@lru_cache(maxsize=1)
+def _email_verify() -> URLSafeTimedSerializer:
+    """Build the email verification token serializer on first use."""
+    return URLSafeTimedSerializer(_jwt_secret(), salt="email-verify")
 
 
 def create_email_verify_token(email: str) -> str:
@@ -489,7 +543,7 @@ def create_email_verify_token(email: str) -> str:
     """
     if not email or not email.strip():
         raise ValueError("Email cannot be empty")
-    return _email_verify.dumps({"email": email.strip().lower()})
+    return _email_verify().dumps({"email": email.strip().lower()})
 
 
 def verify_email_verify_token(token: str) -> str | None:
@@ -502,8 +556,8 @@ def verify_email_verify_token(token: str) -> str | None:
         The email address if valid, None otherwise.
     """
     try:
-        data: dict[str, str] = _email_verify.loads(
-            token, max_age=settings.EMAIL_VERIFY_TTL_MIN * 60
+        data: dict[str, str] = _email_verify().loads(
+            token, max_age=get_settings().EMAIL_VERIFY_TTL_MIN * 60
         )
         return data.get("email")
     except (SignatureExpired, BadSignature):
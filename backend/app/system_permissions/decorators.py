@@ -9,6 +9,7 @@ from collections.abc import Callable
 
 from fastapi import HTTPException, Request
 
+from app.deps import DEP_CURRENT_USER
 from app.models import User
 from app.system_permissions.permissions import check_permission_level
 
@@ -21,7 +22,7 @@ def requires_staff() -> Callable[[Request, User], User]:
 
     Usage Example:
         from app.system_permissions import requires_staff
-        from app.main import DEP_CURRENT_USER
+        from app.deps import DEP_CURRENT_USER
 
         @router.get("/clinical/dashboard")
         async def dashboard(
@@ -36,7 +37,6 @@ def requires_staff() -> Callable[[Request, User], User]:
     Raises:
         HTTPException: 403 Forbidden if user lacks staff permission
     """
-    from app.main import DEP_CURRENT_USER
 
     def check_staff(request: Request, user: User = DEP_CURRENT_USER) -> User:
         """Check if user has staff permission or higher."""
@@ -58,7 +58,7 @@ def requires_admin() -> Callable[[Request, User], User]:
 
     Usage Example:
         from app.system_permissions import requires_admin
-        from app.main import DEP_CURRENT_USER
+        from app.deps import DEP_CURRENT_USER
 
         @router.post("/users/{user_id}/deactivate")
         async def deactivate_user(
@@ -74,7 +74,6 @@ def requires_admin() -> Callable[[Request, User], User]:
     Raises:
         HTTPException: 403 Forbidden if user lacks admin permission
     """
-    from app.main import DEP_CURRENT_USER
 
     def check_admin(request: Request, user: User = DEP_CURRENT_USER) -> User:
         """Check if user has admin permission or higher."""
@@ -96,7 +95,7 @@ def requires_superadmin() -> Callable[[Request, User], User]:
 
     Usage Example:
         from app.system_permissions import requires_superadmin
-        from app.main import DEP_CURRENT_USER
+        from app.deps import DEP_CURRENT_USER
 
         @router.post("/system/config/update")
         async def update_system_config(
@@ -112,7 +111,6 @@ def requires_superadmin() -> Callable[[Request, User], User]:
     Raises:
         HTTPException: 403 Forbidden if user lacks superadmin permission
     """
-    from app.main import DEP_CURRENT_USER
 
     def check_superadmin(
         request: Request, user: User = DEP_CURRENT_USER
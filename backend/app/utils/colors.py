@@ -2,9 +2,10 @@
 Utility functions for generating avatar gradient colors.
 
 The frontend defines predefined gradient combinations (indices 0-29).
-This module generates random gradient indices for new patients.
+This module generates gradient indices for new patients.
 """
 
+import hashlib
 import random
 
 # Number of available gradients in frontend
@@ -12,19 +13,27 @@ import random
 GRADIENT_COUNT = 30
 
 
-def generate_avatar_gradient_index() -> int:
+def generate_avatar_gradient_index(seed: str | None = None) -> int:
     """
-    Generate a random gradient index for patient avatars.
+    Generate a gradient index for patient avatars.
 
-    Returns a random integer from 0 to GRADIENT_COUNT - 1, which maps to
-    one of the predefined gradient combinations in the frontend.
+    Returns an integer from 0 to GRADIENT_COUNT - 1, which maps to one of
+    the predefined gradient combinations in the frontend. With a seed
+    (such as the patient ID) the index is derived from a hash of it, so
+    retrying a create yields the same gradient; without one it is random.
+
+    Args:
+        seed: Optional value to derive the index from.
 
     Returns:
-        int: Random gradient index (0-29)
+        int: Gradient index (0-29)
 
     Example:
         >>> index = generate_avatar_gradient_index()
         >>> index
         12
     """
-    return random.randint(0, GRADIENT_COUNT - 1)
+    if seed is None:
+        return random.randint(0, GRADIENT_COUNT - 1)
+    digest = hashlib.blake2b(seed.encode(), digest_size=8).digest()
+    return int.from_bytes(digest) % GRADIENT_COUNT
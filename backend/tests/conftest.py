@@ -23,6 +23,7 @@ os.environ.setdefault("CLINICAL_SERVICES_ENABLED", "false")
 # Force dry-run to prevent tests from sending real emails via Resend
 os.environ["EMAIL_DRY_RUN"] = "true"
 
+from app import deps, ehrbase_client, fhir_client
 from app.db import get_session
 from app.main import app, limiter, require_clinical_services
 from app.models import Base, Role, User
@@ -38,6 +39,28 @@ def _reset_rate_limiter() -> None:
     limiter.reset()
 
 
+@pytest.fixture(autouse=True)
+def _reset_token_cache() -> None:
+    """Forget access tokens verified by earlier tests."""
+    deps._token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_ehrbase_client_caches() -> None:
+    """Clear cached EHRbase lookups, URLs and headers between tests."""
+    ehrbase_client._ehr_id_cache.clear()
+    ehrbase_client._api_base.cache_clear()
+    ehrbase_client._auth_header_value.cache_clear()
+    ehrbase_client._cached_headers.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_fhir_client() -> None:
+    """Drop the cached FHIR client and patient reads between tests."""
+    fhir_client._fhir_client.cache_clear()
+    fhir_client._patient_cache.clear()
+
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
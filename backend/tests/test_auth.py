@@ -1,10 +1,16 @@
 """Tests for authentication endpoints."""
 
+import time
+from unittest.mock import MagicMock, patch
+
 from fastapi.testclient import TestClient
+from jose import JWTError
+from sqlalchemy import false
 from sqlalchemy.orm import Session
 
+from app.deps import USER_BY_USERNAME, warm_user_lookup
 from app.models import User
-from app.security import generate_totp_secret
+from app.security import decode_token, generate_totp_secret
 
 
 class TestRegister:
@@ -53,6 +59,24 @@ class TestRegister:
         assert response.status_code == 400
         assert "already in use" in response.json()["detail"].lower()
 
+    def test_register_duplicate_race(
+        self, test_client: TestClient, test_user: User
+    ):
+        """Test a duplicate missed by the pre-check still returns 400."""
+        # Make the existence check find nothing, as if the other signup
+        # committed between the check and the insert.
+        with patch("app.main.or_", return_value=false()):
+            response = test_client.post(
+                "/api/auth/register",
+                json={
+                    "username": test_user.username,
+                    "email": "other@example.com",
+                    "password": "Password123!",
+                },
+            )
+        assert response.status_code == 400
+        assert "already in use" in response.json()["detail"].lower()
+
     def test_register_password_too_short(self, test_client: TestClient):
         """Test registration with password too short."""
         response = test_client.post(
@@ -98,6 +122,28 @@ class TestLogin:
         assert "refresh_token" in response.cookies
         assert "XSRF-TOKEN" in response.cookies
 
+    def test_login_cookie_attributes(
+        self, test_client: TestClient, test_user: User
+    ):
+        """Test auth cookies carry the expected path and flags."""
+        response = test_client.post(
+            "/api/auth/login",
+            json={"username": "testuser", "password": "TestPassword123!"},
+        )
+        headers = {
+            h.split("=", 1)[0]: h
+            for h in response.headers.get_list("set-cookie")
+        }
+
+        assert headers["access_token"].endswith(
+            "; HttpOnly; Path=/; SameSite=lax"
+        )
+        assert headers["refresh_token"].endswith(
+            "; HttpOnly; Path=/api/auth/refresh; SameSite=lax"
+        )
+        assert headers["XSRF-TOKEN"].endswith("; Path=/; SameSite=lax")
+        assert "HttpOnly" not in headers["XSRF-TOKEN"]
+
     def test_login_wrong_username(self, test_client: TestClient):
         """Test login with non-existent username."""
         response = test_client.post(
@@ -187,6 +233,22 @@ class TestLogout:
         token = authenticated_client.cookies.get("access_token")
         assert token in (None, "")
 
+    def test_logout_expires_cookies_on_their_paths(
+        self, authenticated_client: TestClient
+    ):
+        """Test logout expires each auth cookie on the path it was set."""
+        response = authenticated_client.post("/api/auth/logout")
+        headers = {
+            h.split("=", 1)[0]: h
+            for h in response.headers.get_list("set-cookie")
+        }
+
+        assert set(headers) == {"access_token", "refresh_token", "XSRF-TOKEN"}
+        for header in headers.values():
+            assert "Max-Age=0" in header
+        assert "; Path=/api/auth/refresh;" in headers["refresh_token"]
+        assert "; Path=/;" in headers["access_token"]
+
 
 class TestAuthMe:
     """Test /auth/me endpoint for getting current user."""
@@ -228,12 +290,72 @@ class TestAuthMe:
         data = response.json()
         assert "manage_teaching_content" in data["competencies"]
 
+    def test_auth_me_verifies_token_once(
+        self, authenticated_client: TestClient
+    ):
+        """Test repeat requests reuse the first token verification."""
+        with patch("app.deps.decode_token", wraps=decode_token) as decode:
+            for _ in range(3):
+                response = authenticated_client.get("/api/auth/me")
+                assert response.status_code == 200
+
+        assert decode.call_count == 1
+
+    def test_auth_me_expired_token_not_served_from_cache(
+        self, authenticated_client: TestClient
+    ):
+        """Test a cached verification is not reused past the token's exp."""
+        assert authenticated_client.get("/api/auth/me").status_code == 200
+
+        later = time.time() + 24 * 60 * 60
+        with (
+            patch("app.deps.time.time", return_value=later),
+            patch(
+                "app.deps.decode_token", side_effect=JWTError("expired")
+            ) as decode,
+        ):
+            response = authenticated_client.get("/api/auth/me")
+
+        assert response.status_code == 401
+        decode.assert_called_once()
+
+    def test_auth_me_deactivated_with_verified_token(
+        self,
+        authenticated_client: TestClient,
+        test_user: User,
+        db_session: Session,
+    ):
+        """Test deactivation applies to a token that is already verified."""
+        assert authenticated_client.get("/api/auth/me").status_code == 200
+        test_user.is_active = False
+        db_session.commit()
+
+        response = authenticated_client.get("/api/auth/me")
+        assert response.status_code == 401
+
     def test_auth_me_unauthenticated(self, test_client: TestClient):
         """Test /auth/me without authentication."""
         response = test_client.get("/api/auth/me")
         assert response.status_code == 401
 
 
+class TestUserLookupWarmUp:
+    """Test the startup warm-up of the per-request user lookup."""
+
+    def test_opens_each_connection_and_closes_it(self):
+        """Test every session runs the lookup and is closed afterwards."""
+        sessions = [MagicMock(), MagicMock(), MagicMock()]
+        with patch("app.deps.SessionLocal", side_effect=sessions):
+            warm_user_lookup(3)
+
+        # Same statement object as current_user, so the same cache entry
+        for db in sessions:
+            db.scalar.assert_called_once_with(
+                USER_BY_USERNAME, {"username": ""}
+            )
+            db.close.assert_called_once()
+
+
 class TestRefreshToken:
     """Test token refresh endpoint."""
 
@@ -267,6 +389,19 @@ class TestTOTPSetup:
         assert "provision_uri" in data
         assert data["provision_uri"].startswith("otpauth://totp/")
 
+    def test_totp_setup_repeat_reuses_secret(
+        self, authenticated_client: TestClient, test_user: User, db_session
+    ):
+        """Test a repeat setup returns the stored secret without a commit."""
+        first = authenticated_client.post("/api/auth/totp/setup")
+        with patch.object(Session, "commit") as mock_commit:
+            second = authenticated_client.post("/api/auth/totp/setup")
+
+        assert second.json() == first.json()
+        mock_commit.assert_not_called()
+        db_session.refresh(test_user)
+        assert test_user.totp_secret in first.json()["provision_uri"]
+
     def test_totp_setup_unauthenticated(self, test_client: TestClient):
         """Test TOTP setup without authentication."""
         response = test_client.post("/api/auth/totp/setup")
@@ -0,0 +1,56 @@
+"""Tests for CBAC authorisation dependencies."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.cbac.decorators import has_competency, requires_any_competency
+from app.models import User
+
+
+def _user(additional: list[str]) -> User:
+    return User(
+        username="cbac",
+        email="cbac@example.com",
+        password_hash="x",
+        base_profession="patient",
+        additional_competencies=additional,
+        removed_competencies=[],
+    )
+
+
+class TestHasCompetency:
+    """Test the single-competency dependency."""
+
+    def test_allows_user_with_competency(self):
+        """Test a user holding the competency is returned."""
+        check = has_competency("prescribe_controlled_schedule_2")
+        user = _user(["prescribe_controlled_schedule_2"])
+        assert check(user) is user
+
+    def test_rejects_user_without_competency(self):
+        """Test a user lacking the competency gets 403."""
+        check = has_competency("prescribe_controlled_schedule_2")
+        with pytest.raises(HTTPException) as exc:
+            check(_user([]))
+        assert exc.value.status_code == 403
+
+
+class TestRequiresAnyCompetency:
+    """Test the any-of competency dependency."""
+
+    def test_allows_user_with_one_competency(self):
+        """Test holding any one of the competencies is sufficient."""
+        check = requires_any_competency(
+            "manage_teaching_content", "prescribe_controlled_schedule_2"
+        )
+        user = _user(["prescribe_controlled_schedule_2"])
+        assert check(user) is user
+
+    def test_rejects_user_with_none(self):
+        """Test a user with none of the competencies gets 403."""
+        check = requires_any_competency(
+            "manage_teaching_content", "prescribe_controlled_schedule_2"
+        )
+        with pytest.raises(HTTPException) as exc:
+            check(_user([]))
+        assert exc.value.status_code == 403
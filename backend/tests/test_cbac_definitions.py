@@ -0,0 +1,66 @@
+"""Tests for CBAC YAML definition loading and validation."""
+
+import pytest
+
+from app.cbac.base_professions import (
+    _build_base_competencies,
+    resolve_user_competencies,
+)
+from app.cbac.competencies import (
+    _build_competency_records,
+    get_competency_risk_level,
+)
+
+
+class TestCompetencyRecords:
+    """Test competency YAML validation."""
+
+    def test_builds_records(self):
+        """Test valid entries become typed records."""
+        records = _build_competency_records(
+            {"competencies": [{"id": "a", "risk_level": "high"}, {"id": "b"}]}
+        )
+        assert records["a"].risk_level == "high"
+        assert records["b"].risk_level == "low"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {},
+            {"competencies": [{"risk_level": "low"}]},
+            {"competencies": [{"id": "a"}, {"id": "a"}]},
+            {"competencies": [{"id": "a", "risk_level": "extreme"}]},
+        ],
+    )
+    def test_rejects_malformed(self, data):
+        """Test malformed YAML fails fast with ValueError."""
+        with pytest.raises(ValueError):
+            _build_competency_records(data)
+
+    def test_unknown_competency_risk_defaults_low(self):
+        """Test unknown competency IDs report low risk."""
+        assert get_competency_risk_level("not_a_competency") == "low"
+
+
+class TestBaseCompetencies:
+    """Test base profession YAML validation."""
+
+    def test_rejects_unknown_base_competency(self):
+        """Test base professions may only reference known competencies."""
+        with pytest.raises(ValueError):
+            _build_base_competencies(
+                {
+                    "base_professions": [
+                        {"id": "x", "base_competencies": ["not_real"]}
+                    ]
+                }
+            )
+
+    def test_resolve_applies_additions_and_removals(self):
+        """Test final competencies are base plus additions minus removals."""
+        final = resolve_user_competencies(
+            "patient",
+            additional_competencies=["prescribe_controlled_schedule_2"],
+            removed_competencies=["access_patient_records"],
+        )
+        assert final == frozenset({"prescribe_controlled_schedule_2"})
@@ -25,3 +25,18 @@ def test_generate_avatar_gradient_index_multiple():
     assert len(unique_indices) >= 10
     # All should be in valid range
     assert all(0 <= idx < 30 for idx in indices)
+
+
+def test_generate_avatar_gradient_index_seeded_is_stable():
+    """Test that a seed always maps to the same index."""
+    first = generate_avatar_gradient_index("patient-123")
+
+    assert first == generate_avatar_gradient_index("patient-123")
+    assert 0 <= first < 30
+
+
+def test_generate_avatar_gradient_index_seeded_varies():
+    """Test that different seeds spread across the gradients."""
+    indices = {generate_avatar_gradient_index(f"p-{i}") for i in range(60)}
+
+    assert len(indices) >= 10
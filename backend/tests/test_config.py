@@ -1,5 +1,11 @@
 """Tests for configuration settings."""
 
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import quote_plus
+
 from app.config import Settings
 
 
@@ -45,3 +51,64 @@ class TestSettingsComputedFields:
         assert "postgres-ehrbase" in url
         assert "5432" in url
         assert "ehrbase" in url
+
+    def test_database_urls_are_memoised(self):
+        """Test computed URLs are built once per Settings instance."""
+        settings = Settings(
+            JWT_SECRET="test_secret_long_enough_32_chars_min",
+            CORE_DB_PASSWORD="p@ss word",
+            CLINICAL_SERVICES_ENABLED=True,
+        )
+        core = settings.CORE_DATABASE_URL
+        assert settings.CORE_DATABASE_URL is core
+        assert "p%40ss+word" in core
+        assert settings.FHIR_DATABASE_URL is settings.FHIR_DATABASE_URL
+        assert settings.EHRBASE_DATABASE_URL is settings.EHRBASE_DATABASE_URL
+        assert "CORE_DATABASE_URL" in settings.model_dump()
+
+    def test_password_quoted_once_per_url(self):
+        """Test repeated URL reads do not re-quote the password."""
+        settings = Settings(
+            JWT_SECRET="test_secret_long_enough_32_chars_min",
+            CORE_DB_PASSWORD="p@ss word",
+            CLINICAL_SERVICES_ENABLED=True,
+        )
+        with patch("app.config.quote_plus", wraps=quote_plus) as quote:
+            for _ in range(3):
+                _ = settings.CORE_DATABASE_URL
+                _ = settings.FHIR_DATABASE_URL
+                _ = settings.EHRBASE_DATABASE_URL
+        assert quote.call_count == 3
+
+
+class TestGetSettings:
+    """Test lazy settings accessor."""
+
+    def test_settings_attribute_is_cached_instance(self):
+        """Test module-level settings resolves to the cached instance."""
+        from app import config
+
+        assert config.settings is config.get_settings()
+        assert config.get_settings() is config.get_settings()
+
+    def test_modules_share_one_settings_instance(self):
+        """Test importers all see the same parsed Settings object."""
+        from app import config, main
+
+        assert main.settings is config.get_settings()
+
+    def test_client_imports_do_not_build_settings(self):
+        """Test importing the auth and clinical clients skips env parsing."""
+        code = (
+            "import app.security, app.fhir_client, app.ehrbase_client\n"
+            "from app.config import get_settings\n"
+            "print(get_settings.cache_info().currsize)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "0"
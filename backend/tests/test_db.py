@@ -1,7 +1,10 @@
 """Tests for database session management."""
 
+import pytest
 from sqlalchemy.orm import Session
 
+import app.db
+from app.db import auth_db
 from app.db.auth_db import get_auth_db
 
 
@@ -18,3 +21,38 @@ class TestAuthDB:
             next(gen)
         except StopIteration:
             pass
+
+
+class TestLazyEngines:
+    """Test that engines are built on demand and reused."""
+
+    def test_engine_is_cached(self):
+        """Test repeated access returns the same engine instance."""
+        assert auth_db.get_auth_engine() is auth_db.get_auth_engine()
+        assert auth_db.auth_engine is auth_db.get_auth_engine()
+        assert app.db.engine is auth_db.get_auth_engine()
+
+    def test_sessions_bind_lazy_engine(self):
+        """Test session factories bind to the cached engine."""
+        session = auth_db.AuthSessionLocal()
+        try:
+            assert session.get_bind() is auth_db.get_auth_engine()
+        finally:
+            session.close()
+
+    def test_engine_uses_pool_settings(self):
+        """Test pool sizing and recycling come from Settings."""
+        settings = auth_db.get_settings()
+        pool = auth_db.get_auth_engine().pool
+        assert pool.size() == settings.CORE_DB_POOL_SIZE
+        assert pool._max_overflow == settings.CORE_DB_MAX_OVERFLOW
+        assert pool._recycle == settings.CORE_DB_POOL_RECYCLE
+
+    def test_engine_uses_enlarged_statement_cache(self):
+        """Test the engine gets the enlarged compiled-statement cache."""
+        assert auth_db.get_auth_engine()._compiled_cache.capacity == 1200
+
+    def test_unknown_attribute_raises(self):
+        """Test the module __getattr__ only serves known engine names."""
+        with pytest.raises(AttributeError):
+            _ = auth_db.not_an_engine
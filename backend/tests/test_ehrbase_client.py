@@ -1,7 +1,11 @@
 """Unit tests for EHRbase client functions."""
 
+import asyncio
+import re
 from unittest.mock import MagicMock, patch
 
+import httpx
+import orjson
 import pytest
 import requests
 
@@ -12,123 +16,111 @@ from app.ehrbase_client import EhrAlreadyExistsError, EhrbaseClientError
 class TestGetOrCreateEhr:
     """Test getting or creating EHR for patient."""
 
-    @patch("app.ehrbase_client.requests.get")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_get_ehr_exists_already(self, mock_settings, mock_auth, mock_get):
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_get_ehr_exists_already(
+        self, mock_get_settings, mock_auth, mock_get, mock_post
+    ):
         """Test when EHR already exists for patient."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
+        # POST returns 409 because the subject already has an EHR
+        mock_post_response = MagicMock()
+        mock_post_response.status_code = 409
+        mock_post.return_value = mock_post_response
+
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "ehr_id": {"value": "existing-ehr-123"}
-        }
+        mock_response.content = orjson.dumps(
+            {"ehr_id": {"value": "existing-ehr-123"}}
+        )
         mock_get.return_value = mock_response
 
         result = ehrbase_client.get_or_create_ehr("patient-123")
 
         assert result == "existing-ehr-123"
+        mock_post.assert_called_once()
         mock_get.assert_called_once()
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.requests.get")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
     def test_get_ehr_create_new(
-        self, mock_settings, mock_auth, mock_get, mock_post
+        self, mock_get_settings, mock_auth, mock_get, mock_post
     ):
-        """Test creating new EHR when none exists."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        """Test creating new EHR takes a single round-trip."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
-        # Mock GET returns 404
-        mock_get_response = MagicMock()
-        mock_get_response.status_code = 404
-        mock_get.return_value = mock_get_response
-
         # Mock POST creates EHR
         mock_post_response = MagicMock()
         mock_post_response.status_code = 201
-        mock_post_response.json.return_value = {
-            "ehr_id": {"value": "new-ehr-456"}
-        }
+        mock_post_response.content = orjson.dumps(
+            {"ehr_id": {"value": "new-ehr-456"}}
+        )
         mock_post.return_value = mock_post_response
 
         result = ehrbase_client.get_or_create_ehr("patient-456")
 
         assert result == "new-ehr-456"
-        mock_get.assert_called_once()
         mock_post.assert_called_once()
-
-    @patch("app.ehrbase_client.requests.get")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_get_ehr_error(self, mock_settings, mock_auth, mock_get):
-        """Test error handling when EHR check fails."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get.assert_not_called()
+
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_create_ehr_error(self, mock_get_settings, mock_auth, mock_post):
+        """Test error handling when EHR creation fails."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
-        mock_get.side_effect = requests.ConnectionError("Connection error")
+        mock_post.side_effect = requests.ConnectionError("Connection error")
 
         with pytest.raises(EhrbaseClientError) as exc_info:
             ehrbase_client.get_or_create_ehr("patient-789")
 
-        assert "Failed to retrieve clinical record" in str(exc_info.value)
+        assert "Failed to create clinical record" in str(exc_info.value)
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.requests.get")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_get_or_create_ehr_race_condition_resolved(
-        self, mock_settings, mock_auth, mock_get, mock_post
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_get_ehr_error(
+        self, mock_get_settings, mock_auth, mock_get, mock_post
     ):
-        """Test race condition: create returns 409, retry fetches existing."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
-        mock_settings.CLINICAL_SERVICES_ENABLED = True
+        """Test error handling when fetching the existing EHR fails."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
-        # First GET returns 404 (no EHR exists yet)
-        mock_get_404 = MagicMock()
-        mock_get_404.status_code = 404
-
-        # Second GET (after 409) returns the EHR created by another request
-        mock_get_200 = MagicMock()
-        mock_get_200.status_code = 200
-        mock_get_200.json.return_value = {
-            "ehr_id": {"value": "race-winner-ehr-123"}
-        }
-
-        mock_get.side_effect = [mock_get_404, mock_get_200]
-
-        # POST returns 409 Conflict (another request won the race)
         mock_post_response = MagicMock()
         mock_post_response.status_code = 409
         mock_post.return_value = mock_post_response
+        mock_get.side_effect = requests.ConnectionError("Connection error")
 
-        result = ehrbase_client.get_or_create_ehr("patient-race")
+        with pytest.raises(EhrbaseClientError) as exc_info:
+            ehrbase_client.get_or_create_ehr("patient-789")
 
-        assert result == "race-winner-ehr-123"
-        assert mock_get.call_count == 2
-        mock_post.assert_called_once()
+        assert "Failed to retrieve clinical record" in str(exc_info.value)
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.requests.get")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_get_or_create_ehr_race_condition_unresolvable(
-        self, mock_settings, mock_auth, mock_get, mock_post
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_get_or_create_ehr_conflict_unresolvable(
+        self, mock_get_settings, mock_auth, mock_get, mock_post
     ):
-        """Test race condition where retry also fails raises error."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
-        mock_settings.CLINICAL_SERVICES_ENABLED = True
+        """Test 409 on create with no EHR found on lookup raises error."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.CLINICAL_SERVICES_ENABLED = True
         mock_auth.return_value = {"Authorization": "Basic test"}
 
-        # Both GETs return 404
         mock_get_404 = MagicMock()
         mock_get_404.status_code = 404
-        mock_get.side_effect = [mock_get_404, mock_get_404]
+        mock_get.return_value = mock_get_404
 
         # POST returns 409
         mock_post_response = MagicMock()
@@ -142,15 +134,15 @@ class TestGetOrCreateEhr:
 class TestCreateEhrConflict:
     """Test EHR creation with 409 handling."""
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
     def test_create_ehr_conflict_raises(
-        self, mock_settings, mock_auth, mock_post
+        self, mock_get_settings, mock_auth, mock_post
     ):
         """Test that 409 Conflict raises EhrAlreadyExistsError."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
-        mock_settings.CLINICAL_SERVICES_ENABLED = True
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.CLINICAL_SERVICES_ENABLED = True
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_response = MagicMock()
@@ -161,27 +153,50 @@ class TestCreateEhrConflict:
             ehrbase_client.create_ehr("patient-duplicate")
 
 
+class TestSubjectValidation:
+    """Test subject argument validation before any HTTP call."""
+
+    @pytest.mark.parametrize("subject_id", ["", "   ", "\t\n"])
+    def test_create_ehr_rejects_blank_subject(self, subject_id):
+        """Blank subject IDs are rejected."""
+        with pytest.raises(ValueError, match="subject_id cannot be empty"):
+            ehrbase_client.create_ehr(subject_id)
+
+    def test_create_ehr_rejects_blank_namespace(self):
+        """Blank namespaces are rejected."""
+        with pytest.raises(ValueError, match="subject_namespace"):
+            ehrbase_client.create_ehr("patient-1", " ")
+
+    @pytest.mark.parametrize("subject_id", ["", "  "])
+    def test_get_ehr_by_subject_rejects_blank_subject(self, subject_id):
+        """Blank subject IDs are rejected on lookup too."""
+        with pytest.raises(ValueError, match="subject_id cannot be empty"):
+            ehrbase_client.get_ehr_by_subject(subject_id)
+
+
 class TestCreateLetterComposition:
     """Test creating letter compositions in EHRbase."""
 
     @patch("app.ehrbase_client.get_or_create_ehr")
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
     def test_create_letter_success(
-        self, mock_settings, mock_auth, mock_post, mock_get_ehr
+        self, mock_get_settings, mock_auth, mock_post, mock_get_ehr
     ):
         """Test successful letter composition creation."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
         mock_get_ehr.return_value = "ehr-123"
 
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "compositionUid": "comp-uid-789::server::1",
-            "action": "CREATE",
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "compositionUid": "comp-uid-789::server::1",
+                "action": "CREATE",
+            }
+        )
         mock_post.return_value = mock_response
 
         result = ehrbase_client.create_letter_composition(
@@ -194,14 +209,14 @@ class TestCreateLetterComposition:
         mock_post.assert_called_once()
 
     @patch("app.ehrbase_client.get_or_create_ehr")
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
     def test_create_letter_failure(
-        self, mock_settings, mock_auth, mock_post, mock_get_ehr
+        self, mock_get_settings, mock_auth, mock_post, mock_get_ehr
     ):
         """Test letter creation with error raises EhrbaseClientError."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
         mock_get_ehr.return_value = "ehr-123"
 
@@ -214,6 +229,39 @@ class TestCreateLetterComposition:
 
         assert "Failed to create clinical document" in str(exc_info.value)
 
+    @patch("app.ehrbase_client.get_or_create_ehr")
+    @patch("app.ehrbase_client.create_composition")
+    def test_create_letter_payload(self, mock_create, mock_get_ehr):
+        """Per-letter fields are filled in on top of the shared skeleton."""
+        mock_get_ehr.return_value = "ehr-123"
+
+        ehrbase_client.create_letter_composition(
+            "patient-123", "First", "Body one", "Dr. Smith"
+        )
+        ehrbase_client.create_letter_composition(
+            "patient-123", "Second", "Body two"
+        )
+
+        first = mock_create.call_args_list[0].args[2]
+        second = mock_create.call_args_list[1].args[2]
+        assert mock_create.call_args_list[0].args[1] == (
+            "openEHR-EHR-COMPOSITION.report.v1"
+        )
+        assert first["name"]["value"] == "First"
+        assert first["composer"]["name"] == "Dr. Smith"
+        assert second["name"]["value"] == "Second"
+        assert second["composer"]["name"] == "System"
+        items = first["content"][0]["data"]["items"]
+        assert items[0]["value"]["value"] == "Body one"
+        items = second["content"][0]["data"]["items"]
+        assert items[0]["value"]["value"] == "Body two"
+        assert first["language"]["code_string"] == "en"
+        assert first["category"] is second["category"]
+        start_time = first["context"]["start_time"]["value"]
+        assert re.fullmatch(
+            r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}\+00:00", start_time
+        )
+
 
 class TestListLettersForPatient:
     """Test listing letters for a patient."""
@@ -221,9 +269,7 @@ class TestListLettersForPatient:
     @patch("app.ehrbase_client.get_ehr_by_subject")
     @patch("app.ehrbase_client.query_aql")
     def test_list_letters_success(self, mock_query, mock_get_ehr):
-        """Test successful letter listing."""
-        mock_get_ehr.return_value = {"ehr_id": {"value": "ehr-123"}}
-
+        """Test letters are listed with a single AQL request."""
         mock_query.return_value = {
             "rows": [
                 ["uid-1", "Letter 1", "2024-01-01T10:00:00Z", "Dr. Smith"],
@@ -234,33 +280,28 @@ class TestListLettersForPatient:
         result = ehrbase_client.list_letters_for_patient("patient-123")
 
         assert len(result) == 2
-        mock_get_ehr.assert_called_once_with("patient-123")
-        mock_query.assert_called_once()
-
-    @patch("app.ehrbase_client.get_ehr_by_subject")
-    def test_list_letters_no_ehr(self, mock_get_ehr):
-        """Test listing letters when patient has no EHR."""
-        mock_get_ehr.return_value = None
-
-        result = ehrbase_client.list_letters_for_patient("patient-123")
-
-        assert result == []
+        mock_get_ehr.assert_not_called()
+        aql, params = mock_query.call_args.args
+        assert "$subject_id" in aql
+        assert "patient-123" not in aql
+        assert params == {
+            "subject_id": "patient-123",
+            "subject_namespace": "fhir",
+        }
 
-    @patch("app.ehrbase_client.get_ehr_by_subject")
     @patch("app.ehrbase_client.query_aql")
-    def test_list_letters_empty(self, mock_query, mock_get_ehr):
-        """Test listing letters when none exist."""
-        mock_get_ehr.return_value = {"ehr_id": {"value": "ehr-123"}}
+    def test_list_letters_empty(self, mock_query):
+        """Test listing letters when none exist (or there is no EHR)."""
         mock_query.return_value = {"rows": []}
 
         result = ehrbase_client.list_letters_for_patient("patient-123")
 
         assert result == []
 
-    @patch("app.ehrbase_client.get_ehr_by_subject")
-    def test_list_letters_exception(self, mock_get_ehr):
+    @patch("app.ehrbase_client.query_aql")
+    def test_list_letters_exception(self, mock_query):
         """Test listing letters with exception raises EhrbaseClientError."""
-        mock_get_ehr.side_effect = Exception("Query error")
+        mock_query.side_effect = Exception("Query error")
 
         with pytest.raises(EhrbaseClientError) as exc_info:
             ehrbase_client.list_letters_for_patient("patient-123")
@@ -291,7 +332,7 @@ class TestGetLetterComposition:
 
         assert result is not None
         assert result["uid"]["value"] == "comp-uid-123"
-        mock_get_ehr.assert_called_once_with("patient-123")
+        mock_get_ehr.assert_called_once_with("patient-123", "fhir")
         mock_get_comp.assert_called_once_with("ehr-123", "comp-uid-123")
 
     @patch("app.ehrbase_client.get_ehr_by_subject")
@@ -325,64 +366,123 @@ class TestGetLetterComposition:
 class TestGetAuthHeader:
     """Test auth header generation."""
 
-    @patch("app.ehrbase_client.settings")
-    def test_get_auth_header(self, mock_settings):
+    @patch("app.ehrbase_client.get_settings")
+    def test_get_auth_header(self, mock_get_settings):
         """Test that Basic Auth header is correctly generated."""
         import base64
 
-        mock_settings.EHRBASE_API_USER = "test_user"
-        mock_settings.EHRBASE_API_PASSWORD = MagicMock()
-        mock_settings.EHRBASE_API_PASSWORD.get_secret_value.return_value = (
+        mock_get_settings.return_value.EHRBASE_API_USER = "test_user"
+        mock_get_settings.return_value.EHRBASE_API_PASSWORD = MagicMock()
+        mock_get_settings.return_value.EHRBASE_API_PASSWORD.get_secret_value.return_value = (
             "test_pass"
         )
 
-        result = ehrbase_client.get_auth_header()
+        ehrbase_client._auth_header_value.cache_clear()
+        try:
+            result = ehrbase_client.get_auth_header()
+        finally:
+            ehrbase_client._auth_header_value.cache_clear()
 
         credentials = "test_user:test_pass"
         expected = base64.b64encode(credentials.encode()).decode()
         assert result == {"Authorization": f"Basic {expected}"}
 
+    @patch("app.ehrbase_client.get_settings")
+    def test_auth_header_value_is_cached(self, mock_get_settings):
+        """Credentials are encoded once and reused across calls."""
+        mock_get_settings.return_value.EHRBASE_API_USER = "test_user"
+        mock_get_settings.return_value.EHRBASE_API_PASSWORD = MagicMock()
+        mock_get_settings.return_value.EHRBASE_API_PASSWORD.get_secret_value.return_value = (
+            "test_pass"
+        )
+
+        ehrbase_client._auth_header_value.cache_clear()
+        try:
+            first = ehrbase_client.get_auth_header()
+            second = ehrbase_client.get_auth_header()
+        finally:
+            ehrbase_client._auth_header_value.cache_clear()
+
+        assert first == second
+        assert first is not second  # callers may merge into it
+        get_secret = (
+            mock_get_settings.return_value.EHRBASE_API_PASSWORD.get_secret_value
+        )
+        get_secret.assert_called_once()
+
+
+class TestRequestHeaders:
+    """Test the shared per-shape request headers."""
+
+    @patch("app.ehrbase_client._auth_header_value")
+    @patch("app.ehrbase_client.get_settings")
+    def test_headers_built_once_per_shape(self, mock_get_settings, mock_value):
+        """Each content type/prefer combination is built once and reused."""
+        mock_get_settings.return_value.CLINICAL_SERVICES_ENABLED = True
+        mock_value.return_value = "Basic test"
+
+        json_headers = ehrbase_client._headers("application/json")
+        assert ehrbase_client._headers("application/json") is json_headers
+        assert json_headers == {
+            "Authorization": "Basic test",
+            "Content-Type": "application/json",
+        }
+        composition = ehrbase_client._headers(
+            "application/json", prefer="return=representation"
+        )
+        assert composition["Prefer"] == "return=representation"
+        assert ehrbase_client._headers() == {"Authorization": "Basic test"}
+        mock_value.assert_called()
+
+    @patch("app.ehrbase_client.get_settings")
+    def test_headers_respect_clinical_services_flag(self, mock_get_settings):
+        """Cached headers are not handed out when services are disabled."""
+        mock_get_settings.return_value.CLINICAL_SERVICES_ENABLED = False
+
+        with pytest.raises(RuntimeError):
+            ehrbase_client._headers("application/json")
+
 
 class TestUploadTemplate:
     """Test uploading OpenEHR template."""
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_upload_template(self, mock_settings, mock_auth, mock_post):
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_upload_template(self, mock_get_settings, mock_auth, mock_post):
         """Test successful template upload."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"template_id": "template-123"}
+        mock_response.content = orjson.dumps({"template_id": "template-123"})
         mock_post.return_value = mock_response
 
         result = ehrbase_client.upload_template("<template>XML</template>")
 
         assert result == {"template_id": "template-123"}
         mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert "Content-Type" in call_args[1]["headers"]
-        assert call_args[1]["headers"]["Content-Type"] == "application/xml"
+        mock_auth.assert_called_once_with("application/xml")
 
 
 class TestListTemplates:
     """Test listing available templates."""
 
-    @patch("app.ehrbase_client.requests.get")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_list_templates(self, mock_settings, mock_auth, mock_get):
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_list_templates(self, mock_get_settings, mock_auth, mock_get):
         """Test successful template listing."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {"template_id": "t1"},
-            {"template_id": "t2"},
-        ]
+        mock_response.content = orjson.dumps(
+            [
+                {"template_id": "t1"},
+                {"template_id": "t2"},
+            ]
+        )
         mock_get.return_value = mock_response
 
         result = ehrbase_client.list_templates()
@@ -394,16 +494,18 @@ class TestListTemplates:
 class TestCreateEhr:
     """Test creating new EHR."""
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_create_ehr(self, mock_settings, mock_auth, mock_post):
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_create_ehr(self, mock_get_settings, mock_auth, mock_post):
         """Test successful EHR creation."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"ehr_id": {"value": "new-ehr-123"}}
+        mock_response.content = orjson.dumps(
+            {"ehr_id": {"value": "new-ehr-123"}}
+        )
         mock_post.return_value = mock_response
 
         result = ehrbase_client.create_ehr("patient-123")
@@ -415,37 +517,61 @@ class TestCreateEhr:
 class TestQueryAql:
     """Test AQL query execution."""
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_query_aql(self, mock_settings, mock_auth, mock_post):
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_query_aql(self, mock_get_settings, mock_auth, mock_post):
         """Test successful AQL query."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"rows": [{"col1": "val1"}]}
+        mock_response.content = orjson.dumps({"rows": [{"col1": "val1"}]})
         mock_post.return_value = mock_response
 
         result = ehrbase_client.query_aql("SELECT * FROM EHR")
 
         assert result == {"rows": [{"col1": "val1"}]}
         mock_post.assert_called_once()
+        body = mock_post.call_args[1]["data"]
+        assert orjson.loads(body) == {"q": "SELECT * FROM EHR"}
+
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_query_aql_with_params(
+        self, mock_get_settings, mock_auth, mock_post
+    ):
+        """Query parameters are sent alongside the AQL text."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_auth.return_value = {"Authorization": "Basic test"}
+
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({"rows": []})
+        mock_post.return_value = mock_response
+
+        ehrbase_client.query_aql(
+            "SELECT c FROM EHR e[ehr_id/value=$ehr_id] CONTAINS COMPOSITION c",
+            {"ehr_id": "ehr-123"},
+        )
+
+        body = orjson.loads(mock_post.call_args[1]["data"])
+        assert body["query_parameters"] == {"ehr_id": "ehr-123"}
 
 
 class TestCreateComposition:
     """Test creating composition."""
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_create_composition(self, mock_settings, mock_auth, mock_post):
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_create_composition(self, mock_get_settings, mock_auth, mock_post):
         """Test successful composition creation."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"compositionUid": "comp-123"}
+        mock_response.content = orjson.dumps({"compositionUid": "comp-123"})
         mock_post.return_value = mock_response
 
         composition_data = {"name": {"value": "Test Composition"}}
@@ -460,16 +586,16 @@ class TestCreateComposition:
 class TestGetComposition:
     """Test retrieving composition."""
 
-    @patch("app.ehrbase_client.requests.get")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_get_composition(self, mock_settings, mock_auth, mock_get):
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_get_composition(self, mock_get_settings, mock_auth, mock_get):
         """Test successful composition retrieval."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {"uid": {"value": "comp-123"}}
+        mock_response.content = orjson.dumps({"uid": {"value": "comp-123"}})
         mock_get.return_value = mock_response
 
         result = ehrbase_client.get_composition("ehr-123", "comp-123")
@@ -492,19 +618,23 @@ class TestListCompositionsForEhr:
 
         assert len(result) == 2
         assert result[0]["uid"] == "comp-1"
+        aql, params = mock_query.call_args.args
+        assert "$ehr_id" in aql
+        assert "ehr-123" not in aql
+        assert params == {"ehr_id": "ehr-123"}
 
 
 class TestEhrbaseClientErrorHandling:
     """Test EhrbaseClientError propagation for service failures."""
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
     def test_create_composition_server_error(
-        self, mock_settings, mock_auth, mock_post
+        self, mock_get_settings, mock_auth, mock_post
     ):
         """Server errors in create_composition raise EhrbaseClientError."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_post.side_effect = requests.ConnectionError("Connection refused")
@@ -516,14 +646,14 @@ class TestEhrbaseClientErrorHandling:
 
         assert "Failed to create clinical document" in str(exc_info.value)
 
-    @patch("app.ehrbase_client.requests.get")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
     def test_get_composition_server_error(
-        self, mock_settings, mock_auth, mock_get
+        self, mock_get_settings, mock_auth, mock_get
     ):
         """Server errors in get_composition raise EhrbaseClientError."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_get.side_effect = requests.Timeout("Request timed out")
@@ -533,12 +663,14 @@ class TestEhrbaseClientErrorHandling:
 
         assert "Failed to retrieve clinical document" in str(exc_info.value)
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
-    def test_query_aql_server_error(self, mock_settings, mock_auth, mock_post):
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_query_aql_server_error(
+        self, mock_get_settings, mock_auth, mock_post
+    ):
         """Server errors in query_aql raise EhrbaseClientError."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_post.side_effect = requests.ConnectionError("Connection refused")
@@ -548,6 +680,25 @@ class TestEhrbaseClientErrorHandling:
 
         assert "Failed to query clinical records" in str(exc_info.value)
 
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_get_composition_invalid_json(
+        self, mock_get_settings, mock_auth, mock_get
+    ):
+        """A non-JSON response body raises EhrbaseClientError."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_auth.return_value = {"Authorization": "Basic test"}
+
+        mock_response = MagicMock()
+        mock_response.content = b"<html>Bad Gateway</html>"
+        mock_get.return_value = mock_response
+
+        with pytest.raises(EhrbaseClientError) as exc_info:
+            ehrbase_client.get_composition("ehr-123", "comp-123")
+
+        assert "Failed to retrieve clinical document" in str(exc_info.value)
+
 
 class TestUploadTemplateValidation:
     """Test XML validation in upload_template."""
@@ -566,14 +717,14 @@ class TestUploadTemplateValidation:
 
         assert "Invalid template XML" in str(exc_info.value)
 
-    @patch("app.ehrbase_client.requests.post")
-    @patch("app.ehrbase_client.get_auth_header")
-    @patch("app.ehrbase_client.settings")
+    @patch("app.ehrbase_client._session.post")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
     def test_upload_template_valid_xml_server_error(
-        self, mock_settings, mock_auth, mock_post
+        self, mock_get_settings, mock_auth, mock_post
     ):
         """Valid XML that fails on server raises EhrbaseClientError."""
-        mock_settings.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
         mock_auth.return_value = {"Authorization": "Basic test"}
 
         mock_post.side_effect = requests.ConnectionError("Connection refused")
@@ -582,3 +733,191 @@ class TestUploadTemplateValidation:
             ehrbase_client.upload_template("<template>valid</template>")
 
         assert "Failed to upload clinical template" in str(exc_info.value)
+
+
+class TestSession:
+    """Test the shared EHRbase HTTP session."""
+
+    def test_session_uses_pooled_adapter(self):
+        """HTTP and HTTPS share one adapter with a sized connection pool."""
+        http = ehrbase_client._session.get_adapter("http://ehrbase:8080")
+        https = ehrbase_client._session.get_adapter("https://ehrbase")
+
+        assert http is https
+        assert http._pool_maxsize == 32
+
+
+class TestEhrIdCache:
+    """Test the in-process subject -> ehr_id cache."""
+
+    @patch("app.ehrbase_client.get_ehr_by_subject")
+    def test_hit_skips_lookup(self, mock_get_ehr):
+        """A second lookup for the same patient does not hit EHRbase."""
+        mock_get_ehr.return_value = {"ehr_id": {"value": "ehr-123"}}
+
+        assert ehrbase_client.get_ehr_id("patient-123") == "ehr-123"
+        assert ehrbase_client.get_ehr_id("patient-123") == "ehr-123"
+
+        mock_get_ehr.assert_called_once_with("patient-123", "fhir")
+
+    @patch("app.ehrbase_client.get_ehr_by_subject")
+    def test_miss_is_not_cached(self, mock_get_ehr):
+        """Patients without an EHR are looked up again next time."""
+        mock_get_ehr.side_effect = [None, {"ehr_id": {"value": "ehr-9"}}]
+
+        assert ehrbase_client.get_ehr_id("patient-9") is None
+        assert ehrbase_client.get_ehr_id("patient-9") == "ehr-9"
+        assert mock_get_ehr.call_count == 2
+
+    @patch("app.ehrbase_client.get_ehr_by_subject")
+    @patch("app.ehrbase_client.create_ehr")
+    def test_create_populates_cache(self, mock_create, mock_get_ehr):
+        """A newly created EHR is served from cache afterwards."""
+        mock_create.return_value = {"ehr_id": {"value": "new-ehr"}}
+
+        assert ehrbase_client.get_or_create_ehr("patient-new") == "new-ehr"
+        assert ehrbase_client.get_or_create_ehr("patient-new") == "new-ehr"
+        assert ehrbase_client.get_ehr_id("patient-new") == "new-ehr"
+
+        mock_create.assert_called_once()
+        mock_get_ehr.assert_not_called()
+
+    @patch("app.ehrbase_client._EHR_ID_CACHE_MAX", 2)
+    def test_cache_is_bounded(self):
+        """The oldest entry is evicted once the cache is full."""
+        ehrbase_client._remember_ehr_id("p1", "fhir", "e1")
+        ehrbase_client._remember_ehr_id("p2", "fhir", "e2")
+        ehrbase_client._remember_ehr_id("p3", "fhir", "e3")
+
+        assert ("p1", "fhir") not in ehrbase_client._ehr_id_cache
+        assert len(ehrbase_client._ehr_id_cache) == 2
+
+
+class TestAsyncClient:
+    """Test the async EHRbase read path."""
+
+    @staticmethod
+    def _client(handler) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url="http://test-ehrbase:8080/rest/openehr/v1",
+            transport=httpx.MockTransport(handler),
+        )
+
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_alist_letters_single_request(self, mock_get_settings, mock_auth):
+        """Listing letters sends one parameterised AQL query."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_auth.return_value = {"Authorization": "Basic test"}
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"rows": [["uid-1"]]})
+
+        client = self._client(handler)
+        with patch(
+            "app.ehrbase_client._get_async_client", return_value=client
+        ):
+            rows = asyncio.run(
+                ehrbase_client.alist_letters_for_patient("patient-1")
+            )
+
+        assert rows == [["uid-1"]]
+        assert len(seen) == 1
+        body = orjson.loads(seen[0].content)
+        assert body["query_parameters"] == {
+            "subject_id": "patient-1",
+            "subject_namespace": "fhir",
+        }
+
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_aget_letter_no_ehr(self, mock_get_settings, mock_auth):
+        """A 404 on EHR lookup yields None and is not cached."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_auth.return_value = {"Authorization": "Basic test"}
+
+        client = self._client(lambda request: httpx.Response(404))
+        with patch(
+            "app.ehrbase_client._get_async_client", return_value=client
+        ):
+            result = asyncio.run(
+                ehrbase_client.aget_letter_composition("patient-2", "c1")
+            )
+
+        assert result is None
+        assert ("patient-2", "fhir") not in ehrbase_client._ehr_id_cache
+
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_aget_composition_server_error(self, mock_get_settings, mock_auth):
+        """Server errors raise EhrbaseClientError."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_auth.return_value = {"Authorization": "Basic test"}
+
+        client = self._client(lambda request: httpx.Response(500))
+        with (
+            patch("app.ehrbase_client._get_async_client", return_value=client),
+            pytest.raises(EhrbaseClientError) as exc_info,
+        ):
+            asyncio.run(ehrbase_client.aget_composition("ehr-1", "c1"))
+
+        assert "Failed to retrieve clinical document" in str(exc_info.value)
+
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_acreate_letter_existing_ehr(self, mock_get_settings, mock_auth):
+        """A 409 on EHR creation falls back to the existing EHR."""
+        mock_get_settings.return_value.EHRBASE_URL = "http://test-ehrbase:8080"
+        mock_auth.return_value = {"Authorization": "Basic test"}
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((request.method, request.url.path))
+            if request.method == "POST" and request.url.path.endswith("/ehr"):
+                return httpx.Response(409)
+            if request.method == "GET":
+                return httpx.Response(200, json={"ehr_id": {"value": "ehr-9"}})
+            return httpx.Response(201, json={"uid": {"value": "c1"}})
+
+        client = self._client(handler)
+        with patch(
+            "app.ehrbase_client._get_async_client", return_value=client
+        ):
+            result = asyncio.run(
+                ehrbase_client.acreate_letter_composition(
+                    "patient-3", "Title", "Body"
+                )
+            )
+
+        assert result == {"uid": {"value": "c1"}}
+        assert seen[-1] == (
+            "POST",
+            "/rest/openehr/v1/ehr/ehr-9/composition",
+        )
+        assert ehrbase_client._ehr_id_cache[("patient-3", "fhir")] == "ehr-9"
+
+
+class TestApiUrls:
+    """Test EHRbase URL construction."""
+
+    @patch("app.ehrbase_client._session.get")
+    @patch("app.ehrbase_client._headers")
+    @patch("app.ehrbase_client.get_settings")
+    def test_composition_url(self, mock_get_settings, mock_auth, mock_get):
+        """Paths are joined onto the API root without doubled slashes."""
+        mock_get_settings.return_value.EHRBASE_URL = (
+            "http://test-ehrbase:8080/ehrbase/"
+        )
+        mock_auth.return_value = {"Authorization": "Basic test"}
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({})
+        mock_get.return_value = mock_response
+
+        ehrbase_client.get_composition("ehr-1", "comp-1")
+
+        assert mock_get.call_args.args[0] == (
+            "http://test-ehrbase:8080/ehrbase/rest/openehr/v1"
+            "/ehr/ehr-1/composition/comp-1"
+        )
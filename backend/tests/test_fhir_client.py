@@ -1,21 +1,38 @@
 """Unit tests for FHIR client functions."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock, call, patch
 
+import httpx
+import orjson
 import pytest
+import requests
+from fhirclient.server import FHIRNotFoundException
 
 from app import fhir_client
 from app.fhir_client import FhirClientError
 
 
+def _mock_fhir_server(body: dict | None = None) -> MagicMock:
+    """Build a mock FHIRClient whose session answers with ``body``."""
+    mock_fhir = MagicMock()
+    mock_fhir.server.base_uri = "http://test-fhir:8080/fhir/"
+    content = orjson.dumps(body) if body is not None else b""
+    mock_fhir.server.session.patch.return_value.content = content
+    return mock_fhir
+
+
 class TestFhirClient:
     """Test FHIR client initialization."""
 
     @patch("app.fhir_client.client.FHIRClient")
-    @patch("app.fhir_client.settings")
-    def test_get_fhir_client(self, mock_settings, mock_client_class):
+    @patch("app.fhir_client.get_settings")
+    def test_get_fhir_client(self, mock_get_settings, mock_client_class):
         """Test FHIR client initialization."""
-        mock_settings.FHIR_SERVER_URL = "http://test-fhir:8080/fhir"
+        mock_get_settings.return_value.FHIR_SERVER_URL = (
+            "http://test-fhir:8080/fhir"
+        )
 
         fhir_client.get_fhir_client()
 
@@ -27,6 +44,103 @@ class TestFhirClient:
             == "http://test-fhir:8080/fhir"
         )
 
+    @patch("app.fhir_client.client.FHIRClient")
+    @patch("app.fhir_client.get_settings")
+    def test_get_fhir_client_is_reused(
+        self, mock_get_settings, mock_client_class
+    ):
+        """Test the client is built once and shared between calls."""
+        mock_get_settings.return_value.FHIR_SERVER_URL = (
+            "http://test-fhir:8080/fhir"
+        )
+
+        first = fhir_client.get_fhir_client()
+        second = fhir_client.get_fhir_client()
+
+        assert first is second
+        mock_client_class.assert_called_once()
+
+    def test_fhir_session_uses_pooled_adapter(self):
+        """Test the client's session pools connections and retries 5xx."""
+        fhir = fhir_client._fhir_client()
+
+        adapter = fhir.server.session.get_adapter("http://fhir:8080/fhir")
+        assert adapter is fhir.server.session.get_adapter("https://fhir")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    @patch("app.fhir_client.client.FHIRClient")
+    @patch("app.fhir_client.get_settings")
+    def test_get_fhir_client_checks_flag_each_call(
+        self, mock_get_settings, mock_client_class
+    ):
+        """Test a cached client is not returned once services are off."""
+        fhir_client.get_fhir_client()
+        mock_get_settings.return_value.CLINICAL_SERVICES_ENABLED = False
+
+        with pytest.raises(fhir_client.FhirCommunicationError):
+            fhir_client.get_fhir_client()
+
+
+class TestJsonHelpers:
+    """Test the orjson-backed request helpers."""
+
+    @patch("app.fhir_client.get_fhir_client")
+    def test_get_json_decodes_body(self, mock_get_client):
+        """Test GET resolves against the base URL and decodes the body."""
+        mock_fhir = MagicMock()
+        mock_fhir.server.base_uri = "http://test-fhir:8080/fhir/"
+        response = mock_fhir.server.session.get.return_value
+        response.content = b'{"resourceType": "Patient", "id": "1"}'
+        mock_get_client.return_value = mock_fhir
+
+        result = fhir_client._get_json("Patient/1")
+
+        assert result == {"resourceType": "Patient", "id": "1"}
+        assert mock_fhir.server.session.get.call_args.args[0] == (
+            "http://test-fhir:8080/fhir/Patient/1"
+        )
+        mock_fhir.server.raise_for_status.assert_called_once_with(response)
+
+    @patch("app.fhir_client.get_fhir_client")
+    def test_get_json_raises_not_found(self, mock_get_client):
+        """Test fhirclient's status handling is kept for GETs."""
+        mock_fhir = MagicMock()
+        mock_fhir.server.base_uri = "http://test-fhir:8080/fhir/"
+        mock_fhir.server.raise_for_status.side_effect = FHIRNotFoundException(
+            MagicMock(status_code=404)
+        )
+        mock_get_client.return_value = mock_fhir
+
+        with pytest.raises(FHIRNotFoundException):
+            fhir_client._get_json("Patient/missing")
+
+
+class TestAvatarGradientExtension:
+    """Test the avatar gradient extension helper."""
+
+    def test_gradient_is_derived_from_patient_id(self):
+        """Test retries of the same create produce the same extension."""
+        first = {"resourceType": "Patient", "id": "abc"}
+        second = {"resourceType": "Patient", "id": "abc"}
+
+        fhir_client.add_avatar_gradient_extension(first)
+        fhir_client.add_avatar_gradient_extension(second)
+
+        assert first["extension"] == second["extension"]
+
+    def test_explicit_gradient_is_used(self):
+        """Test an explicit gradient index is stored as given."""
+        patient = {"resourceType": "Patient", "extension": [{"url": "x"}]}
+
+        fhir_client.add_avatar_gradient_extension(patient, gradient_index=5)
+
+        assert patient["extension"][1] == {
+            "url": fhir_client.AVATAR_GRADIENT_EXTENSION_URL,
+            "valueInteger": 5,
+        }
+
 
 class TestCreateFhirPatient:
     """Test creating a new FHIR patient."""
@@ -35,372 +149,1017 @@ class TestCreateFhirPatient:
     def test_create_fhir_patient_success(self, mock_get_client):
         """Test successful patient creation."""
         mock_fhir = MagicMock()
-        mock_fhir.server.put_json.return_value = None
+        mock_fhir.server.base_uri = "http://test-fhir:8080/fhir/"
         mock_get_client.return_value = mock_fhir
 
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient = MagicMock()
-            mock_patient.as_json.return_value = {
-                "resourceType": "Patient",
-                "id": "new123",
-                "name": [{"family": "Smith", "given": ["Jane"]}],
-            }
-            mock_patient_class.return_value = mock_patient
-
-            result = fhir_client.create_fhir_patient(
-                "Jane", "Smith", patient_id="new123"
-            )
+        result = fhir_client.create_fhir_patient(
+            "Jane", "Smith", patient_id="new123"
+        )
 
         assert result["id"] == "new123"
+        put = mock_fhir.server.session.put
+        assert put.call_args.args[0] == (
+            "http://test-fhir:8080/fhir/Patient/new123"
+        )
+        assert orjson.loads(put.call_args.kwargs["data"])["id"] == "new123"
+        assert (
+            put.call_args.kwargs["headers"]["Content-Type"]
+            == "application/fhir+json"
+        )
 
     @patch("app.fhir_client.get_fhir_client")
     def test_create_fhir_patient_exception(self, mock_get_client):
         """Test patient creation with exception."""
         mock_fhir = MagicMock()
-        mock_fhir.server.put_json.side_effect = Exception("Creation failed")
+        mock_fhir.server.base_uri = "http://test-fhir:8080/fhir/"
+        mock_fhir.server.session.put.side_effect = requests.HTTPError(
+            "Creation failed"
+        )
         mock_get_client.return_value = mock_fhir
 
-        with patch("app.fhir_client.Patient"):
-            with pytest.raises(FhirClientError) as exc_info:
-                fhir_client.create_fhir_patient(
-                    "Test", "User", patient_id="123"
-                )
+        with pytest.raises(FhirClientError) as exc_info:
+            fhir_client.create_fhir_patient("Test", "User", patient_id="123")
+
+        assert "Failed to create patient record" in str(exc_info.value)
 
-            assert "Failed to create patient record" in str(exc_info.value)
+    @patch("app.fhir_client.generate_avatar_gradient_index", return_value=7)
+    @patch("app.fhir_client.get_fhir_client")
+    def test_create_fhir_patient_resource(self, mock_get_client, _mock_index):
+        """Test the full Patient resource is built as FHIR JSON."""
+        mock_fhir = MagicMock()
+        mock_fhir.server.base_uri = "http://test-fhir:8080/fhir/"
+        mock_get_client.return_value = mock_fhir
 
+        result = fhir_client.create_fhir_patient(
+            "Jane",
+            "Smith",
+            birth_date="1990-05-01",
+            gender="Female",
+            nhs_number="9434765919",
+            mrn="MRN1",
+            patient_id="new123",
+        )
 
-class TestReadFhirPatient:
-    """Test reading a FHIR patient."""
+        assert result == {
+            "resourceType": "Patient",
+            "id": "new123",
+            "name": [
+                {"use": "official", "given": ["Jane"], "family": "Smith"}
+            ],
+            "birthDate": "1990-05-01",
+            "gender": "female",
+            "identifier": [
+                {
+                    "system": "https://fhir.nhs.uk/Id/nhs-number",
+                    "value": "9434765919",
+                },
+                {
+                    "system": "http://hospital.example.org/identifiers/mrn",
+                    "value": "MRN1",
+                },
+            ],
+            "extension": [
+                {
+                    "url": fhir_client.AVATAR_GRADIENT_EXTENSION_URL,
+                    "valueInteger": 7,
+                }
+            ],
+        }
+        sent = orjson.loads(mock_fhir.server.session.put.call_args[1]["data"])
+        assert sent == result
 
     @patch("app.fhir_client.get_fhir_client")
-    def test_read_fhir_patient_success(self, mock_get_client):
-        """Test successful patient read."""
+    def test_create_fhir_patient_rejects_bad_birth_date(self, mock_get_client):
+        """Test malformed birth dates are rejected before any request."""
         mock_fhir = MagicMock()
         mock_get_client.return_value = mock_fhir
 
-        mock_patient = MagicMock()
-        mock_patient.as_json.return_value = {
+        with pytest.raises(ValueError):
+            fhir_client.create_fhir_patient(
+                "Jane", "Smith", birth_date="01/05/1990"
+            )
+
+        mock_fhir.server.session.put.assert_not_called()
+
+    @pytest.mark.parametrize("value", ["1990", "1990-05", "2000-02-29"])
+    def test_validate_fhir_date_accepts(self, value):
+        """Test partial and full FHIR dates are accepted."""
+        fhir_client._validate_fhir_date(value)
+
+    @pytest.mark.parametrize(
+        "value", ["0000", "1990-13", "1990-02-30", "1990-5-1", "1990-05-01T"]
+    )
+    def test_validate_fhir_date_rejects(self, value):
+        """Test malformed or impossible dates raise ValueError."""
+        with pytest.raises(ValueError):
+            fhir_client._validate_fhir_date(value)
+
+
+class TestDeleteFhirPatient:
+    """Test deleting a FHIR patient."""
+
+    @patch("app.fhir_client._get_json")
+    @patch("app.fhir_client.get_fhir_client")
+    def test_delete_fhir_patient(self, mock_get_client, mock_get_json):
+        """Test an existing patient is deleted by id."""
+        mock_fhir = MagicMock()
+        mock_get_client.return_value = mock_fhir
+
+        assert fhir_client.delete_fhir_patient("123") is True
+        mock_fhir.server.delete_json.assert_called_once_with("Patient/123")
+
+    @patch("app.fhir_client._get_json")
+    @patch("app.fhir_client.get_fhir_client")
+    def test_delete_missing_patient(self, mock_get_client, mock_get_json):
+        """Test deleting an unknown patient returns False."""
+        mock_fhir = MagicMock()
+        mock_get_client.return_value = mock_fhir
+        mock_get_json.side_effect = FHIRNotFoundException(
+            MagicMock(status_code=404)
+        )
+
+        assert fhir_client.delete_fhir_patient("999") is False
+        mock_fhir.server.delete_json.assert_not_called()
+
+
+class TestReadFhirPatient:
+    """Test reading a FHIR patient."""
+
+    @patch("app.fhir_client.get_settings")
+    @patch("app.fhir_client._get_json")
+    def test_read_fhir_patient_success(self, mock_get_json, mock_get_settings):
+        """Test successful patient read."""
+        mock_get_json.return_value = {
             "resourceType": "Patient",
             "id": "123",
             "name": [{"family": "Doe", "given": ["John"]}],
         }
 
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient_class.read.return_value = mock_patient
-            result = fhir_client.read_fhir_patient("123")
+        result = fhir_client.read_fhir_patient("123")
 
         assert result["id"] == "123"
+        mock_get_json.assert_called_once_with("Patient/123", None)
 
-    @patch("app.fhir_client.get_fhir_client")
-    def test_read_fhir_patient_not_found(self, mock_get_client):
+    @patch("app.fhir_client.get_settings")
+    @patch("app.fhir_client._get_json")
+    def test_read_fhir_patient_not_found(
+        self, mock_get_json, mock_get_settings
+    ):
         """Test reading non-existent patient."""
-        mock_fhir = MagicMock()
-        mock_get_client.return_value = mock_fhir
+        mock_get_json.side_effect = FHIRNotFoundException(
+            MagicMock(status_code=404)
+        )
 
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient_class.read.side_effect = Exception(
-                "Patient not found"
-            )
-            result = fhir_client.read_fhir_patient("999")
+        result = fhir_client.read_fhir_patient("999")
 
         assert result is None
 
+    @patch("app.fhir_client.get_fhir_client")
+    def test_read_fhir_patient_services_disabled(self, mock_get_client):
+        """Test the disabled-services error is not masked."""
+        mock_get_client.side_effect = fhir_client.FhirCommunicationError(
+            "Clinical services are disabled in this deployment"
+        )
+
+        with pytest.raises(fhir_client.FhirCommunicationError):
+            fhir_client.read_fhir_patient("123")
 
-class TestListFhirPatients:
-    """Test listing all FHIR patients."""
+
+@patch("app.fhir_client.get_settings")
+class TestPatientCache:
+    """Test the revalidation cache behind patient reads."""
+
+    @patch("app.fhir_client._get_json")
+    def test_repeat_reads_are_revalidated(
+        self, mock_get_json, mock_get_settings
+    ):
+        """Test a second read goes to the server, conditional on the first."""
+        resource = {"resourceType": "Patient", "id": "1"}
+        mock_get_json.return_value = resource
+
+        fhir_client.read_fhir_patient("1")
+        fhir_client.read_fhir_patient("1")
+
+        assert mock_get_json.call_args_list == [
+            call("Patient/1", None),
+            call("Patient/1", resource),
+        ]
+
+    @patch("app.fhir_client._get_json")
+    def test_not_found_is_not_cached(self, mock_get_json, mock_get_settings):
+        """Test a missing patient is looked up again next time."""
+        mock_get_json.side_effect = FHIRNotFoundException(
+            MagicMock(status_code=404)
+        )
+
+        assert fhir_client.read_fhir_patient("1") is None
+        assert fhir_client.read_fhir_patient("1") is None
+        assert mock_get_json.call_count == 2
 
     @patch("app.fhir_client.get_fhir_client")
-    def test_list_fhir_patients_success(self, mock_get_client):
-        """Test successful patient listing."""
-        mock_fhir = MagicMock()
-        mock_fhir.server = MagicMock()
-        mock_get_client.return_value = mock_fhir
+    @patch("app.fhir_client._get_json")
+    def test_update_invalidates_entry(
+        self, mock_get_json, mock_get_client, mock_get_settings
+    ):
+        """Test updating a patient drops its cached read."""
+        mock_get_json.return_value = {"id": "1"}
+        mock_get_client.return_value = _mock_fhir_server({"id": "1"})
+        fhir_client.read_fhir_patient("1")
 
-        mock_patient1 = MagicMock()
-        mock_patient1.as_json.return_value = {
-            "resourceType": "Patient",
-            "id": "1",
-        }
-        mock_patient2 = MagicMock()
-        mock_patient2.as_json.return_value = {
-            "resourceType": "Patient",
-            "id": "2",
+        fhir_client.update_fhir_patient("1", {"sex": "male"})
+        fhir_client.read_fhir_patient("1")
+
+        assert mock_get_json.call_args == call("Patient/1", None)
+
+    @patch("app.fhir_client.get_fhir_client")
+    def test_entry_is_revalidated_by_version(
+        self, mock_get_client, mock_get_settings
+    ):
+        """Test a cached read is conditional and reused on a 304."""
+        resource = {"id": "1", "meta": {"versionId": "3"}}
+        server = mock_get_client.return_value.server
+        server.base_uri = "http://test-fhir:8080/fhir/"
+        session = server.session
+        session.get.return_value = MagicMock(status_code=304)
+        fhir_client._remember_patient("1", resource)
+
+        assert fhir_client.read_fhir_patient("1") is resource
+        assert fhir_client.read_fhir_patient("1") is resource
+
+        assert session.get.call_count == 2
+        headers = session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == 'W/"3"'
+
+    def test_cache_evicts_oldest_when_full(self, mock_get_settings):
+        """Test the cache is bounded."""
+        with patch("app.fhir_client._PATIENT_CACHE_MAX", 2):
+            fhir_client._remember_patient("a", {"id": "a"})
+            fhir_client._remember_patient("b", {"id": "b"})
+            fhir_client._remember_patient("c", {"id": "c"})
+
+        assert list(fhir_client._patient_cache) == ["b", "c"]
+
+
+@patch("app.fhir_client.get_settings")
+class TestReadFhirPatients:
+    """Test batched patient reads."""
+
+    @patch("app.fhir_client._get_json")
+    def test_reads_ids_in_one_search(self, mock_get_json, mock_get_settings):
+        """Test several ids are fetched with a single _id search."""
+        mock_get_json.return_value = {
+            "entry": [
+                {"resource": {"resourceType": "Patient", "id": "1"}},
+                {"resource": {"resourceType": "Patient", "id": "2"}},
+            ]
         }
 
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_search = MagicMock()
-            mock_search.perform_resources.return_value = [
-                mock_patient1,
-                mock_patient2,
+        result = fhir_client.read_fhir_patients(["1", "2", "3", "1"])
+
+        assert set(result) == {"1", "2"}
+        mock_get_json.assert_called_once_with("Patient?_id=1%2C2%2C3&_count=3")
+
+    @patch("app.fhir_client._get_json")
+    def test_cached_patients_are_refreshed(
+        self, mock_get_json, mock_get_settings
+    ):
+        """Test cached ids are searched for again and their entries updated."""
+        fhir_client._remember_patient("1", {"id": "1", "gender": "female"})
+        mock_get_json.return_value = {
+            "entry": [
+                {"resource": {"id": "1", "gender": "male"}},
+                {"resource": {"id": "2"}},
             ]
-            mock_patient_class.where.return_value = mock_search
+        }
+
+        result = fhir_client.read_fhir_patients(["1", "2"])
+
+        assert result == {"1": {"id": "1", "gender": "male"}, "2": {"id": "2"}}
+        mock_get_json.assert_called_once_with("Patient?_id=1%2C2&_count=2")
+        assert fhir_client._patient_cache["1"] == {"id": "1", "gender": "male"}
+
+    @patch("app.fhir_client._get_json")
+    def test_large_id_sets_are_chunked(self, mock_get_json, mock_get_settings):
+        """Test ids are split across searches of bounded size."""
+        mock_get_json.return_value = {}
+
+        with patch("app.fhir_client._PATIENT_BATCH_SIZE", 2):
+            fhir_client.read_fhir_patients(["1", "2", "3"])
+
+        assert mock_get_json.call_count == 2
+
+    @patch("app.fhir_client._get_json")
+    def test_server_error_raises(self, mock_get_json, mock_get_settings):
+        """Test search failures are wrapped in FhirClientError."""
+        mock_get_json.side_effect = requests.ConnectionError(
+            "Connection refused"
+        )
+
+        with pytest.raises(FhirClientError) as exc_info:
+            fhir_client.read_fhir_patients(["1"])
+
+        assert "Failed to retrieve patient list" in str(exc_info.value)
 
-            result = fhir_client.list_fhir_patients()
+
+class TestListFhirPatients:
+    """Test listing all FHIR patients."""
+
+    @patch("app.fhir_client._get_json")
+    def test_list_fhir_patients_success(self, mock_get_json):
+        """Test successful patient listing."""
+        mock_get_json.return_value = {
+            "resourceType": "Bundle",
+            "entry": [
+                {"resource": {"resourceType": "Patient", "id": "1"}},
+                {"resource": {"resourceType": "Patient", "id": "2"}},
+            ],
+        }
+
+        result = fhir_client.list_fhir_patients()
 
         assert len(result) == 2
         assert result[0]["id"] == "1"
         assert result[1]["id"] == "2"
+        mock_get_json.assert_called_once_with("Patient?_count=50")
 
-    @patch("app.fhir_client.get_fhir_client")
-    def test_list_fhir_patients_empty(self, mock_get_client):
+    @patch("app.fhir_client._get_json")
+    def test_list_fhir_patients_empty(self, mock_get_json):
         """Test patient listing with no patients."""
-        mock_fhir = MagicMock()
-        mock_fhir.server = MagicMock()
-        mock_get_client.return_value = mock_fhir
-
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_search = MagicMock()
-            mock_search.perform_resources.return_value = []
-            mock_patient_class.where.return_value = mock_search
+        mock_get_json.return_value = {
+            "resourceType": "Bundle",
+            "total": 0,
+        }
 
-            result = fhir_client.list_fhir_patients()
+        result = fhir_client.list_fhir_patients()
 
         assert result == []
 
+    @patch("app.fhir_client._get_json")
+    def test_list_fhir_patients_follows_next_links(self, mock_get_json):
+        """Test every page is fetched by following next links."""
+        next_url = "http://fhir:8080/fhir?_getpages=abc&_offset=10"
+        mock_get_json.side_effect = [
+            {
+                "entry": [{"resource": {"id": "1"}}],
+                "link": [
+                    {"relation": "self", "url": "Patient?_count=10"},
+                    {"relation": "next", "url": next_url},
+                ],
+            },
+            {"entry": [{"resource": {"id": "2"}}]},
+        ]
+
+        result = fhir_client.list_fhir_patients(page_size=10)
+
+        assert [p["id"] for p in result] == ["1", "2"]
+        assert mock_get_json.call_args_list[1].args == (next_url,)
+
+    @patch("app.fhir_client._get_json")
+    def test_list_fhir_patients_with_elements(self, mock_get_json):
+        """Test a subset of elements is requested with _elements."""
+        mock_get_json.return_value = {}
+
+        fhir_client.list_fhir_patients(
+            elements=fhir_client.PATIENT_SUMMARY_ELEMENTS
+        )
+
+        mock_get_json.assert_called_once_with(
+            "Patient?_count=50&_elements="
+            "identifier%2Cname%2Cgender%2CbirthDate%2Cextension"
+        )
+
+    @patch("app.fhir_client._get_json")
+    def test_list_fhir_patients_page_returns_cursor(self, mock_get_json):
+        """Test a single page returns its resources and next cursor."""
+        mock_get_json.return_value = {
+            "entry": [{"resource": {"id": "1"}}],
+            "link": [{"relation": "next", "url": "http://fhir/next"}],
+        }
+
+        page, cursor = fhir_client.list_fhir_patients_page(page_size=1)
+
+        assert page == [{"id": "1"}]
+        assert cursor == "http://fhir/next"
+        mock_get_json.assert_called_once_with("Patient?_count=1")
+
 
 class TestUpdateFhirPatient:
     """Test updating a FHIR patient."""
 
+    @staticmethod
+    def _operations(mock_fhir: MagicMock) -> list[dict]:
+        call = mock_fhir.server.session.patch.call_args
+        return orjson.loads(call.kwargs["data"])
+
     @patch("app.fhir_client.get_fhir_client")
     def test_update_fhir_patient_success(self, mock_get_client):
-        """Test successful patient update."""
-        mock_fhir = MagicMock()
+        """Test successful patient update with a single PATCH."""
+        mock_fhir = _mock_fhir_server(
+            {
+                "resourceType": "Patient",
+                "id": "123",
+                "name": [{"family": "Updated", "given": ["Name"]}],
+            }
+        )
         mock_get_client.return_value = mock_fhir
 
-        mock_patient = MagicMock()
-        mock_patient.as_json.return_value = {
-            "resourceType": "Patient",
-            "id": "123",
-            "name": [{"family": "Updated", "given": ["Name"]}],
-        }
-
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient_class.read.return_value = mock_patient
-            mock_patient.update.return_value = {"updated": True}
-
-            demographics = {"name": [{"family": "Updated", "given": ["Name"]}]}
-            result = fhir_client.update_fhir_patient("123", demographics)
+        demographics = {"given_name": "Name", "family_name": "Updated"}
+        result = fhir_client.update_fhir_patient("123", demographics)
 
         assert result["id"] == "123"
+        mock_fhir.server.session.get.assert_not_called()
+        call = mock_fhir.server.session.patch.call_args
+        assert call.args[0] == "http://test-fhir:8080/fhir/Patient/123"
+        assert (
+            call.kwargs["headers"]["Content-Type"]
+            == "application/json-patch+json"
+        )
 
     @patch("app.fhir_client.get_fhir_client")
     def test_update_fhir_patient_not_found(self, mock_get_client):
         """Test updating non-existent patient."""
-        mock_fhir = MagicMock()
+        mock_fhir = _mock_fhir_server()
+        mock_fhir.server.raise_for_status.side_effect = FHIRNotFoundException(
+            MagicMock(status_code=404)
+        )
         mock_get_client.return_value = mock_fhir
 
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient_class.read.side_effect = Exception(
-                "Patient not found"
-            )
-            result = fhir_client.update_fhir_patient("999", {"name": []})
+        result = fhir_client.update_fhir_patient("999", {"given_name": "X"})
 
         assert result is None
 
+    @patch("app.fhir_client.read_fhir_patient")
     @patch("app.fhir_client.get_fhir_client")
-    def test_update_fhir_patient_with_name(self, mock_get_client):
-        """Test updating patient with name."""
-        mock_fhir = MagicMock()
-        mock_get_client.return_value = mock_fhir
+    def test_update_fhir_patient_without_changes(
+        self, mock_get_client, mock_read
+    ):
+        """Test an update with no known fields just reads the patient."""
+        mock_read.return_value = {"resourceType": "Patient", "id": "123"}
+
+        result = fhir_client.update_fhir_patient("123", {"name": []})
 
-        mock_patient = MagicMock()
-        mock_patient.as_json.return_value = {
+        assert result == {"resourceType": "Patient", "id": "123"}
+        mock_get_client.assert_not_called()
+
+    @patch("app.fhir_client.read_fhir_patient")
+    @patch("app.fhir_client.get_fhir_client")
+    def test_update_fhir_patient_rereads_unversioned_existing(
+        self, mock_get_client, mock_read
+    ):
+        """Test a resource without a version is not returned unchecked."""
+        mock_read.return_value = {"resourceType": "Patient", "id": "123"}
+        existing = {"resourceType": "Patient", "id": "123"}
+
+        result = fhir_client.update_fhir_patient(
+            "123", {"name": []}, existing=existing
+        )
+
+        assert result is mock_read.return_value
+        mock_get_client.assert_not_called()
+
+    @patch("app.fhir_client.get_fhir_client")
+    def test_update_fhir_patient_unchanged_skips_patch(self, mock_get_client):
+        """Test a current resource holding the values is not patched."""
+        mock_fhir = _mock_fhir_server()
+        mock_fhir.server.session.get.return_value = MagicMock(status_code=304)
+        mock_get_client.return_value = mock_fhir
+        existing = {
+            "resourceType": "Patient",
             "id": "123",
-            "name": [{"family": "Doe", "given": ["John"]}],
+            "meta": {"versionId": "2"},
+            "birthDate": "1990-01-01",
+            "gender": "female",
         }
 
-        with (
-            patch("app.fhir_client.Patient") as mock_patient_class,
-            patch("app.fhir_client.HumanName") as mock_name_class,
-        ):
-            mock_patient_class.read.return_value = mock_patient
-            mock_name = MagicMock()
-            mock_name_class.return_value = mock_name
+        result = fhir_client.update_fhir_patient(
+            "123",
+            {"date_of_birth": "1990-01-01", "sex": "Female"},
+            existing=existing,
+        )
 
-            demographics = {"given_name": "Jane", "family_name": "Smith"}
-            result = fhir_client.update_fhir_patient("123", demographics)
+        assert result is existing
+        headers = mock_fhir.server.session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == 'W/"2"'
+        mock_fhir.server.session.patch.assert_not_called()
 
-        assert result is not None
-        assert mock_name.given == ["Jane"]
-        assert mock_name.family == "Smith"
-        assert mock_name.use == "official"
+    @patch("app.fhir_client.get_fhir_client")
+    def test_update_fhir_patient_rediffs_stale_existing(self, mock_get_client):
+        """Test a stale resource is diffed again against a fresh read."""
+        mock_fhir = _mock_fhir_server({"id": "123"})
+        mock_fhir.server.session.get.return_value = MagicMock(
+            status_code=200,
+            content=orjson.dumps(
+                {"id": "123", "meta": {"versionId": "3"}, "gender": "male"}
+            ),
+        )
+        mock_get_client.return_value = mock_fhir
+        existing = {
+            "id": "123",
+            "meta": {"versionId": "2"},
+            "gender": "female",
+        }
+
+        fhir_client.update_fhir_patient(
+            "123", {"sex": "female"}, existing=existing
+        )
+
+        assert self._operations(mock_fhir) == [
+            {"op": "add", "path": "/gender", "value": "female"}
+        ]
+        headers = mock_fhir.server.session.patch.call_args.kwargs["headers"]
+        assert headers["If-Match"] == 'W/"3"'
 
     @patch("app.fhir_client.get_fhir_client")
-    def test_update_fhir_patient_with_birthdate(self, mock_get_client):
-        """Test updating patient with birth date."""
-        mock_fhir = MagicMock()
+    def test_update_fhir_patient_patches_only_changed(self, mock_get_client):
+        """Test only fields differing from the resource are patched."""
+        mock_fhir = _mock_fhir_server({"id": "123"})
         mock_get_client.return_value = mock_fhir
+        existing = {
+            "id": "123",
+            "meta": {"versionId": "4"},
+            "birthDate": "1990-01-01",
+        }
+
+        fhir_client.update_fhir_patient(
+            "123",
+            {"date_of_birth": "1990-01-01", "sex": "male"},
+            existing=existing,
+        )
+
+        assert self._operations(mock_fhir) == [
+            {"op": "add", "path": "/gender", "value": "male"}
+        ]
+        headers = mock_fhir.server.session.patch.call_args.kwargs["headers"]
+        assert headers["If-Match"] == 'W/"4"'
 
-        mock_patient = MagicMock()
-        mock_patient.as_json.return_value = {
+    @patch("app.fhir_client.get_fhir_client")
+    def test_update_fhir_patient_version_conflict_sends_all_fields(
+        self, mock_get_client
+    ):
+        """Test a 412 on the diffed patch is retried with every field."""
+        mock_fhir = _mock_fhir_server()
+        mock_fhir.server.session.patch.side_effect = [
+            MagicMock(status_code=412),
+            MagicMock(status_code=200, content=orjson.dumps({"id": "123"})),
+        ]
+        mock_get_client.return_value = mock_fhir
+        existing = {
             "id": "123",
+            "meta": {"versionId": "4"},
             "birthDate": "1990-01-01",
         }
 
-        with (
-            patch("app.fhir_client.Patient") as mock_patient_class,
-            patch("app.fhir_client.FHIRDate") as mock_date_class,
-        ):
-            mock_patient_class.read.return_value = mock_patient
-            mock_date = MagicMock()
-            mock_date_class.return_value = mock_date
+        result = fhir_client.update_fhir_patient(
+            "123",
+            {"date_of_birth": "1990-01-01", "sex": "male"},
+            existing=existing,
+        )
+
+        assert result == {"id": "123"}
+        assert self._operations(mock_fhir) == [
+            {"op": "add", "path": "/birthDate", "value": "1990-01-01"},
+            {"op": "add", "path": "/gender", "value": "male"},
+        ]
+        headers = mock_fhir.server.session.patch.call_args.kwargs["headers"]
+        assert "If-Match" not in headers
+
+    @patch("app.fhir_client.get_fhir_client")
+    def test_update_fhir_patient_with_name(self, mock_get_client):
+        """Test updating patient with name."""
+        mock_fhir = _mock_fhir_server({"id": "123"})
+        mock_get_client.return_value = mock_fhir
 
-            demographics = {"date_of_birth": "1995-05-15"}
-            result = fhir_client.update_fhir_patient("123", demographics)
+        demographics = {"given_name": "Jane", "family_name": "Smith"}
+        result = fhir_client.update_fhir_patient("123", demographics)
 
         assert result is not None
-        mock_date_class.assert_called_once_with("1995-05-15")
+        assert self._operations(mock_fhir) == [
+            {
+                "op": "add",
+                "path": "/name",
+                "value": [
+                    {"use": "official", "given": ["Jane"], "family": "Smith"}
+                ],
+            }
+        ]
+
+    @patch("app.fhir_client.get_fhir_client")
+    def test_update_fhir_patient_with_birthdate(self, mock_get_client):
+        """Test updating patient with birth date."""
+        mock_fhir = _mock_fhir_server({"id": "123"})
+        mock_get_client.return_value = mock_fhir
+
+        demographics = {"date_of_birth": "1995-05-15"}
+        result = fhir_client.update_fhir_patient("123", demographics)
+
+        assert result is not None
+        assert self._operations(mock_fhir) == [
+            {"op": "add", "path": "/birthDate", "value": "1995-05-15"}
+        ]
 
     @patch("app.fhir_client.get_fhir_client")
     def test_update_fhir_patient_with_gender(self, mock_get_client):
         """Test updating patient with gender."""
-        mock_fhir = MagicMock()
+        mock_fhir = _mock_fhir_server({"id": "123", "gender": "female"})
         mock_get_client.return_value = mock_fhir
 
-        mock_patient = MagicMock()
-        mock_patient.as_json.return_value = {"id": "123", "gender": "female"}
+        result = fhir_client.update_fhir_patient("123", {"sex": "Female"})
 
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient_class.read.return_value = mock_patient
+        assert result is not None
+        assert self._operations(mock_fhir) == [
+            {"op": "add", "path": "/gender", "value": "female"}
+        ]
 
-            demographics = {"sex": "female"}
-            result = fhir_client.update_fhir_patient("123", demographics)
+    @patch("app.fhir_client.get_fhir_client")
+    def test_update_fhir_patient_with_unrecognised_gender(
+        self, mock_get_client
+    ):
+        """Test an unrecognised sex is stored as unknown."""
+        mock_fhir = _mock_fhir_server({"id": "123"})
+        mock_get_client.return_value = mock_fhir
 
-        assert result is not None
-        assert mock_patient.gender == "female"
+        fhir_client.update_fhir_patient("123", {"sex": "Indeterminate"})
+
+        assert self._operations(mock_fhir)[0]["value"] == "unknown"
 
     @patch("app.fhir_client.get_fhir_client")
     def test_update_fhir_patient_with_address(self, mock_get_client):
         """Test updating patient with address."""
-        mock_fhir = MagicMock()
+        mock_fhir = _mock_fhir_server({"id": "123"})
         mock_get_client.return_value = mock_fhir
 
-        mock_patient = MagicMock()
-        mock_patient.as_json.return_value = {"id": "123"}
-
-        with (
-            patch("app.fhir_client.Patient") as mock_patient_class,
-            patch("app.fhir_client.Address") as mock_addr_class,
-        ):
-            mock_patient_class.read.return_value = mock_patient
-            mock_addr = MagicMock()
-            mock_addr_class.return_value = mock_addr
-
-            demographics = {
-                "address": {
-                    "line": ["123 Main St"],
-                    "city": "London",
-                    "state": "England",
-                    "postalCode": "SW1A 1AA",
-                    "country": "UK",
-                }
+        demographics = {
+            "address": {
+                "line": ["123 Main St"],
+                "city": "London",
+                "state": "England",
+                "postalCode": "SW1A 1AA",
+                "country": "UK",
             }
-            result = fhir_client.update_fhir_patient("123", demographics)
+        }
+        result = fhir_client.update_fhir_patient("123", demographics)
 
         assert result is not None
-        assert mock_addr.line == ["123 Main St"]
-        assert mock_addr.city == "London"
-        assert mock_addr.state == "England"
-        assert mock_addr.postalCode == "SW1A 1AA"
-        assert mock_addr.country == "UK"
+        assert self._operations(mock_fhir) == [
+            {
+                "op": "add",
+                "path": "/address",
+                "value": [
+                    {
+                        "line": ["123 Main St"],
+                        "city": "London",
+                        "state": "England",
+                        "postalCode": "SW1A 1AA",
+                        "country": "UK",
+                    }
+                ],
+            }
+        ]
 
     @patch("app.fhir_client.get_fhir_client")
     def test_update_fhir_patient_with_contact(self, mock_get_client):
         """Test updating patient with contact information."""
-        mock_fhir = MagicMock()
+        mock_fhir = _mock_fhir_server({"id": "123"})
         mock_get_client.return_value = mock_fhir
 
-        mock_patient = MagicMock()
-        mock_patient.as_json.return_value = {"id": "123"}
-
-        with (
-            patch("app.fhir_client.Patient") as mock_patient_class,
-            patch("app.fhir_client.ContactPoint") as mock_contact_class,
-        ):
-            mock_patient_class.read.return_value = mock_patient
-            mock_phone = MagicMock()
-            mock_email = MagicMock()
-            mock_contact_class.side_effect = [mock_phone, mock_email]
-
-            demographics = {
-                "contact": {"phone": "555-1234", "email": "test@example.com"}
-            }
-            result = fhir_client.update_fhir_patient("123", demographics)
+        demographics = {
+            "contact": {"phone": "555-1234", "email": "test@example.com"}
+        }
+        result = fhir_client.update_fhir_patient("123", demographics)
 
         assert result is not None
-        assert mock_phone.system == "phone"
-        assert mock_phone.value == "555-1234"
-        assert mock_email.system == "email"
-        assert mock_email.value == "test@example.com"
+        assert self._operations(mock_fhir) == [
+            {
+                "op": "add",
+                "path": "/telecom",
+                "value": [
+                    {"system": "phone", "value": "555-1234"},
+                    {"system": "email", "value": "test@example.com"},
+                ],
+            }
+        ]
 
 
 class TestFhirClientErrorHandling:
     """Test FhirClientError propagation for non-404 failures."""
 
-    @patch("app.fhir_client.get_fhir_client")
-    def test_read_patient_server_error_raises(self, mock_get_client):
+    @patch("app.fhir_client.get_settings")
+    @patch("app.fhir_client._get_json")
+    def test_read_patient_server_error_raises(
+        self, mock_get_json, mock_get_settings
+    ):
         """Non-404 errors in read_fhir_patient raise FhirClientError."""
-        mock_fhir = MagicMock()
-        mock_get_client.return_value = mock_fhir
-
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient_class.read.side_effect = Exception(
-                "Connection refused"
-            )
+        mock_get_json.side_effect = requests.ConnectionError(
+            "Connection refused"
+        )
 
-            with pytest.raises(FhirClientError) as exc_info:
-                fhir_client.read_fhir_patient("123")
+        with pytest.raises(FhirClientError) as exc_info:
+            fhir_client.read_fhir_patient("123")
 
-            assert "Failed to retrieve patient record" in str(exc_info.value)
+        assert "Failed to retrieve patient record" in str(exc_info.value)
 
-    @patch("app.fhir_client.get_fhir_client")
-    def test_list_patients_server_error_raises(self, mock_get_client):
+    @patch("app.fhir_client._get_json")
+    def test_list_patients_server_error_raises(self, mock_get_json):
         """Server errors in list_fhir_patients raise FhirClientError."""
-        mock_fhir = MagicMock()
-        mock_fhir.server = MagicMock()
-        mock_get_client.return_value = mock_fhir
 
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_search = MagicMock()
-            mock_search.perform_resources.side_effect = Exception(
-                "Connection timeout"
-            )
-            mock_patient_class.where.return_value = mock_search
+        mock_get_json.side_effect = requests.Timeout("Connection timeout")
 
-            with pytest.raises(FhirClientError) as exc_info:
-                fhir_client.list_fhir_patients()
+        with pytest.raises(FhirClientError) as exc_info:
+            fhir_client.list_fhir_patients()
 
-            assert "Failed to retrieve patient list" in str(exc_info.value)
+        assert "Failed to retrieve patient list" in str(exc_info.value)
 
     @patch("app.fhir_client.get_fhir_client")
     def test_update_patient_server_error_raises(self, mock_get_client):
         """Non-404 errors in update_fhir_patient raise FhirClientError."""
-        mock_fhir = MagicMock()
+        mock_fhir = _mock_fhir_server()
+        mock_fhir.server.session.patch.side_effect = requests.HTTPError(
+            "Server error 500"
+        )
         mock_get_client.return_value = mock_fhir
 
-        mock_patient = MagicMock()
-
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient_class.read.return_value = mock_patient
-            mock_patient.update.side_effect = Exception("Server error 500")
-
-            with pytest.raises(FhirClientError) as exc_info:
-                fhir_client.update_fhir_patient("123", {"given_name": "X"})
+        with pytest.raises(FhirClientError) as exc_info:
+            fhir_client.update_fhir_patient("123", {"given_name": "X"})
 
-            assert "Failed to update patient record" in str(exc_info.value)
+        assert "Failed to update patient record" in str(exc_info.value)
 
     @patch("app.fhir_client.get_fhir_client")
     def test_update_patient_not_found_returns_none(self, mock_get_client):
         """404 errors in update_fhir_patient still return None."""
-        mock_fhir = MagicMock()
+        mock_fhir = _mock_fhir_server()
+        mock_fhir.server.raise_for_status.side_effect = FHIRNotFoundException(
+            MagicMock(status_code=404)
+        )
         mock_get_client.return_value = mock_fhir
 
-        with patch("app.fhir_client.Patient") as mock_patient_class:
-            mock_patient_class.read.side_effect = Exception(
-                "Resource not found (404)"
+        result = fhir_client.update_fhir_patient("999", {"given_name": "X"})
+
+        assert result is None
+
+    @patch("app.fhir_client.get_settings")
+    @patch("app.fhir_client._get_json")
+    def test_read_patient_unexpected_error_propagates(
+        self, mock_get_json, mock_get_settings
+    ):
+        """Programming errors are not masked as FHIR failures."""
+        mock_get_json.side_effect = KeyError("id")
+
+        with pytest.raises(KeyError):
+            fhir_client.read_fhir_patient("123")
+
+    @patch("app.fhir_client._get_json")
+    @patch("app.fhir_client.get_fhir_client")
+    def test_delete_patient_server_error_raises(
+        self, mock_get_client, mock_get_json
+    ):
+        """Server errors in delete_fhir_patient are no longer swallowed."""
+        mock_get_client.return_value = MagicMock()
+        mock_get_json.side_effect = requests.HTTPError("Server error 500")
+
+        with pytest.raises(FhirClientError) as exc_info:
+            fhir_client.delete_fhir_patient("123")
+
+        assert "Failed to delete patient record" in str(exc_info.value)
+
+
+class TestAsyncClient:
+    """Test the async FHIR read path."""
+
+    @staticmethod
+    def _client(handler) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url="http://test-fhir:8080/fhir",
+            transport=httpx.MockTransport(handler),
+        )
+
+    @patch("app.fhir_client.get_settings")
+    def test_aread_fhir_patient(self, mock_get_settings):
+        """Test a patient is read from Patient/{id}."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/fhir/Patient/123"
+            return httpx.Response(
+                200, json={"resourceType": "Patient", "id": "123"}
+            )
+
+        with patch(
+            "app.fhir_client._get_async_client",
+            return_value=self._client(handler),
+        ):
+            result = asyncio.run(fhir_client.aread_fhir_patient("123"))
+
+        assert result == {"resourceType": "Patient", "id": "123"}
+
+    @patch("app.fhir_client.get_settings")
+    def test_aread_fhir_patient_not_modified(self, mock_get_settings):
+        """Test a cached read sends its version and reuses a 304."""
+        resource = {"id": "123", "meta": {"versionId": "7"}}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["If-None-Match"] == 'W/"7"'
+            return httpx.Response(304)
+
+        fhir_client._remember_patient("123", resource)
+        with patch(
+            "app.fhir_client._get_async_client",
+            return_value=self._client(handler),
+        ):
+            result = asyncio.run(fhir_client.aread_fhir_patient("123"))
+
+        assert result is resource
+
+    @patch("app.fhir_client.get_settings")
+    def test_aread_fhir_patient_not_found(self, mock_get_settings):
+        """Test a 404 from the server returns None."""
+        client = self._client(lambda request: httpx.Response(404))
+
+        with patch("app.fhir_client._get_async_client", return_value=client):
+            result = asyncio.run(fhir_client.aread_fhir_patient("missing"))
+
+        assert result is None
+
+    @patch("app.fhir_client.get_settings")
+    def test_aread_fhir_patient_server_error(self, mock_get_settings):
+        """Test server errors are wrapped in FhirClientError."""
+        client = self._client(lambda request: httpx.Response(500))
+
+        with patch("app.fhir_client._get_async_client", return_value=client):
+            with pytest.raises(FhirClientError) as exc_info:
+                asyncio.run(fhir_client.aread_fhir_patient("123"))
+
+        assert "Failed to retrieve patient record" in str(exc_info.value)
+
+    @patch("app.fhir_client.get_settings")
+    def test_alist_fhir_patients_follows_next_links(self, mock_get_settings):
+        """Test every page of the search bundle is collected."""
+        next_url = "http://test-fhir:8080/fhir?_getpages=abc&_offset=1"
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/fhir/Patient":
+                return httpx.Response(
+                    200,
+                    json={
+                        "resourceType": "Bundle",
+                        "entry": [{"resource": {"id": "1"}}],
+                        "link": [{"relation": "next", "url": next_url}],
+                    },
+                )
+            assert str(request.url) == next_url
+            return httpx.Response(
+                200,
+                json={
+                    "resourceType": "Bundle",
+                    "entry": [{"resource": {"id": "2"}}],
+                },
+            )
+
+        with patch(
+            "app.fhir_client._get_async_client",
+            return_value=self._client(handler),
+        ):
+            result = asyncio.run(fhir_client.alist_fhir_patients())
+
+        assert [p["id"] for p in result] == ["1", "2"]
+
+    @patch("app.fhir_client.get_settings")
+    def test_alist_fhir_patients_connection_error(self, mock_get_settings):
+        """Test network failures are wrapped in FhirClientError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        with patch(
+            "app.fhir_client._get_async_client",
+            return_value=self._client(handler),
+        ):
+            with pytest.raises(FhirClientError) as exc_info:
+                asyncio.run(fhir_client.alist_fhir_patients())
+
+        assert "Failed to retrieve patient list" in str(exc_info.value)
+
+    @patch("app.fhir_client.get_settings")
+    def test_acreate_fhir_patient(self, mock_get_settings):
+        """Test a new patient is PUT to its client-assigned id."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(201)
+
+        with patch(
+            "app.fhir_client._get_async_client",
+            return_value=self._client(handler),
+        ):
+            result = asyncio.run(
+                fhir_client.acreate_fhir_patient(
+                    "Jane", "Smith", gender="Female", patient_id="p1"
+                )
+            )
+
+        assert seen[0].method == "PUT"
+        assert seen[0].url.path == "/fhir/Patient/p1"
+        assert orjson.loads(seen[0].content) == result
+        assert result["gender"] == "female"
+
+    @patch("app.fhir_client.get_settings")
+    def test_aupdate_fhir_patient(self, mock_get_settings):
+        """Test an update is sent as a single JSON Patch."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"id": "123", "gender": "male"})
+
+        with patch(
+            "app.fhir_client._get_async_client",
+            return_value=self._client(handler),
+        ):
+            result = asyncio.run(
+                fhir_client.aupdate_fhir_patient("123", {"sex": "male"})
+            )
+
+        assert result == {"id": "123", "gender": "male"}
+        assert seen[0].method == "PATCH"
+        assert orjson.loads(seen[0].content) == [
+            {"op": "add", "path": "/gender", "value": "male"}
+        ]
+
+    @patch("app.fhir_client.get_settings")
+    def test_aupdate_fhir_patient_revalidates_existing(
+        self, mock_get_settings
+    ):
+        """Test an unchanged cached resource is confirmed before return."""
+        existing = {"id": "123", "meta": {"versionId": "5"}, "gender": "male"}
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            assert request.headers["If-None-Match"] == 'W/"5"'
+            return httpx.Response(304)
+
+        with patch(
+            "app.fhir_client._get_async_client",
+            return_value=self._client(handler),
+        ):
+            result = asyncio.run(
+                fhir_client.aupdate_fhir_patient(
+                    "123", {"sex": "male"}, existing=existing
+                )
             )
-            result = fhir_client.update_fhir_patient(
-                "999", {"given_name": "X"}
+
+        assert result is existing
+        assert [request.method for request in seen] == ["GET"]
+
+    @patch("app.fhir_client.get_settings")
+    def test_aupdate_fhir_patient_not_found(self, mock_get_settings):
+        """Test a 404 from the server returns None."""
+        client = self._client(lambda request: httpx.Response(404))
+
+        with patch("app.fhir_client._get_async_client", return_value=client):
+            result = asyncio.run(
+                fhir_client.aupdate_fhir_patient("missing", {"sex": "male"})
             )
 
         assert result is None
+
+    def test_async_client_checks_flag(self):
+        """Test async reads are refused when services are disabled."""
+        with pytest.raises(fhir_client.FhirCommunicationError):
+            asyncio.run(fhir_client.aread_fhir_patient("123"))
+
+    @patch("app.fhir_client.get_settings")
+    def test_aclose_async_client(self, mock_get_settings):
+        """Test closing drops the cached client."""
+        mock_get_settings.return_value.FHIR_SERVER_URL = (
+            "http://test-fhir:8080/fhir"
+        )
+        client = fhir_client._get_async_client()
+
+        asyncio.run(fhir_client.aclose_async_client())
+
+        assert client.is_closed
+        assert fhir_client._get_async_client.cache_info().currsize == 0
+
+
+class TestCreateFhirCommunication:
+    """Test creating a FHIR Communication."""
+
+    @patch("app.fhir_client.get_fhir_client")
+    def test_create_fhir_communication(self, mock_get_client):
+        """Test the Communication is stored as plain FHIR JSON."""
+        mock_fhir = MagicMock()
+        mock_fhir.server.base_uri = "http://test-fhir:8080/fhir/"
+        mock_get_client.return_value = mock_fhir
+
+        resource = fhir_client.create_fhir_communication(
+            conversation_id="conv-1",
+            patient_id="p1",
+            sender_display="Dr Test",
+            sender_user_id=1,
+            body="Hello",
+        )
+
+        assert resource["subject"] == {"reference": "Patient/p1"}
+        assert datetime.fromisoformat(resource["sent"]).tzinfo is not None
+        sent = orjson.loads(mock_fhir.server.session.put.call_args[1]["data"])
+        assert sent == resource
@@ -1,13 +1,36 @@
 """Tests for main.py endpoints and dependencies."""
 
-from unittest.mock import patch
+from collections import Counter
+from unittest.mock import AsyncMock, patch
 
 from fastapi.testclient import TestClient
 
-from app.models import Organization, User, organisation_staff_member
+from app import fhir_client
+from app.fhir_client import PATIENT_SUMMARY_ELEMENTS
+from app.main import app
+from app.models import (
+    Organization,
+    PatientMetadata,
+    User,
+    organisation_staff_member,
+)
 from app.security import hash_password
 
 
+class TestRouteTable:
+    """Test the registered routes."""
+
+    def test_no_method_and_path_is_registered_twice(self):
+        """Test a later handler never shadows an earlier one."""
+        registered = Counter(
+            (method, route.path)
+            for route in app.routes
+            for method in getattr(route, "methods", None) or ()
+        )
+
+        assert [key for key, n in registered.items() if n > 1] == []
+
+
 class TestCurrentUserDependency:
     """Test current_user dependency injection."""
 
@@ -47,6 +70,16 @@ class TestRequireRolesDependency:
         assert response.status_code == 403
         assert "forbidden" in response.json()["detail"].lower()
 
+    def test_clinician_route_still_requires_csrf(
+        self, authenticated_clinician_client: TestClient
+    ):
+        """Test the combined Clinician + CSRF dependency checks the token."""
+        response = authenticated_clinician_client.put(
+            "/api/patients/123/demographics", json={"name": "Test"}
+        )
+        assert response.status_code == 403
+        assert response.json()["detail"] == "CSRF failed"
+
     def test_require_roles_success(
         self, authenticated_clinician_client: TestClient
     ):
@@ -90,6 +123,15 @@ class TestRequireCSRFDependency:
         )
         assert response.status_code == 403
 
+    def test_csrf_non_ascii_header(self, authenticated_client: TestClient):
+        """Test a non-ASCII header is rejected rather than erroring."""
+        response = authenticated_client.post(
+            "/api/auth/totp/disable",
+            json={"password": "TestPassword123!"},
+            headers={"X-CSRF-Token": "t\u00f6ken".encode("latin-1")},
+        )
+        assert response.status_code == 403
+
 
 class TestFhirClientErrorHandler:
     """Test global FhirClientError exception handler."""
@@ -100,9 +142,12 @@ class TestFhirClientErrorHandler:
         """FhirClientError returns 502 with clean message."""
         from app.fhir_client import FhirClientError
 
-        with patch(
-            "app.main.list_fhir_patients",
-            side_effect=FhirClientError("Failed to retrieve patient list"),
+        with (
+            patch("app.main.get_accessible_patient_ids", return_value={"1"}),
+            patch(
+                "app.main.read_fhir_patients",
+                side_effect=FhirClientError("Failed to retrieve patient list"),
+            ),
         ):
             response = authenticated_clinician_client.get("/api/patients")
 
@@ -149,7 +194,116 @@ class TestPatientEndpoints:
         assert response.status_code == 200
         assert "patients" in response.json()
 
-    @patch("app.main.read_fhir_patient")
+    @patch("app.main.list_fhir_patients")
+    @patch("app.main.read_fhir_patients")
+    @patch("app.main.get_accessible_patient_ids")
+    def test_list_patients_fetches_accessible_ids(
+        self,
+        mock_accessible,
+        mock_read_many,
+        mock_list,
+        authenticated_clinician_client: TestClient,
+    ):
+        """Test org-scoped listing reads only the accessible patients."""
+        mock_accessible.return_value = {"1", "2"}
+        mock_read_many.return_value = {
+            "1": {"resourceType": "Patient", "id": "1"},
+            "2": {"resourceType": "Patient", "id": "2"},
+        }
+
+        response = authenticated_clinician_client.get("/api/patients")
+
+        assert response.status_code == 200
+        ids = {p["id"] for p in response.json()["patients"]}
+        assert ids == {"1", "2"}
+        mock_read_many.assert_called_once_with({"1", "2"})
+        mock_list.assert_not_called()
+
+    @patch("app.main.read_fhir_patients")
+    @patch("app.main.get_accessible_patient_ids")
+    def test_list_patients_hides_deactivated(
+        self,
+        mock_accessible,
+        mock_read_many,
+        authenticated_clinician_client: TestClient,
+        db_session,
+    ):
+        """Test deactivated patients are left out of the clinical list."""
+        db_session.add_all(
+            [
+                PatientMetadata(patient_id="1", is_active=True),
+                PatientMetadata(patient_id="2", is_active=False),
+                PatientMetadata(patient_id="other", is_active=False),
+            ]
+        )
+        db_session.commit()
+        mock_accessible.return_value = {"1", "2", "3"}
+        mock_read_many.return_value = {
+            pid: {"resourceType": "Patient", "id": pid}
+            for pid in ("1", "2", "3")
+        }
+
+        response = authenticated_clinician_client.get("/api/patients")
+
+        patients = response.json()["patients"]
+        assert {p["id"] for p in patients} == {"1", "3"}
+        assert all(p["is_active"] for p in patients)
+
+    @patch("app.fhir_client.get_settings")
+    @patch("app.fhir_client._get_json")
+    @patch("app.main.get_accessible_patient_ids")
+    def test_list_patients_leaves_cached_resource_unchanged(
+        self,
+        mock_accessible,
+        mock_get_json,
+        mock_get_settings,
+        authenticated_clinician_client: TestClient,
+    ):
+        """Test the is_active flag is not written into the patient cache."""
+        mock_accessible.return_value = {"p1"}
+        mock_get_json.return_value = {
+            "resourceType": "Bundle",
+            "entry": [{"resource": {"resourceType": "Patient", "id": "p1"}}],
+        }
+
+        response = authenticated_clinician_client.get("/api/patients")
+
+        assert response.json()["patients"][0]["is_active"] is True
+        assert fhir_client._patient_cache["p1"] == {
+            "resourceType": "Patient",
+            "id": "p1",
+        }
+
+    @patch("app.main.list_fhir_patients")
+    def test_list_patients_admin_scope_requests_summary(
+        self, mock_list, authenticated_admin_client: TestClient
+    ):
+        """Test the admin list asks FHIR only for the displayed elements."""
+        mock_list.return_value = [{"resourceType": "Patient", "id": "1"}]
+
+        response = authenticated_admin_client.get("/api/patients?scope=admin")
+
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()["patients"]] == ["1"]
+        mock_list.assert_called_once_with(elements=PATIENT_SUMMARY_ELEMENTS)
+
+    @patch("app.main.list_fhir_patients")
+    @patch("app.main.read_fhir_patients")
+    def test_list_patients_without_access_skips_fhir(
+        self,
+        mock_read_many,
+        mock_list,
+        authenticated_clinician_client: TestClient,
+    ):
+        """Test a user with no accessible patients makes no FHIR call."""
+        response = authenticated_clinician_client.get("/api/patients")
+
+        assert response.status_code == 200
+        assert response.json()["patients"] == []
+        mock_read_many.assert_not_called()
+        mock_list.assert_not_called()
+
+    @patch("app.main.aread_fhir_patient", new_callable=AsyncMock)
     def test_get_patient_demographics(
         self, mock_read, authenticated_clinician_client: TestClient
     ):
@@ -162,7 +316,7 @@ class TestPatientEndpoints:
         assert response.status_code == 200
         assert "patient_id" in response.json()
 
-    @patch("app.main.update_fhir_patient")
+    @patch("app.main.aupdate_fhir_patient", new_callable=AsyncMock)
     def test_update_patient_demographics(
         self, mock_update, authenticated_clinician_client: TestClient
     ):
@@ -184,7 +338,25 @@ class TestPatientEndpoints:
 class TestLetterEndpoints:
     """Test letter-related endpoints with mocked EHRbase client."""
 
-    @patch("app.main.list_letters_for_patient")
+    @patch("app.main.acreate_letter_composition", new_callable=AsyncMock)
+    def test_write_letter(
+        self, mock_create, authenticated_clinician_client: TestClient
+    ):
+        """Test writing a letter returns the new composition uid."""
+        mock_create.return_value = {"uid": {"value": "uid123"}}
+
+        authenticated_clinician_client.get("/api/auth/me")
+        csrf_token = authenticated_clinician_client.cookies.get("XSRF-TOKEN")
+
+        response = authenticated_clinician_client.post(
+            "/api/patients/patient123/letters",
+            json={"title": "Letter", "body": "Content"},
+            headers={"X-CSRF-Token": csrf_token},
+        )
+        assert response.status_code == 200
+        assert response.json()["composition_uid"] == "uid123"
+
+    @patch("app.main.alist_letters_for_patient", new_callable=AsyncMock)
     def test_list_letters(
         self, mock_list, authenticated_clinician_client: TestClient
     ):
@@ -201,7 +373,7 @@ class TestLetterEndpoints:
         data = response.json()
         assert "letters" in data
 
-    @patch("app.main.list_letters_for_patient")
+    @patch("app.main.alist_letters_for_patient", new_callable=AsyncMock)
     def test_list_letters_error(
         self, mock_list, authenticated_clinician_client: TestClient
     ):
@@ -213,7 +385,7 @@ class TestLetterEndpoints:
         )
         assert response.status_code == 500
 
-    @patch("app.main.get_letter_composition")
+    @patch("app.main.aget_letter_composition", new_callable=AsyncMock)
     def test_get_letter(
         self, mock_get, authenticated_clinician_client: TestClient
     ):
@@ -231,7 +403,7 @@ class TestLetterEndpoints:
         data = response.json()
         assert data["composition_uid"] == "uid123"
 
-    @patch("app.main.get_letter_composition")
+    @patch("app.main.aget_letter_composition", new_callable=AsyncMock)
     def test_get_letter_not_found(
         self, mock_get, authenticated_clinician_client: TestClient
     ):
@@ -243,7 +415,7 @@ class TestLetterEndpoints:
         )
         assert response.status_code == 404
 
-    @patch("app.main.get_letter_composition")
+    @patch("app.main.aget_letter_composition", new_callable=AsyncMock)
     def test_get_letter_error(
         self, mock_get, authenticated_clinician_client: TestClient
     ):
@@ -256,6 +428,33 @@ class TestLetterEndpoints:
         assert response.status_code == 500
 
 
+class TestCompetencyEndpoints:
+    """Test CBAC competency endpoints."""
+
+    def test_update_my_competencies(
+        self, authenticated_admin_client: TestClient
+    ):
+        """Test an admin's competency changes are saved and returned."""
+        authenticated_admin_client.get("/api/auth/me")
+        csrf_token = authenticated_admin_client.cookies.get("XSRF-TOKEN")
+
+        response = authenticated_admin_client.patch(
+            "/api/cbac/my-competencies",
+            json={"additional_competencies": ["manage_teaching_content"]},
+            headers={"X-CSRF-Token": csrf_token},
+        )
+        assert response.status_code == 200
+        assert response.json()["additional_competencies"] == [
+            "manage_teaching_content"
+        ]
+
+        response = authenticated_admin_client.get("/api/cbac/my-competencies")
+        assert (
+            "manage_teaching_content"
+            in response.json()["additional_competencies"]
+        )
+
+
 class TestOrganizationEndpoints:
     """Test organization endpoints."""
 
@@ -1,6 +1,7 @@
 """Tests for database models."""
 
 import pytest
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -101,6 +102,56 @@ class TestUserModel:
         assert isinstance(user.roles, list)
         assert len(user.roles) == 0
 
+    def test_final_competencies_memoised_and_invalidated(self):
+        """Test final competencies are cached until a CBAC field changes."""
+        user = User(
+            username="cbacuser",
+            email="cbac@example.com",
+            password_hash="x",
+            base_profession="patient",
+            additional_competencies=["prescribe_controlled_schedule_2"],
+            removed_competencies=[],
+        )
+
+        first = user.get_final_competencies()
+        assert isinstance(first, frozenset)
+        assert "prescribe_controlled_schedule_2" in first
+        assert user.get_final_competencies() is first
+
+        user.removed_competencies = ["prescribe_controlled_schedule_2"]
+        assert "prescribe_controlled_schedule_2" not in (
+            user.get_final_competencies()
+        )
+
+    def test_final_competencies_follow_reload(self, db_session: Session):
+        """Test a refresh from the database is not masked by the memo."""
+        user = User(
+            username="reloaduser",
+            email="reload@example.com",
+            password_hash="x",
+            base_profession="patient",
+            additional_competencies=["prescribe_controlled_schedule_2"],
+            removed_competencies=[],
+        )
+        db_session.add(user)
+        db_session.commit()
+        assert "prescribe_controlled_schedule_2" in (
+            user.get_final_competencies()
+        )
+
+        db_session.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(additional_competencies=[])
+            .execution_options(synchronize_session=False)
+        )
+        db_session.commit()
+        db_session.refresh(user)
+
+        assert "prescribe_controlled_schedule_2" not in (
+            user.get_final_competencies()
+        )
+
 
 class TestRoleModel:
     """Test Role model."""
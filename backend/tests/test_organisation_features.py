@@ -5,8 +5,11 @@ from sqlalchemy import select
 from app.models import (
     OrganisationFeature,
     Organization,
+    Site,
     User,
+    organisation_site,
     organisation_staff_member,
+    site_staff_member,
 )
 from app.security import hash_password
 
@@ -429,6 +432,43 @@ class TestMeEnabledFeatures:
         assert "enabled_features" in data
         assert "teaching" in data["enabled_features"]
 
+    def test_me_includes_site_org_features(self, test_client, db_session):
+        """Features of orgs linked through the user's sites are included."""
+        org = _make_org(db_session)
+        site = Site(name="Ward 1", type="ward")
+        user = User(
+            username="siteuser",
+            email="site@example.com",
+            password_hash=hash_password("Pass12345!"),
+            is_active=True,
+            email_verified=True,
+        )
+        db_session.add_all([site, user])
+        db_session.flush()
+        db_session.execute(
+            organisation_site.insert().values(
+                organisation_id=org.id, site_id=site.id
+            )
+        )
+        db_session.execute(
+            site_staff_member.insert().values(
+                site_id=site.id, user_id=user.id, role="trainee"
+            )
+        )
+        db_session.add(
+            OrganisationFeature(organisation_id=org.id, feature_key="teaching")
+        )
+        db_session.commit()
+
+        test_client.post(
+            "/api/auth/login",
+            json={"username": "siteuser", "password": "Pass12345!"},
+        )
+
+        resp = test_client.get("/api/auth/me")
+        assert resp.status_code == 200
+        assert resp.json()["enabled_features"] == ["teaching"]
+
     def test_me_no_org_empty_features(self, test_client, db_session):
         """User with no primary org gets an empty feature list."""
         user = User(
@@ -1,6 +1,10 @@
 """Tests for security module (password hashing, JWT, CSRF, TOTP)."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
 
 import pyotp
 import pytest
@@ -55,6 +59,34 @@ class TestPasswordHashing:
         with pytest.raises(ValueError, match="Password cannot be empty"):
             hash_password("")
 
+    def test_concurrent_hashes_are_capped(self):
+        """Test no more Argon2 operations run at once than there are slots."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def fake_hash(p):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return "hashed"
+
+        hasher = MagicMock()
+        hasher.hash.side_effect = fake_hash
+        with (
+            patch("app.security._ph", hasher),
+            patch("app.security._hash_slots", threading.BoundedSemaphore(2)),
+            ThreadPoolExecutor(max_workers=6) as pool,
+        ):
+            results = list(pool.map(hash_password, ["pw"] * 6))
+
+        assert results == ["hashed"] * 6
+        assert peak == 2
+
 
 class TestJWTTokens:
     """Test JWT token creation and decoding."""
@@ -150,6 +182,17 @@ class TestJWTTokens:
         # Allow 5 second difference for test execution time
         assert abs((refresh_exp - expected_refresh_exp).total_seconds()) < 5
 
+    def test_tokens_signed_with_configured_secret(self):
+        """Test tokens verify against the raw JWT_SECRET value."""
+        token = create_access_token("testuser", [])
+
+        decoded = jwt.decode(
+            token,
+            settings.JWT_SECRET.get_secret_value(),
+            algorithms=[settings.JWT_ALG],
+        )
+        assert decoded["sub"] == "testuser"
+
 
 class TestCSRF:
     """Test CSRF token creation and verification."""
@@ -240,6 +283,16 @@ class TestTOTP:
 
         assert verify_totp_code(secret, current_code) is True
 
+    def test_verify_totp_code_replay_rejected(self):
+        """Test an accepted code is refused on reuse without an HMAC."""
+        secret = generate_totp_secret()
+        current_code = pyotp.TOTP(secret).now()
+
+        assert verify_totp_code(secret, current_code) is True
+        with patch("app.security.pyotp.TOTP") as totp_cls:
+            assert verify_totp_code(secret, current_code) is False
+        totp_cls.assert_not_called()
+
     def test_verify_totp_code_failure(self):
         """Test TOTP code verification with incorrect code."""
         secret = generate_totp_secret()
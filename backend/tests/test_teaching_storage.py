@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from unittest.mock import MagicMock, patch
 
@@ -376,6 +377,39 @@ class TestDiscoverLocalBanks:
         assert result == ["bank-a", "bank-b"]
 
 
+class TestSubdirsCache:
+    """The bank root listing is reused while the root is unchanged."""
+
+    def test_settled_listing_is_reused(self, tmp_path) -> None:
+        from app.features.teaching import storage
+
+        (tmp_path / "repo-a").mkdir()
+        stamp = tmp_path.stat().st_mtime_ns
+        with patch.object(storage, "_SUBDIRS_SETTLE_NS", -1):
+            assert storage._subdirs(tmp_path) == [tmp_path / "repo-a"]
+
+            # Same mtime: served from cache without listing the root
+            (tmp_path / "repo-b").mkdir()
+            os.utime(tmp_path, ns=(stamp, stamp))
+            assert storage._subdirs(tmp_path) == [tmp_path / "repo-a"]
+
+            # Changed mtime: listed again
+            os.utime(tmp_path, ns=(stamp + 1, stamp + 1))
+            assert storage._subdirs(tmp_path) == [
+                tmp_path / "repo-a",
+                tmp_path / "repo-b",
+            ]
+
+    def test_recent_listing_is_not_cached(self, tmp_path) -> None:
+        from app.features.teaching import storage
+
+        (tmp_path / "repo-a").mkdir()
+
+        storage._subdirs(tmp_path)
+
+        assert tmp_path not in storage._subdirs_cache
+
+
 class TestResolveLocalBank:
     """resolve_local_bank finds bank paths in flat and nested layouts."""
 